@@ -1,9 +1,11 @@
-from fastapi import APIRouter, HTTPException, Query, Depends, status
+from fastapi import APIRouter, HTTPException, Query, Depends, Request, Response, status
 from typing import List, Optional
 from beanie import PydanticObjectId
 from app.models.college import College
+from app.core.response_cache import response_cache
 from app.schemas.base import BaseResponseSchema
-from app.services.college_service import CollegeService
+from app.services.college_service import CollegeService, parse_sections
+from app.services.section_cache import section_cache
 
 router = APIRouter()
 
@@ -33,6 +35,14 @@ async def get_colleges(
         None,
         description="Filter by category (e.g., Engineering, Medical, Management)"
     ),
+    min_fees: Optional[int] = Query(None, ge=0, description="Minimum total fees in INR", alias="minFees"),
+    max_fees: Optional[int] = Query(None, ge=0, description="Maximum total fees in INR", alias="maxFees"),
+    min_placement: Optional[int] = Query(
+        None, ge=0, description="Minimum average package in INR", alias="minPlacement"
+    ),
+    max_placement: Optional[int] = Query(
+        None, ge=0, description="Maximum average package in INR", alias="maxPlacement"
+    ),
     sort_by: Optional[str] = Query(
         None,
         description="Sort by field",
@@ -50,20 +60,15 @@ async def get_colleges(
         le=100,
         description="Number of items per page (max 100)"
     ),
+    cursor: Optional[str] = Query(
+        None,
+        description="next_cursor from the previous page; when given, page is ignored"
+    ),
 ) -> BaseResponseSchema:
     """
     Get colleges with optional filters and pagination.
     """
     try:
-        print("query params:", {
-            "search": search,
-            "state": state,
-            "type": type,
-            "category": category,
-            "sort_by": sort_by,
-            "page": page,
-            "limit": limit
-        })
         # Build query filters
         query = {}
         
@@ -85,6 +90,20 @@ async def get_colleges(
         
         if category:
             query["category"] = category.strip()
+
+        for field, low, high in (("fees", min_fees, max_fees), ("placement", min_placement, max_placement)):
+            if low is not None and high is not None and low > high:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Invalid {field} range: minimum is greater than maximum"
+                )
+            bounds = {}
+            if low is not None:
+                bounds["$gte"] = low
+            if high is not None:
+                bounds["$lte"] = high
+            if bounds:
+                query[field] = bounds
         
         # Build sort criteria
         sort_criteria = None
@@ -104,7 +123,8 @@ async def get_colleges(
             query=query,
             sort_criteria=sort_criteria,
             page=page,
-            page_size=limit
+            page_size=limit,
+            cursor=cursor
         )
         
         return BaseResponseSchema(
@@ -115,6 +135,12 @@ async def get_colleges(
     
     except HTTPException:
         raise
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     
     except Exception as e:
         raise HTTPException(
@@ -124,51 +150,97 @@ async def get_colleges(
 
 
 @router.get("/{id}", response_model=BaseResponseSchema)
-async def get_college(id: int) -> BaseResponseSchema:
-    college_data = await CollegeService.get_college_data(id)
-    if not college_data:
+async def get_college(
+    id: int,
+    request: Request,
+    sections: Optional[str] = Query(
+        None,
+        description="Comma-separated sections to include (e.g. college_details,college_placements)"
+    ),
+    fields: Optional[str] = Query(
+        None,
+        description="Alias of sections"
+    ),
+) -> Response:
+    try:
+        requested_sections = parse_sections(sections or fields)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    version = await section_cache.get_version(id)
+    resource = f"college:{id}:detail:{','.join(requested_sections or [])}"
+    cached = response_cache.get(resource, version, request)
+    if cached is not None:
+        return cached
+
+    result = await CollegeService.get_college_data(id, requested_sections)
+    if result is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="College not found"
         )
-    return BaseResponseSchema(
+    version = version or await section_cache.confirm_version(id)
+    payload = BaseResponseSchema(
         success=True,
         message="College retrieved successfully",
-        data=college_data
+        data=result.data
     )
+    # Partial responses (timed out or failed sections) are not cached
+    response = response_cache.put(resource, version, payload, cache=not result.errors, request=request)
+    if result.errors:
+        response.headers["X-Failed-Sections"] = ",".join(result.errors)
+    return response
 
 
 # ----------------------------------
 # Get College Ratings
 # ----------------------------------
 @router.get("/{id}/ratings", response_model=BaseResponseSchema)
-def get_college_ratings(id: int) -> BaseResponseSchema:
+async def get_college_ratings(id: int, request: Request) -> Response:
+    version = await section_cache.get_version(id)
+    resource = f"college:{id}:ratings"
+    cached = response_cache.get(resource, version, request)
+    if cached is not None:
+        return cached
+
     ratings = CollegeService.get_college_ratings(id)
-    return BaseResponseSchema(
+    version = version or await section_cache.confirm_version(id)
+    return response_cache.put(resource, version, BaseResponseSchema(
         success=True,
         message="College ratings retrieved successfully",
         data=ratings
-    )
+    ), request=request)
 
 
 # ----------------------------------
 # Get College Reviews
 # ----------------------------------
 @router.get("/{id}/reviews", response_model=BaseResponseSchema)
-def get_college_reviews_endpoint(id: int) -> BaseResponseSchema:
+async def get_college_reviews_endpoint(id: int, request: Request) -> Response:
+    version = await section_cache.get_version(id)
+    resource = f"college:{id}:reviews"
+    cached = response_cache.get(resource, version, request)
+    if cached is not None:
+        return cached
+
     reviews = CollegeService.get_college_reviews(id)
-    return BaseResponseSchema(
+    version = version or await section_cache.confirm_version(id)
+    return response_cache.put(resource, version, BaseResponseSchema(
         success=True,
         message="College reviews retrieved successfully",
         data=reviews
-    )
+    ), request=request)
 
 # ----------------------------------
 # Get News (with filtering, sorting, and pagination)
 # ----------------------------------
 @router.get("/{id}/news", response_model=BaseResponseSchema)
-def get_news(
+async def get_news(
     id: int,
+    request: Request,
     search: Optional[str] = Query(
         None,
         description="Search news by title or content (case-insensitive)",
@@ -177,12 +249,24 @@ def get_news(
     ),
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=50),
-):
-    news = CollegeService.get_news(id, search, page, limit)
-    return BaseResponseSchema(
+    cursor: Optional[str] = Query(
+        None,
+        description="next_cursor from the previous page; when given, page is ignored"
+    ),
+) -> Response:
+    version = await section_cache.get_version(id)
+    resource = f"college:{id}:news:{search or ''}:{page}:{limit}:{cursor or ''}"
+    cached = response_cache.get(resource, version, request)
+    if cached is not None:
+        return cached
+
+    try:
+        news = CollegeService.get_news(id, search, page, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    version = version or await section_cache.confirm_version(id)
+    return response_cache.put(resource, version, BaseResponseSchema(
         success=True,
         message="College news retrieved successfully",
         data=news
-    )
-
-
+    ), request=request)
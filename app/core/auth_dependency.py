@@ -1,14 +1,28 @@
+import hashlib
 import json
+import time
 from typing import Optional
 from fastapi import HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from app.core.firebase_auth import GoogleAuthBackend, AuthFailedException
+from app.core.firebase_auth import (
+    GoogleAuthBackend,
+    AuthFailedException,
+    AuthUnavailableException,
+    TokenRejectedException,
+)
+from app.core.metrics import AUTH_CACHE_REQUESTS
 from app.db.redis import redis
 
 security = HTTPBearer()
 
 REDIS_USER_PREFIX = "user:"
-REDIS_USER_EXPIRY = 3600  # 1 hour cache
+REDIS_USER_EXPIRY = 3600  # 1 hour cache, never beyond the token's own exp
+REDIS_REJECTED_PREFIX = "user:rejected:"
+REDIS_REJECTED_EXPIRY = 60  # remember rejected tokens for 1 minute
+
+def token_fingerprint(token: str) -> str:
+    """Fixed-size cache key component for a raw JWT"""
+    return hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
 
 async def validate_token(token: str) -> dict:
     """
@@ -21,35 +35,59 @@ async def validate_token(token: str) -> dict:
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Try to get user data from Redis first
-    cache_key = f"{REDIS_USER_PREFIX}{token}"
-    cached_user = await redis.get(cache_key)
-    
+    # Try to get user data (or a recent rejection) from Redis first
+    fingerprint = token_fingerprint(token)
+    cache_key = f"{REDIS_USER_PREFIX}{fingerprint}"
+    rejected_key = f"{REDIS_REJECTED_PREFIX}{fingerprint}"
+    cached_user, rejected = await redis.mget(cache_key, rejected_key)
+
+    if rejected:
+        AUTH_CACHE_REQUESTS.labels("rejected").inc()
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token verification failed",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
     if cached_user:
+        AUTH_CACHE_REQUESTS.labels("hit").inc()
         return json.loads(cached_user)
+    AUTH_CACHE_REQUESTS.labels("miss").inc()
     
     # If not in cache, validate with Firebase
     try:
         auth_backend = GoogleAuthBackend.get_instance()
-        user_data = auth_backend.verify_token(token)
+        user_data = await auth_backend.verify_token_async(token)
         
-        # Cache the user data in Redis
-        await redis.set(
-            cache_key,
-            json.dumps(user_data),
-            ex=REDIS_USER_EXPIRY
-        )
+        # Cache the user data in Redis until the token expires
+        expiry = min(REDIS_USER_EXPIRY, int(user_data['exp'] - time.time()))
+        if expiry > 0:
+            await redis.set(
+                cache_key,
+                json.dumps(user_data),
+                ex=expiry
+            )
         
         return user_data
         
     except AuthFailedException as e:
+        if isinstance(e, TokenRejectedException):
+            # Negative cache so floods of bad tokens do not each reach verification.
+            # Only definite rejections: an unknown kid may be a freshly rotated key.
+            await redis.set(rejected_key, "1", ex=REDIS_REJECTED_EXPIRY)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=str(e),
             headers={"WWW-Authenticate": "Bearer"},
         )
+    except AuthUnavailableException as e:
+        # Transient; not cached so the token is verified again on the next request
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e)
-        )
\ No newline at end of file
+        )
@@ -9,12 +9,60 @@ class Settings(BaseModel):
     MONGODB_URL: str = os.getenv("MONGODB_URL", "mongodb://localhost:27017/")
     DATABASE_NAME: str = os.getenv("DATABASE_NAME", "college-predictor")
     REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    USE_MONGO_COLLEGES: bool = os.getenv("USE_MONGO_COLLEGES", "False") == "True"
+    MONGO_MAX_POOL_SIZE: int = int(os.getenv("MONGO_MAX_POOL_SIZE", 100))
+    MONGO_MIN_POOL_SIZE: int = int(os.getenv("MONGO_MIN_POOL_SIZE", 10))  # opened at startup
+    COLLEGE_COUNT_CACHE_TTL: float = float(os.getenv("COLLEGE_COUNT_CACHE_TTL", 60))  # seconds a listing total is reused
+    INDEX_SYNC_MODE: str = os.getenv("INDEX_SYNC_MODE", "background")  # startup | background | off
+    MONGO_SERVER_SELECTION_TIMEOUT_MS: int = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", 5000))
+    REDIS_MAX_CONNECTIONS: int = int(os.getenv("REDIS_MAX_CONNECTIONS", 100))
+    REDIS_MIN_CONNECTIONS: int = int(os.getenv("REDIS_MIN_CONNECTIONS", 10))  # opened at startup
+    REDIS_CONNECT_TIMEOUT: float = float(os.getenv("REDIS_CONNECT_TIMEOUT", 2.0))  # seconds
+    REDIS_SOCKET_TIMEOUT: float = float(os.getenv("REDIS_SOCKET_TIMEOUT", 2.0))  # seconds
         
     # Application
     DEBUG: bool = os.getenv("DEBUG", "True") == "True"
     HOST: str = os.getenv("HOST", "0.0.0.0")
     PORT: int = int(os.getenv("PORT", 8000))
+    DIAGNOSTICS_ENABLED: bool = os.getenv("DIAGNOSTICS_ENABLED", "False") == "True"  # /cache/stats, /db/query-stats
+
+    # College detail aggregation
+    SECTION_TIMEOUT: float = float(os.getenv("SECTION_TIMEOUT", 2.0))  # seconds per section
+    SECTION_CACHE_ENABLED: bool = os.getenv("SECTION_CACHE_ENABLED", "True") == "True"
+    SECTION_CACHE_TTL: int = int(os.getenv("SECTION_CACHE_TTL", 600))  # fresh for 10 minutes
+    SECTION_CACHE_STALE_TTL: int = int(os.getenv("SECTION_CACHE_STALE_TTL", 3600))  # then served stale for 1 hour
+    LOCAL_CACHE_ENABLED: bool = os.getenv("LOCAL_CACHE_ENABLED", "True") == "True"
+    LOCAL_CACHE_MAX_BYTES: int = int(os.getenv("LOCAL_CACHE_MAX_BYTES", 32 * 1024 * 1024))  # 32MB per worker
+    LOCAL_CACHE_TTL: float = float(os.getenv("LOCAL_CACHE_TTL", 30))  # seconds
+    RESPONSE_CACHE_MAX_BYTES: int = int(os.getenv("RESPONSE_CACHE_MAX_BYTES", 64 * 1024 * 1024))  # 64MB per worker
+    RESPONSE_CACHE_TTL: float = float(os.getenv("RESPONSE_CACHE_TTL", 300))  # seconds
     
+    # Logging pipeline
+    LOG_QUEUE_SIZE: int = int(os.getenv("LOG_QUEUE_SIZE", 10000))  # records buffered before overflow
+    LOG_OVERFLOW_POLICY: str = os.getenv("LOG_OVERFLOW_POLICY", "drop")  # drop | sample
+    LOG_SAMPLE_EVERY: int = int(os.getenv("LOG_SAMPLE_EVERY", 10))  # keep 1 in N INFO records when sampling
+    LOG_BATCH_SIZE: int = int(os.getenv("LOG_BATCH_SIZE", 256))  # records written per flush
+    LOG_DIR: str = os.getenv("LOG_DIR", "logs")
+    LOG_MAX_BYTES: int = int(os.getenv("LOG_MAX_BYTES", 100 * 1024 * 1024))  # size rollover per file
+    LOG_RETENTION_DAYS: int = int(os.getenv("LOG_RETENTION_DAYS", 14))
+    LOG_MAX_TOTAL_BYTES: int = int(os.getenv("LOG_MAX_TOTAL_BYTES", 0))  # cap on the whole log dir, 0 = none
+    LOG_COMPRESSION: str = os.getenv("LOG_COMPRESSION", "gzip")  # gzip | zstd | none
+    LOG_SLOW_REQUEST_MS: float = float(os.getenv("LOG_SLOW_REQUEST_MS", 1000))  # always logged above this
+    LOG_SUCCESS_SAMPLE_RATE: float = float(os.getenv("LOG_SUCCESS_SAMPLE_RATE", 0.01))  # share of fast non-error requests logged
+    LOG_ROUTE_SAMPLE_RATES: str = os.getenv("LOG_ROUTE_SAMPLE_RATES", "")  # e.g. "/health=0,/api/v1/colleges/{id}=0.1"
+    LOG_HEADER_ALLOWLIST: str = os.getenv(
+        "LOG_HEADER_ALLOWLIST", "user-agent,referer,content-type,content-length,x-hash-key"
+    )  # "*" logs every header
+    SERVER_TIMING_ENABLED: bool = os.getenv("SERVER_TIMING_ENABLED", "False") == "True"  # per-request span breakdown header; exposes internals, keep off in production
+
+    # Metrics (set PROMETHEUS_MULTIPROC_DIR when running several workers)
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "True") == "True"
+    LOOP_LAG_INTERVAL: float = float(os.getenv("LOOP_LAG_INTERVAL", 0.5))  # seconds between event loop lag probes
+    LOOP_WATCHDOG_ENABLED: bool = os.getenv("LOOP_WATCHDOG_ENABLED", "False") == "True"  # dev/canary workers only
+    MONGO_QUERY_STATS_ENABLED: bool = os.getenv("MONGO_QUERY_STATS_ENABLED", "True") == "True"  # per-shape command stats
+    DB_SLOW_QUERY_MS: float = float(os.getenv("DB_SLOW_QUERY_MS", 100))  # DB calls above this are logged as WARNING
+    LOOP_WATCHDOG_THRESHOLD_MS: float = float(os.getenv("LOOP_WATCHDOG_THRESHOLD_MS", 100))  # log stacks of longer blocks
+
     # File Upload
     MAX_FILE_SIZE: int = int(os.getenv("MAX_FILE_SIZE", 10 * 1024 * 1024))  # 10MB
     UPLOAD_DIR: str = os.getenv("UPLOAD_DIR", "uploads/")
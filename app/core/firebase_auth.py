@@ -1,8 +1,19 @@
+import asyncio
+import json
+import re
+import time
+import urllib.request
 from enum import IntEnum
+from typing import Callable, Dict, Optional, Tuple
+
 import firebase_admin
-from firebase_admin import credentials, auth
+import jwt
+from cryptography.x509 import load_pem_x509_certificate
+from firebase_admin import credentials
 from app.core.config import settings
 
+GOOGLE_CERTS_URL = "https://www.googleapis.com/robot/v1/metadata/x509/securetoken@system.gserviceaccount.com"
+
 class AuthType(IntEnum):
     GOOGLE = 0
 
@@ -12,12 +23,97 @@ class AuthInitException(Exception):
 class AuthFailedException(Exception):
     pass
 
+class TokenRejectedException(AuthFailedException):
+    """The token itself is invalid (signature, expiry, audience, issuer, claims)"""
+    pass
+
+class AuthUnavailableException(Exception):
+    """Verification could not run, e.g. the signing keys could not be fetched"""
+    pass
+
+
+def fetch_google_certs(timeout: float = 5.0) -> Tuple[Dict[str, str], int]:
+    """Download Firebase signing certificates, returning ({kid: pem}, max_age seconds)"""
+    with urllib.request.urlopen(GOOGLE_CERTS_URL, timeout=timeout) as response:
+        certs = json.loads(response.read())
+        match = re.search(r"max-age=(\d+)", response.headers.get("Cache-Control", ""))
+    return certs, int(match.group(1)) if match else 3600
+
+
+class PublicKeyCache:
+    """
+    Firebase token signing keys cached locally by kid.
+
+    Keys are refreshed in the background shortly before the max-age Google
+    sends with them expires, so token verification does not do network I/O.
+    The fetch callable can be replaced with a local key set in tests.
+    """
+
+    REFRESH_MARGIN = 60  # seconds before expiry to refresh
+    MIN_REFETCH_INTERVAL = 30  # seconds between refetches triggered by an unknown kid
+
+    def __init__(self, fetch: Callable[[], Tuple[Dict[str, str], int]] = fetch_google_certs):
+        self.fetch = fetch
+        self.keys: Dict[str, object] = {}
+        self.expires_at = 0.0
+        self._last_fetch = 0.0
+        self._lock = asyncio.Lock()
+        self._refresher: Optional[asyncio.Task] = None
+
+    async def refresh(self):
+        requested_at = time.monotonic()
+        async with self._lock:
+            if self._last_fetch > requested_at:
+                # Another caller refreshed while we waited for the lock
+                return
+            certs, max_age = await asyncio.to_thread(self.fetch)
+            self.keys = {
+                kid: load_pem_x509_certificate(pem.encode()).public_key()
+                for kid, pem in certs.items()
+            }
+            self._last_fetch = time.monotonic()
+            self.expires_at = self._last_fetch + max_age
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(max(self.expires_at - time.monotonic() - self.REFRESH_MARGIN, 1))
+            try:
+                await self.refresh()
+            except Exception:
+                # Keep serving the current keys; retry on the next tick
+                await asyncio.sleep(self.MIN_REFETCH_INTERVAL)
+
+    def start(self):
+        if self._refresher is None or self._refresher.done():
+            self._refresher = asyncio.ensure_future(self._refresh_loop())
+
+    async def stop(self):
+        if self._refresher is not None:
+            self._refresher.cancel()
+            try:
+                await self._refresher
+            except asyncio.CancelledError:
+                pass
+            self._refresher = None
+
+    async def get_key(self, kid: str):
+        if not self.keys or time.monotonic() >= self.expires_at:
+            await self.refresh()
+        elif kid not in self.keys and time.monotonic() - self._last_fetch > self.MIN_REFETCH_INTERVAL:
+            # Keys may have rotated ahead of schedule
+            await self.refresh()
+        self.start()
+        return self.keys.get(kid)
+
+
 class GoogleAuthBackend:
     _instance = None
 
-    def __init__(self, config):
+    def __init__(self, config, key_cache: Optional[PublicKeyCache] = None):
         self.type = AuthType.GOOGLE
         self.cred = credentials.Certificate(config['SA_KEY_FILE'])
+        self.project_id = config.get('PROJECT_ID') or self.cred.project_id
+        self.key_cache = key_cache or PublicKeyCache()
         try:
             firebase_admin.initialize_app(credential=self.cred)
         except ValueError:
@@ -29,20 +125,50 @@ class GoogleAuthBackend:
     @classmethod
     def get_instance(cls):
         if cls._instance is None:
-            cls._instance = GoogleAuthBackend({"SA_KEY_FILE": settings.FIREBASE_SA_FILE})
+            cls._instance = GoogleAuthBackend({"SA_KEY_FILE": settings.SA_KEY_FILE})
         return cls._instance
 
-    def verify_token(self, token):
+    def _decode(self, token, key) -> dict:
+        decoded = jwt.decode(
+            token,
+            key,
+            algorithms=["RS256"],
+            audience=self.project_id,
+            issuer=f"https://securetoken.google.com/{self.project_id}",
+            options={"require": ["exp", "iat", "sub"]},
+        )
+        if not decoded.get('sub'):
+            raise TokenRejectedException("Token has no subject")
+        if decoded.get('auth_time', 0) > time.time():
+            raise TokenRejectedException("Token auth_time is in the future")
+        if not decoded.get('email_verified'):
+            raise TokenRejectedException("Email not verified")
+        return decoded
+
+    async def verify_token_async(self, token):
+        """
+        Verify a Firebase ID token against the locally cached signing keys.
+        Signature checking runs in a worker thread to keep the event loop free.
+        """
         try:
-            decoded = auth.verify_id_token(token)
-            if not decoded.get('email_verified'):
-                raise AuthFailedException("Email not verified")
+            kid = jwt.get_unverified_header(token).get('kid')
+        except jwt.PyJWTError as e:
+            raise TokenRejectedException("Token verification failed") from e
+        try:
+            key = await self.key_cache.get_key(kid)
         except Exception as e:
-            # more specific catches are possible: auth.InvalidIdTokenError, auth.ExpiredIdTokenError, etc.
-            raise AuthFailedException("Token verification failed") from e
+            raise AuthUnavailableException("Signing keys unavailable") from e
+        if key is None:
+            # May be a key rotated in after our last fetch, so not a definite rejection
+            raise AuthFailedException("Unknown signing key")
+        try:
+            decoded = await asyncio.to_thread(self._decode, token, key)
+        except (jwt.PyJWTError, TokenRejectedException) as e:
+            raise TokenRejectedException("Token verification failed") from e
 
         return {
             'name': decoded.get('name', 'Anonymous'),
             'email': decoded.get('email'),
-            'uid': decoded.get('uid'),
+            'uid': decoded['sub'],
+            'exp': decoded['exp'],
         }
@@ -0,0 +1,150 @@
+import asyncio
+import os
+import time
+from typing import Optional
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from utility.utils import route_template
+
+# With several workers, prometheus_client writes samples to per-process
+# files under PROMETHEUS_MULTIPROC_DIR and /metrics merges them on read.
+MULTIPROCESS = bool(os.getenv("PROMETHEUS_MULTIPROC_DIR"))
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests by route template and status",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency until the response starts",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+DB_OPERATION_DURATION = Histogram(
+    "db_operation_duration_seconds",
+    "Database operation latency",
+    ["collection", "operation"],
+    buckets=LATENCY_BUCKETS,
+)
+DB_SLOW_QUERIES = Counter(
+    "db_slow_queries_total",
+    "Database operations slower than DB_SLOW_QUERY_MS",
+    ["collection", "operation"],
+)
+AUTH_CACHE_REQUESTS = Counter(
+    "auth_cache_requests_total",
+    "Token cache lookups in validate_token by result (hit, miss, rejected)",
+    ["result"],
+)
+EVENT_LOOP_LAG = Gauge(
+    "event_loop_lag_seconds",
+    "How late the last event loop lag probe woke up",
+    multiprocess_mode="max",
+)
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+def render_metrics() -> bytes:
+    """Exposition of every metric, merged across workers in multiprocess mode"""
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest(REGISTRY)
+
+
+def mark_worker_stopped():
+    """Drop this process's live gauge samples from the multiprocess files"""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())
+
+
+def observe_db_operation(collection: str, operation: str, duration_ms: float):
+    DB_OPERATION_DURATION.labels(collection, operation).observe(duration_ms / 1000)
+
+
+def observe_slow_query(collection: str, operation: str):
+    DB_SLOW_QUERIES.labels(collection, operation).inc()
+
+
+class EventLoopLagMonitor:
+    """Sleeps ``interval`` seconds in a loop and records how late it wakes up"""
+
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self):
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            EVENT_LOOP_LAG.set(max(time.perf_counter() - start - self.interval, 0.0))
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+loop_lag_monitor = EventLoopLagMonitor(settings.LOOP_LAG_INTERVAL)
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware counting requests and their latency.
+
+    Requests are labelled with the matched route template (e.g.
+    /api/v1/colleges/{id}) rather than the URL so label cardinality stays
+    bounded; requests that match no route share one label.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        loop_lag_monitor.start()
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                route = route_template(scope, UNMATCHED_ROUTE)
+                HTTP_REQUEST_DURATION.labels(scope["method"], route).observe(time.perf_counter() - start)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = route_template(scope, UNMATCHED_ROUTE)
+            HTTP_REQUESTS.labels(scope["method"], route, str(status_code)).inc()
+
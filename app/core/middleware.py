@@ -1,29 +1,36 @@
 from typing import List
-from fastapi import Request, HTTPException
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from fastapi import HTTPException
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
 from app.core.auth_dependency import validate_token
 
-class FirebaseAuthMiddleware(BaseHTTPMiddleware):
+class FirebaseAuthMiddleware:
+    """Pure ASGI middleware validating the Firebase bearer token"""
+
     def __init__(
         self, 
         app: ASGIApp, 
         public_paths: List[str] = None
     ):
-        super().__init__(app)
+        self.app = app
         self.public_paths = public_paths or [
             "/health",
             "/docs",
             "/redoc",
         ]
 
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Skip authentication for public paths
-        if any(request.url.path.startswith(path) for path in self.public_paths):
-            return await call_next(request)
+        if any(scope["path"].startswith(path) for path in self.public_paths):
+            await self.app(scope, receive, send)
+            return
 
         # Get token from header
-        auth_header = request.headers.get('Authorization')
+        auth_header = Headers(scope=scope).get('Authorization')
         if not auth_header or not auth_header.startswith('Bearer '):
             raise HTTPException(
                 status_code=401,
@@ -36,11 +43,8 @@ class FirebaseAuthMiddleware(BaseHTTPMiddleware):
         # Validate token and get user data
         user = await validate_token(token)
         
-        # Initialize state with user data
-        if not hasattr(request.state, '_state'):
-            request.state._state = {}
-        request.state._state['user'] = user
+        # Initialize state with user data (exposed as request.state.user)
+        scope.setdefault("state", {})["user"] = user
 
         # Continue processing the request
-        response = await call_next(request)
-        return response
\ No newline at end of file
+        await self.app(scope, receive, send)
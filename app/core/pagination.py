@@ -0,0 +1,40 @@
+import base64
+from typing import Any, Tuple, Type, Union
+
+import orjson
+
+
+def encode_cursor(sort: str, value: Any, last_id: Any) -> str:
+    """
+    Opaque keyset cursor: the sort key value and id of the last item on a
+    page, plus the sort it belongs to. The next page starts strictly after
+    that (value, id) pair instead of skipping over every earlier row.
+    """
+    payload = orjson.dumps({"s": sort, "v": value, "id": str(last_id)})
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+
+# Sort values of the numeric listing sorts; None for missing values and the default order
+NUMERIC_VALUE = (int, float, type(None))
+
+
+def decode_cursor(
+    token: str,
+    sort: str,
+    value_types: Union[Type, Tuple[Type, ...]] = NUMERIC_VALUE,
+) -> Tuple[Any, str]:
+    """
+    Return (sort value, last id); raises ValueError for malformed or
+    mismatched cursors, including values that are not of ``value_types``
+    """
+    try:
+        payload = orjson.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        cursor_sort, value, last_id = payload["s"], payload["v"], payload["id"]
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError("Invalid cursor") from e
+    if cursor_sort != sort:
+        raise ValueError("Cursor does not match the requested sort order")
+    # Cursors come from clients; a value of the wrong type would fail comparisons later
+    if isinstance(value, bool) or not isinstance(value, value_types) or not isinstance(last_id, str):
+        raise ValueError("Invalid cursor")
+    return value, last_id
@@ -0,0 +1,110 @@
+import hashlib
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Optional
+
+import orjson
+from fastapi import Request, Response
+
+from app.core.config import settings
+from app.schemas.base import BaseResponseSchema
+from app.services.local_cache import LocalCache
+
+
+class ResponseCache:
+    """
+    Cache of fully encoded JSON response bodies, keyed by resource and version.
+
+    Hits are returned as a raw Response, so FastAPI skips response_model
+    validation and JSON encoding entirely. The ETag is derived from the
+    resource name and version, so it is stable across workers. Versions are
+    millisecond timestamps of the last change, which also give Last-Modified.
+    """
+
+    def __init__(self, local: LocalCache):
+        self.local = local
+
+    @staticmethod
+    def etag(resource: str, version: str) -> str:
+        digest = hashlib.blake2b(f"{resource}|{version}".encode(), digest_size=12).hexdigest()
+        return f'"{digest}"'
+
+    @staticmethod
+    def last_modified(version: str) -> str:
+        return formatdate(int(version) / 1000, usegmt=True)
+
+    def _headers(self, resource: str, version: str) -> dict:
+        return {
+            "ETag": self.etag(resource, version),
+            "Last-Modified": self.last_modified(version),
+        }
+
+    def is_not_modified(self, request: Request, resource: str, version: str, exists: bool = True) -> bool:
+        """
+        Evaluate If-None-Match / If-Modified-Since against the current version.
+        "*" matches only when ``exists`` confirms a current representation.
+        """
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            # Weak comparison, as RFC 9110 requires for If-None-Match
+            etag = self.etag(resource, version)
+            candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+            return (exists and "*" in candidates) or etag in candidates
+
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            # HTTP dates have one-second resolution
+            return int(version) // 1000 <= since
+        return False
+
+    def get(self, resource: str, version: Optional[str], request: Optional[Request] = None) -> Optional[Response]:
+        """
+        Return a 304 when the client's copy is current, otherwise the cached
+        response for this resource version, if any. A None version (resource
+        not confirmed yet) is never a hit.
+        """
+        if version is None:
+            return None
+        headers = self._headers(resource, version)
+        body = self.local.get((resource, version))
+        # Until the resource is resolved only a cached body proves it exists
+        if request is not None and self.is_not_modified(request, resource, version, exists=body is not None):
+            return Response(status_code=304, headers=headers)
+        if body is None:
+            return None
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    def put(
+        self,
+        resource: str,
+        version: str,
+        payload: BaseResponseSchema,
+        cache: bool = True,
+        request: Optional[Request] = None,
+    ) -> Response:
+        """
+        Encode the payload once, optionally cache the bytes and return the
+        response, or a 304 when ``request``'s conditionals match the now
+        resolved resource. Uncacheable (e.g. partial) responses carry no
+        validators and are marked no-store, so clients never revalidate them
+        into a 304.
+        """
+        body = orjson.dumps(payload.model_dump())
+        if not cache:
+            return Response(content=body, media_type="application/json", headers={"Cache-Control": "no-store"})
+        self.local.set((resource, version), body, len(body))
+        headers = self._headers(resource, version)
+        if request is not None and self.is_not_modified(request, resource, version):
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+
+response_cache = ResponseCache(
+    LocalCache(
+        max_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+        ttl=settings.RESPONSE_CACHE_TTL,
+    )
+)
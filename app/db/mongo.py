@@ -1,45 +1,94 @@
-from motor.motor_asyncio import AsyncIOMotorClient
+import asyncio
+
+from pymongo import AsyncMongoClient
 from beanie import init_beanie
+from beanie.odm.fields import IndexModelField
 from typing import Optional
 from app.core.config import settings
-from app.models.college import College
+from app.db.query_stats import query_stats
+from app.models.college import College, CollegeCard
 from app.models.faculty import Faculty
 from app.models.academics import AcademicStream, AcademicCourse
 from app.models.scholarship import Scholarship
 from app.models.junction import CollegeJunction
 
 
+DOCUMENT_MODELS = [
+    College,
+    CollegeCard,
+    Faculty,
+    AcademicStream,
+    AcademicCourse,
+    Scholarship,
+    CollegeJunction,
+]
+
+INDEX_SYNC_STARTUP = "startup"
+INDEX_SYNC_BACKGROUND = "background"
+
+
 class MongoDB:
-    client: Optional[AsyncIOMotorClient] = None
+    client: Optional[AsyncMongoClient] = None
     db = None
+    index_sync_task: Optional[asyncio.Task] = None
 
 mongodb = MongoDB()
 
+async def sync_indexes(document_models=DOCUMENT_MODELS):
+    """Create the indexes declared on each document; existing ones are left as they are"""
+    for model in document_models:
+        indexes = model.get_settings().indexes
+        if not indexes:
+            continue
+        try:
+            await model.get_pymongo_collection().create_indexes(IndexModelField.list_to_index_model(indexes))
+            print(f"🗂️  Indexes in sync for {model.get_settings().name}")
+        except Exception as e:
+            print(f"❌ Index sync failed for {model.get_settings().name}: {e}")
+
 async def connect_to_mongo():
     """Initialize MongoDB connection and Beanie"""
     try:
         print(f"📡 Connecting to MongoDB at: {settings.MONGODB_URL}")
-        mongodb.client = AsyncIOMotorClient(settings.MONGODB_URL)
+        event_listeners = [query_stats] if settings.MONGO_QUERY_STATS_ENABLED else []
+        # pymongo's async client: Beanie 2 does not accept Motor
+        mongodb.client = AsyncMongoClient(
+            settings.MONGODB_URL,
+            maxPoolSize=settings.MONGO_MAX_POOL_SIZE,
+            minPoolSize=settings.MONGO_MIN_POOL_SIZE,
+            serverSelectionTimeoutMS=settings.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+            event_listeners=event_listeners,
+        )
         mongodb.db = mongodb.client[settings.DATABASE_NAME]
         
-        # Test the connection
-        await mongodb.client.admin.command('ping')
+        # Test the connection, with concurrent pings so the first requests find open connections
+        await asyncio.gather(*(
+            mongodb.client.admin.command('ping') for _ in range(max(settings.MONGO_MIN_POOL_SIZE, 1))
+        ))
         print(f"🗄️  Connected to database: {settings.DATABASE_NAME}")
         
         # Initialize Beanie with all document models
         print("🔧 Initializing Beanie ODM...")
         await init_beanie(
             database=mongodb.db,
-            document_models=[
-                College,
-            ]
+            document_models=DOCUMENT_MODELS,
+            # Building indexes can take minutes on a large collection; only block boot when asked to
+            skip_indexes=settings.INDEX_SYNC_MODE != INDEX_SYNC_STARTUP,
         )
         print("✅ Beanie ODM initialized successfully!")
+        if settings.INDEX_SYNC_MODE == INDEX_SYNC_BACKGROUND:
+            mongodb.index_sync_task = asyncio.create_task(sync_indexes())
         
     except Exception as e:
         print(f"❌ MongoDB connection failed: {e}")
+        await close_mongo_connection()
         raise e
 
 async def close_mongo_connection():
+    if mongodb.index_sync_task is not None:
+        mongodb.index_sync_task.cancel()
+        mongodb.index_sync_task = None
     if mongodb.client:
-        mongodb.client.close()
\ No newline at end of file
+        await mongodb.client.close()
+        mongodb.client = None
+        mongodb.db = None
@@ -0,0 +1,173 @@
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from pymongo import monitoring
+
+from logger.query_fingerprint import fingerprint
+
+# Commands worth profiling, mapped to the fields that make up their shape
+SHAPE_FIELDS = {
+    "find": ("filter", "sort", "projection"),
+    "aggregate": ("pipeline",),
+    "count": ("query",),
+    "distinct": ("key", "query"),
+    "findAndModify": ("query", "sort"),
+    "update": ("updates",),
+    "delete": ("deletes",),
+}
+# Per-statement sub-documents whose filter ("q") is the shape
+STATEMENT_FIELDS = {"updates", "deletes"}
+
+
+def command_shape(command_name: str, command: dict) -> Dict[str, Any]:
+    shape = {}
+    for field in SHAPE_FIELDS[command_name]:
+        value = command.get(field)
+        if value is None:
+            continue
+        if field in STATEMENT_FIELDS:
+            # Bulk statements usually share one shape; keep the first
+            value = {"q": value[0].get("q", {})} if value else {}
+        elif field == "key":
+            value = {value: 1}
+        shape[field] = value
+    return shape
+
+
+class ShapeStats:
+    """Running totals for one query shape"""
+
+    def __init__(self, collection: str, command: str, shape: str, query_hash: str, sample_size: int):
+        self.collection = collection
+        self.command = command
+        self.shape = shape
+        self.query_hash = query_hash
+        self.count = 0
+        self.failures = 0
+        self.total_ms = 0.0
+        self.docs_returned = 0
+        self.recent_ms: Deque[float] = deque(maxlen=sample_size)
+
+    def record(self, duration_ms: float, docs: int):
+        self.count += 1
+        self.total_ms += duration_ms
+        self.docs_returned += docs
+        self.recent_ms.append(duration_ms)
+
+    def p95(self) -> float:
+        if not self.recent_ms:
+            return 0.0
+        ordered = sorted(self.recent_ms)
+        return ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)]
+
+    def to_dict(self) -> dict:
+        return {
+            "collection": self.collection,
+            "command": self.command,
+            "shape": self.shape,
+            "query_hash": self.query_hash,
+            "count": self.count,
+            "failures": self.failures,
+            "total_ms": round(self.total_ms, 3),
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p95_ms": round(self.p95(), 3),
+            "docs_returned": self.docs_returned,
+            "docs_per_query": round(self.docs_returned / self.count, 1) if self.count else 0.0,
+        }
+
+
+class QueryStatsListener(monitoring.CommandListener):
+    """
+    pymongo command listener aggregating latency per query shape.
+
+    Every find/aggregate/count/distinct/update/delete/findAndModify sent by
+    the client (Beanie included) is reduced to a shape with the
+    literals removed, and count, total and p95 latency and documents
+    returned are kept per shape. getMore batches are attributed to the
+    shape of the cursor they continue. Command monitoring does not expose
+    docsExamined; use explain() on the shapes this reports for that.
+
+    Listeners may be called from pymongo's threads, so updates take a lock.
+    """
+
+    def __init__(self, max_shapes: int = 1000, sample_size: int = 512):
+        self.max_shapes = max_shapes
+        self.sample_size = sample_size
+        self.untracked = 0
+        self._stats: Dict[Tuple[str, str, str], ShapeStats] = {}
+        # (connection, request id) -> (stats key, cursor id continued by a getMore)
+        self._pending: Dict[Tuple[Any, int], Tuple[Tuple[str, str, str], Optional[int]]] = {}
+        # Open cursor id -> stats key of the query that opened it
+        self._cursors: Dict[int, Tuple[str, str, str]] = {}
+        self._lock = threading.Lock()
+
+    def _stats_key(self, event: monitoring.CommandStartedEvent) -> Optional[Tuple[str, str, str]]:
+        command_name = event.command_name
+        if command_name == "getMore":
+            return self._cursors.get(event.command.get("getMore"))
+        if command_name not in SHAPE_FIELDS:
+            return None
+        collection = event.command.get(command_name)
+        shape, query_hash = fingerprint(command_shape(command_name, event.command))
+        key = (str(collection), command_name, query_hash)
+        if key not in self._stats:
+            if len(self._stats) >= self.max_shapes:
+                self.untracked += 1
+                return None
+            self._stats[key] = ShapeStats(str(collection), command_name, shape, query_hash, self.sample_size)
+        return key
+
+    def started(self, event: monitoring.CommandStartedEvent):
+        with self._lock:
+            if event.command_name == "killCursors":
+                for cursor_id in event.command.get("cursors", ()):
+                    self._cursors.pop(cursor_id, None)
+                return
+            key = self._stats_key(event)
+            if key is not None:
+                cursor_id = event.command.get("getMore") if event.command_name == "getMore" else None
+                self._pending[(event.connection_id, event.request_id)] = (key, cursor_id)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent):
+        with self._lock:
+            pending = self._pending.pop((event.connection_id, event.request_id), None)
+            if pending is None:
+                return
+            key, continued_cursor = pending
+            reply = event.reply
+            cursor = reply.get("cursor")
+            if cursor is not None:
+                docs = len(cursor.get("firstBatch") or cursor.get("nextBatch") or ())
+                if cursor.get("id"):
+                    self._cursors[cursor["id"]] = key
+                    if len(self._cursors) > self.max_shapes * 10:
+                        # Cursors abandoned without killCursors; forget the oldest
+                        self._cursors.pop(next(iter(self._cursors)))
+                elif continued_cursor is not None:
+                    self._cursors.pop(continued_cursor, None)
+            else:
+                docs = reply.get("n", 0) if isinstance(reply.get("n"), int) else 0
+            self._stats[key].record(event.duration_micros / 1000, docs)
+
+    def failed(self, event: monitoring.CommandFailedEvent):
+        with self._lock:
+            pending = self._pending.pop((event.connection_id, event.request_id), None)
+            if pending is not None:
+                self._stats[pending[0]].failures += 1
+
+    def report(self, limit: int = 20, sort_by: str = "total_ms") -> List[dict]:
+        """Top query shapes by total_ms, p95_ms, count or docs_returned"""
+        with self._lock:
+            rows = [stats.to_dict() for stats in self._stats.values()]
+        rows.sort(key=lambda row: row[sort_by], reverse=True)
+        return rows[:limit]
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+            self._cursors.clear()
+            self.untracked = 0
+
+
+query_stats = QueryStatsListener()
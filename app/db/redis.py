@@ -1,7 +1,28 @@
+import asyncio
+
 from redis.asyncio import from_url
 from app.core.config import settings
 
-redis = from_url(settings.REDIS_URL, decode_responses=True)
+# Created at import so modules can hold a reference to it; connections are
+# opened and warmed by connect_to_redis() at startup
+redis = from_url(
+    settings.REDIS_URL,
+    decode_responses=True,
+    max_connections=settings.REDIS_MAX_CONNECTIONS,
+    socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT,
+    socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+    health_check_interval=30,
+)
 
 async def get_redis():
     return redis
+
+async def connect_to_redis():
+    """Check Redis is reachable and open REDIS_MIN_CONNECTIONS pooled connections"""
+    print(f"📡 Connecting to Redis at: {settings.REDIS_URL}")
+    # Concurrent pings each check out their own connection, which then stays in the pool
+    await asyncio.gather(*(redis.ping() for _ in range(max(settings.REDIS_MIN_CONNECTIONS, 1))))
+    print("✅ Redis connection pool ready")
+
+async def close_redis_connection():
+    await redis.aclose()
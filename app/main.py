@@ -1,29 +1,85 @@
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Request
+from typing import Literal
+from fastapi import Depends, FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 import os
 
 from app.api.v1.api import api_router
 from app.core.config import settings
-from app.db.mongo import connect_to_mongo, close_mongo_connection
-
-# @asynccontextmanager
-# async def lifespan(app: FastAPI):
-#     # Startup
-#     print("🔄 Connecting to MongoDB...")
-#     try:
-#         await connect_to_mongo()
-#         print("✅ MongoDB connection established successfully!")
-#     except Exception as e:
-#         print(f"❌ Failed to connect to MongoDB: {e}")
-#         raise
-#     yield
-#     # Shutdown
-#     print("🔄 Closing MongoDB connection...")
-#     await close_mongo_connection()
-#     print("✅ MongoDB connection closed successfully!")
+from app.core.firebase_auth import GoogleAuthBackend
+from app.core.metrics import (
+    CONTENT_TYPE_LATEST,
+    MetricsMiddleware,
+    loop_lag_monitor,
+    mark_worker_stopped,
+    render_metrics,
+)
+from app.db.mongo import connect_to_mongo, close_mongo_connection, mongodb
+from app.db.redis import connect_to_redis, close_redis_connection
+from app.services.college_cards import CollegeCardService
+from app.services.college_service import COLLEGE_SECTIONS, CollegeService, college_projection_model
+from app.services.section_cache import section_cache
+from logger.logging import LoggingMiddleware, RequestResponseLogger, log_listener
+from logger.loop_watchdog import loop_watchdog
+
+async def warm_up():
+    """Build in-process indexes and caches before the first request"""
+    CollegeService.get_college_index()
+    college_projection_model(tuple(COLLEGE_SECTIONS))
+    if settings.USE_MONGO_COLLEGES and mongodb.db is not None:
+        built = await CollegeCardService.backfill_if_empty()
+        if built:
+            print(f"✅ Built {built} college listing cards")
+    if os.path.exists(settings.SA_KEY_FILE):
+        try:
+            key_cache = GoogleAuthBackend.get_instance().key_cache
+            await key_cache.refresh()
+            key_cache.start()
+        except Exception as e:
+            print(f"⚠️  Could not preload Firebase signing keys: {e}")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Startup
+    if log_listener is not None:
+        log_listener.start()
+    print("🔄 Connecting to MongoDB...")
+    try:
+        await connect_to_mongo()
+        print("✅ MongoDB connection established successfully!")
+    except Exception as e:
+        print(f"❌ Failed to connect to MongoDB: {e}")
+        # Only fatal once colleges are served from Mongo
+        if settings.USE_MONGO_COLLEGES:
+            raise
+    try:
+        await connect_to_redis()
+    except Exception as e:
+        print(f"⚠️  Redis unavailable, caches fall back to in-process only: {e}")
+
+    await warm_up()
+    section_cache.start()
+    if settings.METRICS_ENABLED:
+        loop_lag_monitor.start()
+    if settings.LOOP_WATCHDOG_ENABLED:
+        loop_watchdog.start()
+    yield
+    # Shutdown
+    await loop_watchdog.stop()
+    await loop_lag_monitor.stop()
+    await section_cache.stop()
+    if GoogleAuthBackend._instance is not None:
+        await GoogleAuthBackend._instance.key_cache.stop()
+    print("🔄 Closing MongoDB and Redis connections...")
+    await close_mongo_connection()
+    await close_redis_connection()
+    print("✅ Connections closed successfully!")
+    mark_worker_stopped()
+    # Write out queued log records last
+    if log_listener is not None:
+        log_listener.stop()
 
 app = FastAPI(
     title="Educational Website API",
@@ -31,7 +87,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
-    # lifespan=lifespan
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -43,6 +99,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Request logging (pure ASGI); unhandled errors reach it and then global_exception_handler
+app.add_middleware(LoggingMiddleware, request_response_logger=RequestResponseLogger())
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 # Include API router
 app.include_router(api_router, prefix="/api/v1")
 
@@ -74,6 +135,31 @@ async def health_check():
             "error": str(e)
         }
 
+def require_diagnostics():
+    """Diagnostics expose cache and query internals; they only exist when DIAGNOSTICS_ENABLED is set"""
+    if not settings.DIAGNOSTICS_ENABLED:
+        raise HTTPException(status_code=404, detail="Not Found")
+
+@app.get("/cache/stats", dependencies=[Depends(require_diagnostics)], include_in_schema=False)
+async def cache_stats():
+    """Hit/miss counters of the section cache tiers for this worker"""
+    from app.core.response_cache import response_cache
+    return {**section_cache.stats(), "responses": response_cache.local.stats()}
+
+@app.get("/db/query-stats", dependencies=[Depends(require_diagnostics)], include_in_schema=False)
+async def db_query_stats(
+    limit: int = Query(20, ge=1, le=200),
+    sort_by: Literal["total_ms", "p95_ms", "count", "docs_returned"] = "total_ms",
+):
+    """Slowest Mongo query shapes seen by this worker"""
+    from app.db.query_stats import query_stats
+    return {"untracked": query_stats.untracked, "shapes": query_stats.report(limit, sort_by)}
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus exposition of request, database, auth cache and event loop metrics"""
+    return Response(render_metrics(), media_type=CONTENT_TYPE_LATEST)
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     return JSONResponse(
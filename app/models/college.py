@@ -1,8 +1,11 @@
 from enum import Enum
-from typing import Optional, List, Dict
+from typing import Any, Optional, List, Dict
 from datetime import datetime
-from pydantic import BaseModel, Field
-from beanie import Document
+from pydantic import BaseModel, Field, field_validator
+from beanie import Document, after_event, Insert, Replace, Save, SaveChanges, Update, Delete
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
+
+from utility.utils import parse_inr
 
 
 class CollegeType(str, Enum):
@@ -89,21 +92,27 @@ class CollegeRanking(BaseModel):
     category: Optional[str] = None  # Overall, Engineering, etc.
 
 
+# Amounts are whole rupees. Documents written before this still hold display
+# strings ("₹2.5 Lakhs", "25 LPA"); those are parsed when loaded.
 class Fees(BaseModel):
-    tuition: Optional[str] = None
-    hostel: Optional[str] = None
-    other: Optional[str] = None
-    total: Optional[str] = None
+    tuition: Optional[int] = None
+    hostel: Optional[int] = None
+    other: Optional[int] = None
+    total: Optional[int] = None
     currency: str = "INR"
 
+    _parse_amounts = field_validator("tuition", "hostel", "other", "total", mode="before")(parse_inr)
+
 
 class Placement(BaseModel):
-    average_package: Optional[str] = None
-    median_package: Optional[str] = None
-    highest_package: Optional[str] = None
+    average_package: Optional[int] = None
+    median_package: Optional[int] = None
+    highest_package: Optional[int] = None
     placement_rate: Optional[float] = Field(None, ge=0, le=100)
     top_recruiters: Optional[List[str]] = []
 
+    _parse_amounts = field_validator("average_package", "median_package", "highest_package", mode="before")(parse_inr)
+
 
 class Courses(BaseModel):
     undergraduate: Optional[List[str]] = []
@@ -251,8 +260,20 @@ class Affiliation(BaseModel):
     regulatory_bodies: Optional[List[str]] = []  # UGC, AICTE, MCI, etc.
 
 
+# Listed colleges: only these have a listing card, and the text index skips the rest
+LISTED_FILTER = {"is_active": True, "is_deleted": False}
+
+
+def card_index(name: str, *keys) -> IndexModel:
+    """College card index: the filter/sort keys, then _id as a stable tie-breaker"""
+    return IndexModel([*keys, ("_id", ASCENDING)], name=name)
+
+
 # Main College Model
 class College(Document):
+    # Public numeric id used in URLs (/colleges/{college_id}) and cache keys
+    college_id: Optional[int] = None
+
     # Basic Information
     name: str = Field(..., min_length=1, max_length=500)
     short_name: Optional[str] = None
@@ -329,6 +350,88 @@ class College(Document):
     # Status
     is_active: bool = True
     is_deleted: bool = False
+
+    @after_event(Insert, Replace, Save, SaveChanges, Update, Delete)
+    async def invalidate_cached_sections(self):
+        """Drop cached detail sections whenever this college is written"""
+        from app.services.section_cache import section_cache
+        # Sections are cached under the public id the endpoints are called with
+        if self.college_id is not None:
+            await section_cache.invalidate(self.college_id, updated_at=self.updated_at)
+
+    @after_event(Insert, Replace, Save, SaveChanges, Update)
+    async def sync_card(self):
+        """Rebuild this college's listing card from the written document"""
+        from app.services.college_cards import CollegeCardService
+        await CollegeCardService.sync(self)
+
+    @after_event(Delete)
+    async def drop_card(self):
+        """Remove the listing card of a deleted college"""
+        from app.services.college_cards import CollegeCardService
+        await CollegeCardService.remove(self.id)
     
     class Settings:
-        name = "colleges"
\ No newline at end of file
+        name = "colleges"
+        indexes = [
+            IndexModel(
+                [("college_id", ASCENDING)],
+                name="college_id_unique",
+                unique=True,
+                partialFilterExpression={"college_id": {"$type": "number"}},
+            ),
+            IndexModel(
+                [("slug", ASCENDING)],
+                name="slug_unique",
+                unique=True,
+                partialFilterExpression={"slug": {"$type": "string"}},
+            ),
+            IndexModel(
+                [("name", TEXT), ("short_name", TEXT), ("alias", TEXT)],
+                name="name_text",
+                weights={"name": 10, "short_name": 5, "alias": 5},
+                partialFilterExpression=LISTED_FILTER,
+            ),
+        ]
+
+
+# Listing card, one per listed college, with the same _id. Maintained by
+# College's write hooks: everything the listing shows, filters or sorts on is
+# a top-level scalar here, fees and packages in rupees.
+class CollegeCard(Document):
+    college_id: Optional[int] = None
+    name: str
+    short_name: Optional[str] = None
+    city: Optional[str] = None
+    state: Optional[str] = None
+    type: Optional[str] = None
+    category: Optional[str] = None
+    rating: Optional[float] = None
+    reviews: Optional[int] = None
+    established_year: Optional[int] = None
+    featured: bool = False
+    fees: Optional[int] = None  # Total fees, INR
+    placement: Optional[int] = None  # Average package, INR
+    best_rank: Optional[int] = None  # Best rank across rankings
+    students: Optional[int] = None
+    logo: Optional[str] = None
+    updated_at: Optional[datetime] = None
+
+    class Settings:
+        name = "college_cards"
+        # Equality filters first, then the sort key, matching get_colleges
+        indexes = [
+            card_index("card_rating", ("rating", DESCENDING)),
+            card_index("card_state_rating", ("state", ASCENDING), ("rating", DESCENDING)),
+            card_index("card_type_rating", ("type", ASCENDING), ("rating", DESCENDING)),
+            card_index("card_category_rating", ("category", ASCENDING), ("rating", DESCENDING)),
+            card_index(
+                "card_state_category_rating",
+                ("state", ASCENDING),
+                ("category", ASCENDING),
+                ("rating", DESCENDING),
+            ),
+            card_index("card_rank", ("best_rank", DESCENDING)),
+            card_index("card_fees", ("fees", DESCENDING)),
+            card_index("card_placement", ("placement", DESCENDING)),
+        ]
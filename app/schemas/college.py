@@ -1,7 +1,9 @@
-from pydantic import BaseModel, Field, EmailStr, HttpUrl
+from pydantic import BaseModel, Field, EmailStr, HttpUrl, field_validator
 from typing import Optional, List, Dict
 from datetime import datetime
 
+from utility.utils import parse_inr_strict
+
 
 # Nested schemas for Create Request
 class CoordinatesCreate(BaseModel):
@@ -44,21 +46,27 @@ class CollegeRankingCreate(BaseModel):
     category: Optional[str] = None
 
 
+# Amounts in whole rupees; strings like "₹2.5 Lakhs" are accepted and parsed,
+# text without an amount in it is rejected
 class FeesCreate(BaseModel):
-    tuition: Optional[str] = None
-    hostel: Optional[str] = None
-    other: Optional[str] = None
-    total: Optional[str] = None
+    tuition: Optional[int] = None
+    hostel: Optional[int] = None
+    other: Optional[int] = None
+    total: Optional[int] = None
     currency: str = "INR"
 
+    _parse_amounts = field_validator("tuition", "hostel", "other", "total", mode="before")(parse_inr_strict)
+
 
 class PlacementCreate(BaseModel):
-    average_package: Optional[str] = None
-    median_package: Optional[str] = None
-    highest_package: Optional[str] = None
+    average_package: Optional[int] = None
+    median_package: Optional[int] = None
+    highest_package: Optional[int] = None
     placement_rate: Optional[float] = Field(None, ge=0, le=100)
     top_recruiters: Optional[List[str]] = []
 
+    _parse_amounts = field_validator("average_package", "median_package", "highest_package", mode="before")(parse_inr_strict)
+
 
 class CoursesCreate(BaseModel):
     undergraduate: Optional[List[str]] = []
@@ -396,6 +404,8 @@ class CollegeListPageResponse(BaseModel):
     total: int
     page: int
     size: int
+    # Pass back as ?cursor= for the next page; None on the last page
+    next_cursor: Optional[str] = None
 
 # College Detail Page Schemas
 class LocationDetail(BaseModel):
@@ -0,0 +1,80 @@
+from typing import Any, List
+
+from pymongo import ReplaceOne
+
+from app.models.college import LISTED_FILTER, College, CollegeCard
+
+
+def card_from_college(college: College) -> CollegeCard:
+    """Flatten the listing fields of a college into its card"""
+    address, ratings = college.address, college.ratings
+    ranks = [ranking.rank for ranking in college.rankings or []]
+    return CollegeCard(
+        id=college.id,
+        college_id=college.college_id,
+        name=college.name,
+        short_name=college.short_name,
+        city=address.city if address else None,
+        state=address.state if address else None,
+        type=college.type.value if college.type else None,
+        category=college.category.value if college.category else None,
+        rating=ratings.overall if ratings else None,
+        reviews=ratings.total_reviews if ratings else None,
+        established_year=college.established_year,
+        featured=college.featured,
+        fees=college.fees.total if college.fees else None,
+        placement=college.placement.average_package if college.placement else None,
+        best_rank=min(ranks) if ranks else None,
+        students=college.academics.total_students if college.academics else None,
+        logo=college.images.logo if college.images else None,
+        updated_at=college.updated_at,
+    )
+
+
+def is_listed(college: College) -> bool:
+    return all(getattr(college, field) == value for field, value in LISTED_FILTER.items())
+
+
+class CollegeCardService:
+    """Keeps the college_cards collection in step with colleges"""
+
+    @staticmethod
+    async def sync(college: College):
+        """Upsert the card of a listed college; drop it once the college is unlisted"""
+        if is_listed(college):
+            await card_from_college(college).save()
+        else:
+            await CollegeCardService.remove(college.id)
+
+    @staticmethod
+    async def remove(college_id: Any):
+        await CollegeCard.get_pymongo_collection().delete_one({"_id": college_id})
+
+    @staticmethod
+    async def rebuild(batch_size: int = 500) -> int:
+        """
+        Rebuild every card from the colleges collection, for backfills and
+        for writes that bypass document hooks (bulk updates, manual edits).
+        Returns the number of cards written.
+        """
+        cards = CollegeCard.get_pymongo_collection()
+        listed: List[Any] = []
+        batch: List[ReplaceOne] = []
+        async for college in College.find(LISTED_FILTER):
+            card = card_from_college(college)
+            batch.append(ReplaceOne({"_id": card.id}, card.model_dump(by_alias=True), upsert=True))
+            listed.append(card.id)
+            if len(batch) >= batch_size:
+                await cards.bulk_write(batch, ordered=False)
+                batch = []
+        if batch:
+            await cards.bulk_write(batch, ordered=False)
+        await cards.delete_many({"_id": {"$nin": listed}})
+        return len(listed)
+
+    @staticmethod
+    async def backfill_if_empty() -> int:
+        """Build the cards on the first start after the collection was introduced"""
+        if await CollegeCard.get_pymongo_collection().estimated_document_count():
+            return 0
+        return await CollegeCardService.rebuild()
@@ -0,0 +1,155 @@
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Inclusive (low, high) bounds; None leaves that side open
+Range = Tuple[Optional[float], Optional[float]]
+
+
+class CollegeIndex:
+    """
+    Columnar in-memory index over college list records.
+
+    Numeric fields are stored as NumPy columns and state/type/category are
+    dictionary-encoded, so filters become boolean masks and sorts reuse
+    permutations computed once at build time.
+    """
+
+    NUMERIC_FIELDS = ("rating", "fees", "placement", "ranking", "established")
+    CODED_FIELDS = ("state", "type", "category")
+
+    def __init__(self, records: List[dict]):
+        self.records = records
+        self.size = len(records)
+
+        self.columns: Dict[str, np.ndarray] = {
+            field: np.array([r.get(field) or 0 for r in records], dtype=np.float64)
+            for field in self.NUMERIC_FIELDS
+        }
+
+        # Dictionary-encoded categorical columns: value -> code
+        self.dictionaries: Dict[str, Dict[str, int]] = {}
+        self.codes: Dict[str, np.ndarray] = {}
+        for field in self.CODED_FIELDS:
+            dictionary: Dict[str, int] = {}
+            codes = np.empty(self.size, dtype=np.int32)
+            for i, r in enumerate(records):
+                codes[i] = dictionary.setdefault(r.get(field), len(dictionary))
+            self.dictionaries[field] = dictionary
+            self.codes[field] = codes
+
+        # Record id -> row position, to resume from a cursor
+        self.row_by_id: Dict[str, int] = {str(r["id"]): i for i, r in enumerate(records)}
+
+        self.names = np.array([r["name"].lower() for r in records], dtype=str)
+
+        # Stable permutations so ties keep insertion order, matching sorted()
+        self.orderings: Dict[Tuple[str, bool], np.ndarray] = {}
+        for field, values in self.columns.items():
+            self.orderings[(field, False)] = np.argsort(values, kind="stable")
+            self.orderings[(field, True)] = np.argsort(-values, kind="stable")
+
+        # Row -> position in each ordering, so a cursor seeks without scanning
+        self.ranks: Dict[Tuple[str, bool], np.ndarray] = {}
+        for key, order in self.orderings.items():
+            ranks = np.empty(self.size, dtype=np.intp)
+            ranks[order] = np.arange(self.size)
+            self.ranks[key] = ranks
+
+    def _equals_mask(self, field: str, value: str) -> np.ndarray:
+        code = self.dictionaries[field].get(value)
+        if code is None:
+            return np.zeros(self.size, dtype=bool)
+        return self.codes[field] == code
+
+    def _search_mask(self, pattern: str) -> np.ndarray:
+        # Plain substrings are matched vectorised; real regexes fall back to re
+        if re.escape(pattern) == pattern:
+            return np.char.find(self.names, pattern.lower()) >= 0
+        compiled = re.compile(pattern, re.IGNORECASE)
+        return np.fromiter(
+            (compiled.search(r["name"]) is not None for r in self.records),
+            dtype=bool,
+            count=self.size
+        )
+
+    def filter_mask(
+        self,
+        search: Optional[str] = None,
+        state: Optional[str] = None,
+        type: Optional[str] = None,
+        category: Optional[str] = None,
+        ranges: Optional[Dict[str, Range]] = None,
+    ) -> np.ndarray:
+        """Build the boolean row mask for the given filters"""
+        mask = np.ones(self.size, dtype=bool)
+        if search:
+            mask &= self._search_mask(search)
+        if state is not None:
+            mask &= self._equals_mask("state", state)
+        if type is not None:
+            mask &= self._equals_mask("type", type)
+        if category is not None:
+            mask &= self._equals_mask("category", category)
+        for field, (low, high) in (ranges or {}).items():
+            values = self.columns[field]
+            if low is not None:
+                mask &= values >= low
+            if high is not None:
+                mask &= values <= high
+        return mask
+
+    def search(
+        self,
+        search: Optional[str] = None,
+        state: Optional[str] = None,
+        type: Optional[str] = None,
+        category: Optional[str] = None,
+        ranges: Optional[Dict[str, Range]] = None,
+        sort_field: Optional[str] = None,
+        descending: bool = True,
+        offset: int = 0,
+        limit: int = 10,
+        after: Optional[Tuple[Any, str]] = None,
+    ) -> Tuple[np.ndarray, int]:
+        """
+        Return (row positions of the requested page, total matches).
+
+        ``ranges`` maps numeric fields to inclusive (low, high) bounds, either
+        of which may be None. ``after`` is the (sort value, id) of the last row already returned;
+        when given, the page starts right after it and ``offset`` is ignored.
+        Raises ValueError when ``after`` names an unknown id in the default order.
+        """
+        mask = self.filter_mask(search, state, type, category, ranges)
+        total = int(np.count_nonzero(mask))
+
+        if sort_field in self.columns:
+            order = self.orderings[(sort_field, descending)]
+            if after is not None:
+                order = order[self._seek(sort_field, descending, *after):]
+                offset = 0
+            rows = order[mask[order]]
+        else:
+            rows = np.flatnonzero(mask)
+            if after is not None:
+                last_row = self.row_by_id.get(str(after[1]))
+                if last_row is None:
+                    # No value to re-seek by in the default order; restarting would repeat rows
+                    raise ValueError("Cursor is no longer valid; start again from the first page")
+                rows = rows[rows > last_row]
+                offset = 0
+
+        return rows[offset:offset + limit], total
+
+    def _seek(self, sort_field: str, descending: bool, value: Any, last_id: str) -> int:
+        """Position in the sort ordering right after the cursor's (value, id)"""
+        row = self.row_by_id.get(str(last_id))
+        if row is not None:
+            return int(self.ranks[(sort_field, descending)][row]) + 1
+        # Unknown id: skip every row sorting at or before the value
+        values = self.columns[sort_field][self.orderings[(sort_field, descending)]]
+        value = float(value or 0)
+        if descending:
+            return int(np.searchsorted(-values, -value, side="right"))
+        return int(np.searchsorted(values, value, side="right"))
@@ -1,410 +1,482 @@
-from app.models.college import College
+from app.core.pagination import decode_cursor, encode_cursor
+from app.models.college import College, CollegeCard
 from app.schemas.college import CollegeListPageResponse
-from typing import Optional, List, Tuple
-import re
+from app.services.college_index import CollegeIndex
+from app.services.local_cache import LocalCache
+from app.services.section_aggregator import AggregationResult, SectionAggregator, SectionNotFound
+from app.services.section_cache import section_cache
+from app.core.config import settings
+from pydantic import BaseModel, Field, create_model
+from beanie import PydanticObjectId
+from typing import Any, Awaitable, Callable, Optional, List, Tuple, Type
+import asyncio
+import functools
+import json
+
+# Sample colleges data
+SAMPLE_COLLEGES = [
+    {
+        "id": "1",
+        "name": 'Indian Institute of Technology Delhi',
+        "shortName": 'IIT Delhi',
+        "location": 'New Delhi',
+        "state": 'Delhi',
+        "rating": 4.8,
+        "reviews": 2453,
+        "type": 'Public',
+        "category": 'Engineering',
+        "established": 1961,
+        "fees": 250000,
+        "placement": 2500000,
+        "ranking": 2,
+        "featured": True,
+        "courses": 42,
+        "students": 8000,
+        "image": '/api/placeholder/400/300'
+    },
+    {
+        "id": "2",
+        "name": 'All India Institute of Medical Sciences',
+        "shortName": 'AIIMS Delhi',
+        "location": 'New Delhi',
+        "state": 'Delhi',
+        "rating": 4.9,
+        "reviews": 1876,
+        "type": 'Public',
+        "category": 'Medical',
+        "established": 1956,
+        "fees": 150000,
+        "placement": 3000000,
+        "ranking": 1,
+        "featured": True,
+        "courses": 28,
+        "students": 3000,
+        "image": '/api/placeholder/400/300'
+    },
+    {
+        "id": "3",
+        "name": 'Indian Institute of Management Ahmedabad',
+        "shortName": 'IIM Ahmedabad',
+        "location": 'Ahmedabad',
+        "state": 'Gujarat',
+        "rating": 4.7,
+        "reviews": 1234,
+        "type": 'Public',
+        "category": 'Management',
+        "established": 1961,
+        "fees": 2500000,
+        "placement": 3500000,
+        "ranking": 1,
+        "featured": True,
+        "courses": 15,
+        "students": 1200,
+        "image": '/api/placeholder/400/300'
+    },
+    {
+        "id": "4",
+        "name": 'Indian Institute of Science',
+        "shortName": 'IISc Bangalore',
+        "location": 'Bangalore',
+        "state": 'Karnataka',
+        "rating": 4.8,
+        "reviews": 987,
+        "type": 'Public',
+        "category": 'Science & Research',
+        "established": 1909,
+        "fees": 200000,
+        "placement": 2800000,
+        "ranking": 1,
+        "featured": True,
+        "courses": 35,
+        "students": 4500,
+        "image": '/api/placeholder/400/300'
+    },
+    {
+        "id": "5",
+        "name": 'Delhi University',
+        "shortName": 'DU',
+        "location": 'New Delhi',
+        "state": 'Delhi',
+        "rating": 4.5,
+        "reviews": 5432,
+        "type": 'Public',
+        "category": 'Arts & Science',
+        "established": 1922,
+        "fees": 50000,
+        "placement": 800000,
+        "ranking": 12,
+        "featured": False,
+        "courses": 180,
+        "students": 400000,
+        "image": '/api/placeholder/400/300'
+    },
+    {
+        "id": "6",
+        "name": 'Indian Institute of Technology Bombay',
+        "shortName": 'IIT Bombay',
+        "location": 'Mumbai',
+        "state": 'Maharashtra',
+        "rating": 4.8,
+        "reviews": 2156,
+        "type": 'Public',
+        "category": 'Engineering',
+        "established": 1958,
+        "fees": 250000,
+        "placement": 2700000,
+        "ranking": 3,
+        "featured": True,
+        "courses": 45,
+        "students": 9000,
+        "image": '/api/placeholder/400/300'
+    },
+    {
+        "id": "7",
+        "name": 'Jawaharlal Nehru University',
+        "shortName": 'JNU',
+        "location": 'New Delhi',
+        "state": 'Delhi',
+        "rating": 4.6,
+        "reviews": 1543,
+        "type": 'Public',
+        "category": 'Arts & Science',
+        "established": 1969,
+        "fees": 20000,
+        "placement": 600000,
+        "ranking": 8,
+        "featured": False,
+        "courses": 75,
+        "students": 8500,
+        "image": '/api/placeholder/400/300'
+    },
+    {
+        "id": "8",
+        "name": 'Indian Institute of Technology Madras',
+        "shortName": 'IIT Madras',
+        "location": 'Chennai',
+        "state": 'Tamil Nadu',
+        "rating": 4.9,
+        "reviews": 2891,
+        "type": 'Public',
+        "category": 'Engineering',
+        "established": 1959,
+        "fees": 250000,
+        "placement": 2800000,
+        "ranking": 1,
+        "featured": True,
+        "courses": 50,
+        "students": 10000,
+        "image": '/api/placeholder/400/300'
+    },
+    {
+        "id": "9",
+        "name": 'National Law School of India University',
+        "shortName": 'NLSIU Bangalore',
+        "location": 'Bangalore',
+        "state": 'Karnataka',
+        "rating": 4.7,
+        "reviews": 876,
+        "type": 'Public',
+        "category": 'Law',
+        "established": 1987,
+        "fees": 400000,
+        "placement": 2000000,
+        "ranking": 1,
+        "featured": True,
+        "courses": 8,
+        "students": 800,
+        "image": '/api/placeholder/400/300'
+    },
+    {
+        "id": "10",
+        "name": 'Banaras Hindu University',
+        "shortName": 'BHU',
+        "location": 'Varanasi',
+        "state": 'Uttar Pradesh',
+        "rating": 4.4,
+        "reviews": 3421,
+        "type": 'Public',
+        "category": 'Arts & Science',
+        "established": 1916,
+        "fees": 60000,
+        "placement": 700000,
+        "ranking": 15,
+        "featured": False,
+        "courses": 140,
+        "students": 30000,
+        "image": '/api/placeholder/400/300'
+    },
+    {
+        "id": "11",
+        "name": 'BITS Pilani',
+        "shortName": 'BITS Pilani',
+        "location": 'Pilani',
+        "state": 'Rajasthan',
+        "rating": 4.6,
+        "reviews": 1987,
+        "type": 'Private',
+        "category": 'Engineering',
+        "established": 1964,
+        "fees": 450000,
+        "placement": 2300000,
+        "ranking": 5,
+        "featured": True,
+        "courses": 38,
+        "students": 4500,
+        "image": '/api/placeholder/400/300'
+    },
+    {
+        "id": "12",
+        "name": 'Manipal Academy of Higher Education',
+        "shortName": 'MAHE',
+        "location": 'Manipal',
+        "state": 'Karnataka',
+        "rating": 4.3,
+        "reviews": 2134,
+        "type": 'Private',
+        "category": 'Medical',
+        "established": 1953,
+        "fees": 1800000,
+        "placement": 1500000,
+        "ranking": 10,
+        "featured": False,
+        "courses": 65,
+        "students": 28000,
+        "image": '/api/placeholder/400/300'
+    },
+    {
+        "id": "13",
+        "name": 'Vellore Institute of Technology',
+        "shortName": 'VIT Vellore',
+        "location": 'Vellore',
+        "state": 'Tamil Nadu',
+        "rating": 4.4,
+        "reviews": 3567,
+        "type": 'Private',
+        "category": 'Engineering',
+        "established": 1984,
+        "fees": 175000,
+        "placement": 1200000,
+        "ranking": 11,
+        "featured": False,
+        "courses": 52,
+        "students": 35000,
+        "image": '/api/placeholder/400/300'
+    },
+    {
+        "id": "14",
+        "name": 'Indian Statistical Institute',
+        "shortName": 'ISI Kolkata',
+        "location": 'Kolkata',
+        "state": 'West Bengal',
+        "rating": 4.7,
+        "reviews": 654,
+        "type": 'Public',
+        "category": 'Science & Research',
+        "established": 1931,
+        "fees": 100000,
+        "placement": 2400000,
+        "ranking": 3,
+        "featured": True,
+        "courses": 12,
+        "students": 900,
+        "image": '/api/placeholder/400/300'
+    },
+    {
+        "id": "15",
+        "name": 'Amity University',
+        "shortName": 'Amity Noida',
+        "location": 'Noida',
+        "state": 'Uttar Pradesh',
+        "rating": 4.2,
+        "reviews": 4321,
+        "type": 'Private',
+        "category": 'Arts & Science',
+        "established": 2005,
+        "fees": 200000,
+        "placement": 600000,
+        "ranking": 20,
+        "featured": False,
+        "courses": 95,
+        "students": 45000,
+        "image": '/api/placeholder/400/300'
+    }
+]
+
 
 class CollegeService:
+    _college_index: Optional[CollegeIndex] = None
+    # Listing totals per filter combination; counts do not need to be exact to the second
+    _count_cache = LocalCache(max_bytes=1024 * 1024, ttl=settings.COLLEGE_COUNT_CACHE_TTL)
+
+    @classmethod
+    def get_college_index(cls) -> CollegeIndex:
+        """Get the columnar listing index, building it on first use"""
+        if cls._college_index is None:
+            cls._college_index = CollegeIndex(SAMPLE_COLLEGES)
+        return cls._college_index
+
     @staticmethod
     async def get_colleges(
         query: dict = {},
         sort_criteria: Optional[List[Tuple[str, int]]] = None,
         page: int = 1,
-        page_size: int = 10
+        page_size: int = 10,
+        cursor: Optional[str] = None
     ) -> CollegeListPageResponse:
-        # Sample colleges data
-        all_colleges = [
-            {
-                "id": "1",
-                "name": 'Indian Institute of Technology Delhi',
-                "shortName": 'IIT Delhi',
-                "location": 'New Delhi',
-                "state": 'Delhi',
-                "rating": 4.8,
-                "reviews": 2453,
-                "type": 'Public',
-                "category": 'Engineering',
-                "established": 1961,
-                "fees": 250000,
-                "placement": 2500000,
-                "ranking": 2,
-                "featured": True,
-                "courses": 42,
-                "students": 8000,
-                "image": '/api/placeholder/400/300'
-            },
-            {
-                "id": "2",
-                "name": 'All India Institute of Medical Sciences',
-                "shortName": 'AIIMS Delhi',
-                "location": 'New Delhi',
-                "state": 'Delhi',
-                "rating": 4.9,
-                "reviews": 1876,
-                "type": 'Public',
-                "category": 'Medical',
-                "established": 1956,
-                "fees": 150000,
-                "placement": 3000000,
-                "ranking": 1,
-                "featured": True,
-                "courses": 28,
-                "students": 3000,
-                "image": '/api/placeholder/400/300'
-            },
-            {
-                "id": "3",
-                "name": 'Indian Institute of Management Ahmedabad',
-                "shortName": 'IIM Ahmedabad',
-                "location": 'Ahmedabad',
-                "state": 'Gujarat',
-                "rating": 4.7,
-                "reviews": 1234,
-                "type": 'Public',
-                "category": 'Management',
-                "established": 1961,
-                "fees": 2500000,
-                "placement": 3500000,
-                "ranking": 1,
-                "featured": True,
-                "courses": 15,
-                "students": 1200,
-                "image": '/api/placeholder/400/300'
-            },
-            {
-                "id": "4",
-                "name": 'Indian Institute of Science',
-                "shortName": 'IISc Bangalore',
-                "location": 'Bangalore',
-                "state": 'Karnataka',
-                "rating": 4.8,
-                "reviews": 987,
-                "type": 'Public',
-                "category": 'Science & Research',
-                "established": 1909,
-                "fees": 200000,
-                "placement": 2800000,
-                "ranking": 1,
-                "featured": True,
-                "courses": 35,
-                "students": 4500,
-                "image": '/api/placeholder/400/300'
-            },
-            {
-                "id": "5",
-                "name": 'Delhi University',
-                "shortName": 'DU',
-                "location": 'New Delhi',
-                "state": 'Delhi',
-                "rating": 4.5,
-                "reviews": 5432,
-                "type": 'Public',
-                "category": 'Arts & Science',
-                "established": 1922,
-                "fees": 50000,
-                "placement": 800000,
-                "ranking": 12,
-                "featured": False,
-                "courses": 180,
-                "students": 400000,
-                "image": '/api/placeholder/400/300'
-            },
-            {
-                "id": "6",
-                "name": 'Indian Institute of Technology Bombay',
-                "shortName": 'IIT Bombay',
-                "location": 'Mumbai',
-                "state": 'Maharashtra',
-                "rating": 4.8,
-                "reviews": 2156,
-                "type": 'Public',
-                "category": 'Engineering',
-                "established": 1958,
-                "fees": 250000,
-                "placement": 2700000,
-                "ranking": 3,
-                "featured": True,
-                "courses": 45,
-                "students": 9000,
-                "image": '/api/placeholder/400/300'
-            },
-            {
-                "id": "7",
-                "name": 'Jawaharlal Nehru University',
-                "shortName": 'JNU',
-                "location": 'New Delhi',
-                "state": 'Delhi',
-                "rating": 4.6,
-                "reviews": 1543,
-                "type": 'Public',
-                "category": 'Arts & Science',
-                "established": 1969,
-                "fees": 20000,
-                "placement": 600000,
-                "ranking": 8,
-                "featured": False,
-                "courses": 75,
-                "students": 8500,
-                "image": '/api/placeholder/400/300'
-            },
-            {
-                "id": "8",
-                "name": 'Indian Institute of Technology Madras',
-                "shortName": 'IIT Madras',
-                "location": 'Chennai',
-                "state": 'Tamil Nadu',
-                "rating": 4.9,
-                "reviews": 2891,
-                "type": 'Public',
-                "category": 'Engineering',
-                "established": 1959,
-                "fees": 250000,
-                "placement": 2800000,
-                "ranking": 1,
-                "featured": True,
-                "courses": 50,
-                "students": 10000,
-                "image": '/api/placeholder/400/300'
-            },
-            {
-                "id": "9",
-                "name": 'National Law School of India University',
-                "shortName": 'NLSIU Bangalore',
-                "location": 'Bangalore',
-                "state": 'Karnataka',
-                "rating": 4.7,
-                "reviews": 876,
-                "type": 'Public',
-                "category": 'Law',
-                "established": 1987,
-                "fees": 400000,
-                "placement": 2000000,
-                "ranking": 1,
-                "featured": True,
-                "courses": 8,
-                "students": 800,
-                "image": '/api/placeholder/400/300'
-            },
-            {
-                "id": "10",
-                "name": 'Banaras Hindu University',
-                "shortName": 'BHU',
-                "location": 'Varanasi',
-                "state": 'Uttar Pradesh',
-                "rating": 4.4,
-                "reviews": 3421,
-                "type": 'Public',
-                "category": 'Arts & Science',
-                "established": 1916,
-                "fees": 60000,
-                "placement": 700000,
-                "ranking": 15,
-                "featured": False,
-                "courses": 140,
-                "students": 30000,
-                "image": '/api/placeholder/400/300'
-            },
-            {
-                "id": "11",
-                "name": 'BITS Pilani',
-                "shortName": 'BITS Pilani',
-                "location": 'Pilani',
-                "state": 'Rajasthan',
-                "rating": 4.6,
-                "reviews": 1987,
-                "type": 'Private',
-                "category": 'Engineering',
-                "established": 1964,
-                "fees": 450000,
-                "placement": 2300000,
-                "ranking": 5,
-                "featured": True,
-                "courses": 38,
-                "students": 4500,
-                "image": '/api/placeholder/400/300'
-            },
-            {
-                "id": "12",
-                "name": 'Manipal Academy of Higher Education',
-                "shortName": 'MAHE',
-                "location": 'Manipal',
-                "state": 'Karnataka',
-                "rating": 4.3,
-                "reviews": 2134,
-                "type": 'Private',
-                "category": 'Medical',
-                "established": 1953,
-                "fees": 1800000,
-                "placement": 1500000,
-                "ranking": 10,
-                "featured": False,
-                "courses": 65,
-                "students": 28000,
-                "image": '/api/placeholder/400/300'
-            },
-            {
-                "id": "13",
-                "name": 'Vellore Institute of Technology',
-                "shortName": 'VIT Vellore',
-                "location": 'Vellore',
-                "state": 'Tamil Nadu',
-                "rating": 4.4,
-                "reviews": 3567,
-                "type": 'Private',
-                "category": 'Engineering',
-                "established": 1984,
-                "fees": 175000,
-                "placement": 1200000,
-                "ranking": 11,
-                "featured": False,
-                "courses": 52,
-                "students": 35000,
-                "image": '/api/placeholder/400/300'
-            },
-            {
-                "id": "14",
-                "name": 'Indian Statistical Institute',
-                "shortName": 'ISI Kolkata',
-                "location": 'Kolkata',
-                "state": 'West Bengal',
-                "rating": 4.7,
-                "reviews": 654,
-                "type": 'Public',
-                "category": 'Science & Research',
-                "established": 1931,
-                "fees": 100000,
-                "placement": 2400000,
-                "ranking": 3,
-                "featured": True,
-                "courses": 12,
-                "students": 900,
-                "image": '/api/placeholder/400/300'
+        """
+        One listing page. With ``cursor`` (the previous page's next_cursor)
+        the page is read by seeking past the last returned sort key and id,
+        so deep pages cost the same as the first; ``page`` is then ignored.
+        Raises ValueError for a cursor that does not match the request.
+        """
+        if settings.USE_MONGO_COLLEGES:
+            return await CollegeService.get_colleges_from_mongo(query, sort_criteria, page, page_size, cursor)
+
+        index = CollegeService.get_college_index()
+
+        sort_field, sort_order = sort_criteria[0] if sort_criteria else (None, -1)
+        cursor_sort = f"{sort_field or 'default'}:{sort_order}"
+        after = decode_cursor(cursor, cursor_sort) if cursor else None
+
+        rows, total = index.search(
+            search=query.get('name', {}).get('$regex'),
+            state=query.get('state'),
+            type=query.get('type'),
+            category=query.get('category'),
+            ranges={
+                field: (query[field].get('$gte'), query[field].get('$lte'))
+                for field in LIST_RANGE_FIELDS if field in query
             },
-            {
-                "id": "15",
-                "name": 'Amity University',
-                "shortName": 'Amity Noida',
-                "location": 'Noida',
-                "state": 'Uttar Pradesh',
-                "rating": 4.2,
-                "reviews": 4321,
-                "type": 'Private',
-                "category": 'Arts & Science',
-                "established": 2005,
-                "fees": 200000,
-                "placement": 600000,
-                "ranking": 20,
-                "featured": False,
-                "courses": 95,
-                "students": 45000,
-                "image": '/api/placeholder/400/300'
-            }
-        ]
+            sort_field=sort_field,
+            descending=sort_order == -1,
+            offset=(page - 1) * page_size,
+            # One extra row tells whether there is a next page
+            limit=page_size + 1,
+            after=after,
+        )
 
-        # Apply filters from query
-        filtered_colleges = all_colleges.copy()
+        next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            last = index.records[rows[-1]]
+            value = float(index.columns[sort_field][rows[-1]]) if sort_field in index.columns else None
+            next_cursor = encode_cursor(cursor_sort, value, last["id"])
 
-        # Name search filter (case-insensitive)
-        if 'name' in query and '$regex' in query['name']:
-            search_pattern = query['name']['$regex']
-            filtered_colleges = [
-                c for c in filtered_colleges
-                if re.search(search_pattern, c['name'], re.IGNORECASE)
-            ]
+        # Convert fees and placement back to string format for display
+        paginated_colleges = []
+        for row in rows:
+            college = dict(index.records[row])
+            college['fees'] = format_fees(college['fees'])
+            college['placement'] = format_package(college['placement'])
+            paginated_colleges.append(college)
 
-        # State filter
-        if 'state' in query:
-            filtered_colleges = [
-                c for c in filtered_colleges
-                if c['state'] == query['state']
-            ]
+        return CollegeListPageResponse(
+            colleges=paginated_colleges,
+            total=total,
+            page=page,
+            size=page_size,
+            next_cursor=next_cursor
+        )
 
-        # Type filter
-        if 'type' in query:
-            filtered_colleges = [
-                c for c in filtered_colleges
-                if c['type'] == query['type']
-            ]
+    @staticmethod
+    async def count_colleges(mongo_filter: dict) -> int:
+        """Count matching colleges, reusing the result for COLLEGE_COUNT_CACHE_TTL seconds"""
+        key = ("colleges:count", json.dumps(mongo_filter, sort_keys=True, default=str))
+        total = CollegeService._count_cache.get(key)
+        if total is None:
+            total = await CollegeCard.find(mongo_filter).count()
+            CollegeService._count_cache.set(key, total, len(key[1]))
+        return total
 
-        # Category filter
-        if 'category' in query:
-            filtered_colleges = [
-                c for c in filtered_colleges
-                if c['category'] == query['category']
-            ]
+    @staticmethod
+    async def get_colleges_from_mongo(
+        query: dict,
+        sort_criteria: Optional[List[Tuple[str, int]]],
+        page: int,
+        page_size: int,
+        cursor: Optional[str] = None
+    ) -> CollegeListPageResponse:
+        """
+        Listing page read from college_cards. Cards hold every listing field
+        as a top-level scalar, so a page is one scan of a card index with no
+        parsing per request. A cursor becomes a range on the (sort field, _id)
+        index keys instead of a skip.
+        """
+        mongo_filter = dict(query)
+        count_filter = dict(mongo_filter)
+        sort_field, sort_order = sort_criteria[0] if sort_criteria else ("rating", -1)
+        sort_path = LIST_SORT_FIELDS[sort_field]
+        sort = [(sort_path, sort_order), ("_id", 1)]
+        cursor_sort = f"{sort_field}:{sort_order}"
 
-        # Apply sorting
-        if sort_criteria:
-            sort_field, sort_order = sort_criteria[0]
-            reverse = sort_order == -1
-            filtered_colleges = sorted(
-                filtered_colleges,
-                key=lambda x: x.get(sort_field, 0),
-                reverse=reverse
-            )
-
-        # Calculate pagination
-        total = len(filtered_colleges)
-        total_pages = (total + page_size - 1) // page_size
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        paginated_colleges = filtered_colleges[start_idx:end_idx]
+        skip = (page - 1) * page_size
+        if cursor:
+            value, last_id = decode_cursor(cursor, cursor_sort)
+            mongo_filter = {"$and": [mongo_filter, keyset_filter(sort_path, sort_order, value, last_id)]}
+            skip = 0
 
-        # Convert fees and placement back to string format for display
-        for college in paginated_colleges:
-            print(college['name'])
-            college['fees'] = f"₹{college['fees'] / 100000:.1f} Lakhs"
-            college['placement'] = f"₹{college['placement'] / 100000:.0f} LPA"
+        cards = await CollegeCard.find(mongo_filter) \
+            .sort(sort) \
+            .skip(skip) \
+            .limit(page_size + 1) \
+            .to_list()
+        total = await CollegeService.count_colleges(count_filter)
+
+        next_cursor = None
+        if len(cards) > page_size:
+            cards = cards[:page_size]
+            last = cards[-1]
+            next_cursor = encode_cursor(cursor_sort, getattr(last, sort_path), last.id)
 
         return CollegeListPageResponse(
-            colleges=paginated_colleges,
+            colleges=[list_item_from_card(card) for card in cards],
             total=total,
             page=page,
-            size=page_size
+            size=page_size,
+            next_cursor=next_cursor
+        )
+
+    @staticmethod
+    async def find_college(college_id: int, sections: List[str]):
+        """Fetch the College with this public id, with only the fields the sections need"""
+        projection_model = college_projection_model(tuple(sections))
+        return await College.find_one(
+            {"college_id": college_id},
+            projection_model=projection_model
         )
 
     @staticmethod
-    async def get_college_data(college_id: int):
-        """Get complete college data by ID"""
-        college_data = {}
-        college_details = CollegeService.get_college_details(college_id)
-        college_fee_structure = CollegeService.get_fee_structure(college_id)
-        college_placements = CollegeService.get_placements(college_id)
-        college_branch_placements = CollegeService.get_branch_placements(college_id)
-        college_admissions = CollegeService.get_admissions(college_id)
-        college_academics = CollegeService.get_academics(college_id)
-        college_departments = CollegeService.get_departments(college_id)
-        college_infrastructure = CollegeService.get_infrastructure(college_id)
-        college_campus_experience = CollegeService.get_campus_experience(college_id)
-        college_clubs = CollegeService.get_clubs(college_id)
-        college_events = CollegeService.get_events(college_id)
-        college_gallery = CollegeService.get_gallery(college_id)
-        college_alumni = CollegeService.get_alumni(college_id)
-        college_scholarships = CollegeService.get_scholarships(college_id)
-        college_startups = CollegeService.get_startups(college_id)
-        college_social_media = CollegeService.get_social_media(college_id)
-        college_nearby_places = CollegeService.get_nearby_places(college_id)
+    async def get_college_data(college_id: int, sections: Optional[List[str]] = None) -> Optional[AggregationResult]:
+        """
+        Get college data by ID, optionally limited to the requested sections.
+        Sections that failed are None in ``data`` and named in ``errors``.
+        """
         # """Excluded data is college_ratings, college_reviews, news"""
+        if sections is None:
+            sections = list(COLLEGE_SECTIONS)
 
-        # Combine all data into a single dictionary
-        college_data["college_details"] = college_details
-        college_data["college_placements"] = college_placements
-        college_data["college_branch_placements"] = college_branch_placements
-        college_data["college_departments"] = college_departments
-        college_data["college_infrastructure"] = college_infrastructure
-        college_data["college_campus_experience"] = college_campus_experience
-        college_data["college_clubs"] = college_clubs
-        college_data["college_events"] = college_events
-        college_data["college_gallery"] = college_gallery
-        college_data["college_alumni"] = college_alumni
-        college_data["college_scholarships"] = college_scholarships
-        college_data["college_startups"] = college_startups
-        college_data["college_social_media"] = college_social_media
-        college_data["college_nearby_places"] = college_nearby_places
-        college_data["college_admissions"] = college_admissions
-        college_data["college_academics"] = college_academics
-        college_data["college_fee_structure"] = college_fee_structure
-
-        return college_data
+        fetch_college = None
+        if settings.USE_MONGO_COLLEGES:
+            # Read the document only when a section misses the cache, once for all of them
+            fetch_college = shared_call(functools.partial(CollegeService.find_college, college_id, sections))
+            section_builders = {
+                name: functools.partial(fetch_document_section, fetch_college, name) for name in COLLEGE_SECTIONS
+            }
+        else:
+            section_builders = {
+                name: functools.partial(builder, college_id) for name, builder in COLLEGE_SECTIONS.items()
+            }
+
+        builders = {
+            name: functools.partial(section_cache.get_or_build, college_id, name, section_builders[name])
+            for name in COLLEGE_SECTIONS
+            if name in sections
+        }
+        result = await SectionAggregator(timeout=settings.SECTION_TIMEOUT).gather(builders)
+        # Cached sections show the college exists; a failed build may mean it does not
+        if fetch_college is not None and result.errors and await fetch_college() is None:
+            return None
+        return result
 
 
     @staticmethod
@@ -1821,8 +1893,14 @@ class CollegeService:
         }
 
     @staticmethod
-    def get_news(college_id: int, search: Optional[str] = None, page: int = 1, limit: int = 10) -> dict:
-        """Get college news with filtering and pagination"""
+    def get_news(
+        college_id: int,
+        search: Optional[str] = None,
+        page: int = 1,
+        limit: int = 10,
+        cursor: Optional[str] = None
+    ) -> dict:
+        """Get college news, newest first, with filtering and page or cursor pagination"""
         all_news = [
             {"id": "n1", "title": "NITA hosts National Robotics Championship", "date": "2025-10-15", "category": "Events", "excerpt": "Students from 50+ colleges compete", "image": "https://picsum.photos/seed/news1/800/400"},
             {"id": "n2", "title": "Research paper published in Nature", "date": "2025-10-10", "category": "Research", "excerpt": "Faculty breakthrough in quantum computing", "image": "https://picsum.photos/seed/news2/800/400"},
@@ -1837,14 +1915,25 @@ class CollegeService:
         
         total = len(filtered_news)
         start_idx = (page - 1) * limit
+        if cursor:
+            # Ordered by (date desc, id asc); resume right after the cursor's item
+            date, last_id = decode_cursor(cursor, NEWS_CURSOR_SORT, str)
+            filtered_news = [n for n in filtered_news if n['date'] < date or (n['date'] == date and n['id'] > last_id)]
+            start_idx = 0
         end_idx = start_idx + limit
         paginated_news = filtered_news[start_idx:end_idx]
-        
+
+        next_cursor = None
+        if end_idx < len(filtered_news):
+            last = paginated_news[-1]
+            next_cursor = encode_cursor(NEWS_CURSOR_SORT, last['date'], last['id'])
+
         return {
             "items": paginated_news,
             "total": total,
             "page": page,
-            "limit": limit
+            "limit": limit,
+            "next_cursor": next_cursor
         }
 
     @staticmethod
@@ -2171,3 +2260,184 @@ class CollegeService:
                 'distance': '~4 km'}
             ]
         }
+
+
+# Sections of the college detail page, in response order
+COLLEGE_SECTIONS = {
+    "college_details": CollegeService.get_college_details,
+    "college_placements": CollegeService.get_placements,
+    "college_branch_placements": CollegeService.get_branch_placements,
+    "college_departments": CollegeService.get_departments,
+    "college_infrastructure": CollegeService.get_infrastructure,
+    "college_campus_experience": CollegeService.get_campus_experience,
+    "college_clubs": CollegeService.get_clubs,
+    "college_events": CollegeService.get_events,
+    "college_gallery": CollegeService.get_gallery,
+    "college_alumni": CollegeService.get_alumni,
+    "college_scholarships": CollegeService.get_scholarships,
+    "college_startups": CollegeService.get_startups,
+    "college_social_media": CollegeService.get_social_media,
+    "college_nearby_places": CollegeService.get_nearby_places,
+    "college_admissions": CollegeService.get_admissions,
+    "college_academics": CollegeService.get_academics,
+    "college_fee_structure": CollegeService.get_fee_structure,
+}
+
+# College document fields each section reads, used for Mongo projections
+COLLEGE_SECTION_FIELDS = {
+    "college_details": [
+        "name", "short_name", "description", "established_year",
+        "type", "category", "address", "contact",
+    ],
+    "college_placements": ["placement"],
+    "college_branch_placements": ["placement"],
+    "college_departments": ["academics.departments"],
+    "college_infrastructure": ["infrastructure"],
+    "college_campus_experience": ["infrastructure.hostel", "clubs", "events"],
+    "college_clubs": ["clubs"],
+    "college_events": ["events"],
+    "college_gallery": ["images"],
+    "college_alumni": ["alumni_network"],
+    "college_scholarships": ["scholarships"],
+    "college_startups": ["startups", "funding"],
+    "college_social_media": ["social_media"],
+    "college_nearby_places": ["nearby_places"],
+    "college_admissions": ["admission_process", "entrance_exams"],
+    "college_academics": ["academics"],
+    "college_fee_structure": ["fees"],
+}
+
+
+def parse_sections(value: Optional[str]) -> Optional[List[str]]:
+    """
+    Parse a comma-separated sections parameter.
+    Accepts both full names (college_placements) and short names (placements).
+    """
+    if not value:
+        return None
+    sections = []
+    for raw in value.split(","):
+        raw = raw.strip()
+        if not raw:
+            continue
+        name = raw if raw in COLLEGE_SECTIONS else f"college_{raw}"
+        if name not in COLLEGE_SECTIONS:
+            raise ValueError(f"Unknown section: {raw}")
+        if name not in sections:
+            sections.append(name)
+    return sections or None
+
+
+def shared_call(fn: Callable[[], Awaitable[Any]]) -> Callable[[], Awaitable[Any]]:
+    """Wrap fn so it runs at most once; every caller awaits the same result"""
+    task: Optional[asyncio.Future] = None
+
+    def call() -> Awaitable[Any]:
+        nonlocal task
+        if task is None:
+            task = asyncio.ensure_future(fn())
+        # One caller timing out must not cancel the fetch the others wait on
+        return asyncio.shield(task)
+
+    return call
+
+
+async def fetch_document_section(fetch_college: Callable[[], Awaitable[Any]], name: str) -> dict:
+    """Section builder for Mongo mode; raises SectionNotFound when the college does not exist"""
+    college = await fetch_college()
+    if college is None:
+        raise SectionNotFound("College not found")
+    return document_section(college, name)
+
+
+def document_section(college: BaseModel, name: str) -> dict:
+    """A detail section read from a projected College: its COLLEGE_SECTION_FIELDS, by last path part"""
+    section = {}
+    for path in COLLEGE_SECTION_FIELDS[name]:
+        value = college
+        for part in path.split("."):
+            value = value.get(part) if isinstance(value, dict) else getattr(value, part, None)
+            if value is None:
+                break
+        section[path.rsplit(".", 1)[-1]] = value
+    return section
+
+
+@functools.lru_cache(maxsize=256)
+def college_projection_model(sections: Tuple[str, ...]) -> Type[BaseModel]:
+    """Build (and cache) a Beanie projection model for a set of sections"""
+    paths = sorted({path for name in sections for path in COLLEGE_SECTION_FIELDS[name]})
+    # Drop paths already covered by a parent path (e.g. academics.departments under academics)
+    paths = [p for p in paths if not any(p.startswith(f"{q}.") for q in paths)]
+    top_level = sorted({p.split(".", 1)[0] for p in paths})
+
+    model = create_model(
+        "CollegeSectionsProjection",
+        id=(Optional[Any], Field(None, alias="_id")),
+        **{name: (Optional[Any], None) for name in top_level}
+    )
+    model.Settings = type("Settings", (), {"projection": {"_id": 1, **{p: 1 for p in paths}}})
+    return model
+
+
+# Listing sort parameters -> CollegeCard fields
+LIST_SORT_FIELDS = {
+    "rating": "rating",
+    "ranking": "best_rank",
+    "fees": "fees",
+    "placement": "placement",
+}
+# Numeric fields the listing can range-filter on, in rupees
+LIST_RANGE_FIELDS = ("fees", "placement")
+NEWS_CURSOR_SORT = "date:-1"
+
+
+def keyset_filter(field: str, direction: int, value: Any, last_id: str) -> dict:
+    """
+    Filter matching the documents after (value, last_id) in a
+    [(field, direction), ("_id", 1)] sort. Missing and null values sort
+    before everything else, i.e. last in a descending sort.
+    """
+    if PydanticObjectId.is_valid(last_id):
+        last_id = PydanticObjectId(last_id)
+    tie = {field: value, "_id": {"$gt": last_id}}
+    if value is None:
+        if direction == -1:
+            return tie
+        return {"$or": [{field: {"$ne": None}}, tie]}
+    if direction == -1:
+        return {"$or": [{field: {"$lt": value}}, tie, {field: None}]}
+    return {"$or": [{field: {"$gt": value}}, tie]}
+
+
+# Display strings for page rows only; amounts repeat a lot across colleges
+@functools.lru_cache(maxsize=4096)
+def format_fees(inr: Optional[int]) -> Optional[str]:
+    return f"₹{inr / 100000:.1f} Lakhs" if inr is not None else None
+
+
+@functools.lru_cache(maxsize=4096)
+def format_package(inr: Optional[int]) -> Optional[str]:
+    return f"₹{inr / 100000:.0f} LPA" if inr is not None else None
+
+
+def list_item_from_card(card: CollegeCard) -> dict:
+    """Shape a CollegeCard like the records CollegeListItem is built from"""
+    return {
+        "id": str(card.college_id if card.college_id is not None else card.id),
+        "name": card.name,
+        "shortName": card.short_name,
+        "location": card.city or "",
+        "state": card.state or "",
+        "rating": card.rating,
+        "reviews": card.reviews,
+        "type": card.type,
+        "category": card.category,
+        "established": card.established_year,
+        "fees": format_fees(card.fees),
+        "placement": format_package(card.placement),
+        "ranking": card.best_rank,
+        "featured": card.featured,
+        "students": card.students,
+        "image": card.logo,
+    }
@@ -0,0 +1,76 @@
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class LocalCache:
+    """
+    Bounded in-process LRU cache with a per-entry TTL.
+
+    The size limit is in bytes, using the size supplied by the caller for
+    each entry (typically the length of its serialized form).
+    """
+
+    def __init__(self, max_bytes: int, ttl: float):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()  # key -> (value, size, expires_at)
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is None or entry[2] <= time.monotonic():
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def set(self, key: Hashable, value: Any, size: int, ttl: Optional[float] = None):
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        self._entries[key] = (value, size, time.monotonic() + ttl)
+        self.current_bytes += size
+        while self.current_bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: Hashable):
+        _, size, _ = self._entries.pop(key)
+        self.current_bytes -= size
+
+    def delete(self, key: Hashable):
+        if key in self._entries:
+            self._remove(key)
+
+    def delete_prefix(self, prefix: str):
+        for key in [k for k in self._entries if isinstance(k, str) and k.startswith(prefix)]:
+            self._remove(key)
+
+    def clear(self):
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
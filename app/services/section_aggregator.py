@@ -0,0 +1,73 @@
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+
+from logger.RequestContextManager import RequestContextManager
+from logger.logging import file_logger
+
+SectionBuilder = Callable[[], Union[Any, Awaitable[Any]]]
+
+
+class SectionNotFound(LookupError):
+    """Raised by a builder when the entity its section belongs to does not exist"""
+
+
+@dataclass
+class AggregationResult:
+    data: Dict[str, Any] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+    timings_ms: Dict[str, float] = field(default_factory=dict)
+
+
+class SectionAggregator:
+    """
+    Runs section builders concurrently with a per-section timeout.
+
+    A section that times out or raises is returned as None and recorded in
+    ``errors`` as "timeout" or "error" so the rest of the response can still
+    be served; exception details are only logged, never returned. Builders
+    raise SectionNotFound for a missing entity, recorded as "not_found". Synchronous
+    builders run inline (they are expected to be CPU-only); builders that
+    return awaitables are awaited concurrently.
+    """
+
+    def __init__(self, timeout: Optional[float] = None):
+        self.timeout = timeout
+
+    async def _run(self, name: str, builder: SectionBuilder, result: AggregationResult):
+        start = time.perf_counter()
+        try:
+            value = builder()
+            if inspect.isawaitable(value):
+                value = await asyncio.wait_for(value, timeout=self.timeout)
+            result.data[name] = value
+        except asyncio.TimeoutError:
+            result.data[name] = None
+            result.errors[name] = "timeout"
+        except SectionNotFound:
+            # An expected outcome (the caller answers 404), not a failure to log
+            result.data[name] = None
+            result.errors[name] = "not_found"
+        except Exception as e:
+            result.data[name] = None
+            result.errors[name] = "error"
+            file_logger.error(
+                'Section build failed',
+                exc_info=True,
+                extra={'ctx': 'ERROR', 'message_content': f'Section {name} failed: {type(e).__name__}: {e}'}
+            )
+        finally:
+            result.timings_ms[name] = round((time.perf_counter() - start) * 1000, 3)
+            RequestContextManager.add_timing(f"section.{name}", result.timings_ms[name])
+
+    async def gather(self, builders: Dict[str, SectionBuilder]) -> AggregationResult:
+        """Build every section, preserving the key order of ``builders``"""
+        result = AggregationResult()
+        # Pre-seed keys so the output order does not depend on completion order
+        result.data = dict.fromkeys(builders)
+        await asyncio.gather(*(
+            self._run(name, builder, result) for name, builder in builders.items()
+        ))
+        return result
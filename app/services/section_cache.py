@@ -0,0 +1,396 @@
+import asyncio
+import inspect
+import json
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Union
+
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.db.redis import redis
+from app.services.local_cache import LocalCache
+
+SectionBuilder = Callable[[], Union[Any, Awaitable[Any]]]
+
+_MISSING = object()
+
+# Delete the lock only while it still holds our token, so a builder whose
+# lock expired cannot release a peer's lock
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# Move a college's version forward: to the write's timestamp, but always past
+# the current value, so every invalidation yields a new ETag even when the
+# write carries no newer updated_at
+BUMP_VERSION_SCRIPT = """
+local current = tonumber(redis.call('GET', KEYS[1]) or '0') or 0
+local version = math.max(current + 1, tonumber(ARGV[1]))
+redis.call('SET', KEYS[1], string.format('%d', version), 'EX', ARGV[2])
+return version
+"""
+
+# Store a rebuilt section only if the college version is still the one the
+# build started from; otherwise an invalidation happened during the build
+WRITE_IF_VERSION_SCRIPT = """
+if (redis.call('GET', KEYS[2]) or '') ~= ARGV[2] then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[3])
+return 1
+"""
+
+
+class SectionCache:
+    """
+    Read-through Redis cache for college detail sections.
+
+    One key is kept per (college_id, section). Entries carry a soft expiry:
+    once it passes the stale value is still served while a single background
+    rebuild refreshes it, until the hard Redis TTL drops the key. Concurrent
+    misses for the same key are coalesced into one rebuild, in-process via a
+    shared task and across workers via a short Redis lock. A rebuild that
+    overlaps an invalidation of its college is returned but not stored.
+
+    An optional in-process LocalCache sits in front of Redis for hot keys;
+    invalidations are broadcast over Redis pub/sub so every worker drops
+    its local copy.
+    """
+
+    LOCK_POLL_INTERVAL = 0.05  # seconds between checks while another worker rebuilds
+    INVALIDATION_CHANNEL = "college-section-invalidations"
+
+    def __init__(
+        self,
+        client,
+        ttl: int,
+        stale_ttl: int,
+        lock_ttl: int = 10,
+        retry_after: int = 30,
+        enabled: bool = True,
+        local: Optional[LocalCache] = None,
+    ):
+        self.client = client
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.lock_ttl = lock_ttl
+        self.retry_after = retry_after
+        self.enabled = enabled
+        self.local = local
+        self.hits = 0
+        self.misses = 0
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._unavailable_until = 0.0
+        self._listener: Optional[asyncio.Task] = None
+        # Invalidations seen by this worker, per college
+        self._epochs: Dict[str, int] = {}
+        # Used when Redis is unreachable; unique per worker process
+        self._fallback_version = str(time.time_ns() // 1_000_000)
+
+    @staticmethod
+    def key(college_id, section: str) -> str:
+        return f"college:{college_id}:section:{section}"
+
+    @staticmethod
+    def version_key(college_id) -> str:
+        return f"college:{college_id}:version"
+
+    @property
+    def available(self) -> bool:
+        return self.enabled and time.monotonic() >= self._unavailable_until
+
+    def _mark_unavailable(self):
+        # Back off instead of paying a failing round trip on every request
+        self._unavailable_until = time.monotonic() + self.retry_after
+
+    async def _read(self, key: str) -> Optional[dict]:
+        if not self.available:
+            return None
+        try:
+            raw = await self.client.get(key)
+        except (RedisError, OSError):
+            self._mark_unavailable()
+            return None
+        if not raw:
+            self.misses += 1
+            return None
+        self.hits += 1
+        entry = json.loads(raw)
+        fresh_for = entry["expires_at"] - time.time()
+        if self.local is not None and fresh_for > 0:
+            self.local.set(key, entry["value"], len(raw), ttl=fresh_for)
+        return entry
+
+    async def _stored_version(self, college_id) -> str:
+        """Version currently in Redis, "" when unset or unreachable"""
+        if not self.available:
+            return ""
+        try:
+            return await self.client.get(self.version_key(college_id)) or ""
+        except (RedisError, OSError):
+            self._mark_unavailable()
+            return ""
+
+    async def _write(self, college_id, key: str, value: Any, epoch: int, version: str):
+        if self._epochs.get(str(college_id), 0) != epoch:
+            return
+        raw = json.dumps({"value": value, "expires_at": time.time() + self.ttl})
+        if self.available:
+            try:
+                written = await self.client.eval(
+                    WRITE_IF_VERSION_SCRIPT, 2,
+                    key, self.version_key(college_id),
+                    raw, version, self.ttl + self.stale_ttl,
+                )
+            except (RedisError, OSError):
+                self._mark_unavailable()
+            else:
+                if not written:
+                    return
+        if self.local is not None:
+            self.local.set(key, value, len(raw))
+
+    async def _acquire_lock(self, key: str) -> Optional[str]:
+        """Return this builder's lock token, or None when a peer holds the lock"""
+        token = uuid.uuid4().hex
+        if not self.available:
+            return token
+        try:
+            acquired = await self.client.set(f"lock:{key}", token, nx=True, ex=self.lock_ttl)
+        except (RedisError, OSError):
+            self._mark_unavailable()
+            return token
+        return token if acquired else None
+
+    async def _release_lock(self, key: str, token: str):
+        if not self.available:
+            return
+        try:
+            await self.client.eval(RELEASE_LOCK_SCRIPT, 1, f"lock:{key}", token)
+        except (RedisError, OSError):
+            self._mark_unavailable()
+
+    async def _rebuild(self, college_id, key: str, builder: SectionBuilder, wait_for_peer: bool) -> Any:
+        epoch = self._epochs.get(str(college_id), 0)
+        version = await self._stored_version(college_id)
+        token = await self._acquire_lock(key)
+        if token is None:
+            if not wait_for_peer:
+                return None
+            # Another worker is rebuilding: wait for its value, then fall back to building
+            deadline = time.monotonic() + self.lock_ttl
+            while time.monotonic() < deadline:
+                await asyncio.sleep(self.LOCK_POLL_INTERVAL)
+                entry = await self._read(key)
+                if entry is not None:
+                    return entry["value"]
+        try:
+            value = builder()
+            if inspect.isawaitable(value):
+                value = await value
+            await self._write(college_id, key, value, epoch, version)
+            return value
+        finally:
+            if token is not None:
+                await self._release_lock(key, token)
+
+    def _single_flight(self, college_id, key: str, builder: SectionBuilder, wait_for_peer: bool = True) -> asyncio.Task:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._rebuild(college_id, key, builder, wait_for_peer))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        return task
+
+    def _forget(self, key: str, task: asyncio.Task):
+        self._inflight.pop(key, None)
+        # Mark background refresh failures as retrieved; foreground callers re-raise them
+        if not task.cancelled():
+            task.exception()
+
+    async def get_or_build(self, college_id, section: str, builder: SectionBuilder) -> Any:
+        """Return the cached section, building and storing it on a miss"""
+        if not self.enabled:
+            value = builder()
+            return await value if inspect.isawaitable(value) else value
+
+        key = self.key(college_id, section)
+        if self.local is not None:
+            self._ensure_listener()
+            value = self.local.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+
+        entry = await self._read(key)
+        if entry is not None:
+            if entry["expires_at"] <= time.time():
+                # Stale: serve it and let one background rebuild refresh the key
+                self._single_flight(college_id, key, builder, wait_for_peer=False)
+            return entry["value"]
+
+        # Shield so a caller timing out does not cancel the shared rebuild
+        return await asyncio.shield(self._single_flight(college_id, key, builder))
+
+    @property
+    def version_ttl(self) -> int:
+        # Outlives every section entry stored under the version
+        return self.ttl + self.stale_ttl
+
+    async def get_version(self, college_id) -> Optional[str]:
+        """
+        Opaque version token of a college's content, changed on every
+        invalidation. None until confirm_version has been called for the
+        college, so requests for unknown ids leave no keys behind.
+        """
+        key = self.version_key(college_id)
+        if self.local is not None:
+            version = self.local.get(key)
+            if version is not None:
+                return version
+
+        if not self.available:
+            return self._fallback_version
+        try:
+            # Reading keeps the version of a college in use alive
+            version = await self.client.getex(key, ex=self.version_ttl)
+        except (RedisError, OSError):
+            self._mark_unavailable()
+            return self._fallback_version
+
+        if version is not None and self.local is not None:
+            self.local.set(key, version, len(version))
+        return version
+
+    async def confirm_version(self, college_id) -> str:
+        """
+        Version of a college known to exist, initialised on first use so all
+        workers agree on it.
+        """
+        version = await self.get_version(college_id)
+        if version is not None:
+            return version
+
+        key = self.version_key(college_id)
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.set(key, str(time.time_ns() // 1_000_000), nx=True, ex=self.version_ttl)
+            pipe.get(key)
+            _, version = await pipe.execute()
+        except (RedisError, OSError):
+            self._mark_unavailable()
+        if version is None:
+            return self._fallback_version
+
+        if self.local is not None:
+            self.local.set(key, version, len(version))
+        return version
+
+    async def invalidate(
+        self,
+        college_id,
+        sections: Optional[Iterable[str]] = None,
+        updated_at: Optional[datetime] = None,
+    ):
+        """
+        Drop cached sections of a college (all of them when sections is None)
+        and move its version forward: to the later of now and updated_at, and
+        always past the current version.
+        """
+        sections = list(sections) if sections is not None else None
+        self._drop_local(college_id, sections)
+        version = time.time_ns() // 1_000_000
+        if updated_at is not None:
+            if updated_at.tzinfo is None:
+                updated_at = updated_at.replace(tzinfo=timezone.utc)
+            version = max(version, int(updated_at.timestamp() * 1000))
+        if not self.available:
+            # Without Redis every college shares this worker's fallback version
+            self._fallback_version = str(max(version, int(self._fallback_version) + 1))
+            return
+        try:
+            await self.client.eval(BUMP_VERSION_SCRIPT, 1, self.version_key(college_id), version, self.version_ttl)
+            if sections is None:
+                keys = [k async for k in self.client.scan_iter(match=self.key(college_id, "*"))]
+            else:
+                keys = [self.key(college_id, section) for section in sections]
+            if keys:
+                await self.client.delete(*keys)
+            if self.local is not None:
+                message = {"college_id": college_id, "sections": sections}
+                await self.client.publish(self.INVALIDATION_CHANNEL, json.dumps(message, default=str))
+        except (RedisError, OSError):
+            self._mark_unavailable()
+
+    def _drop_local(self, college_id, sections: Optional[List[str]]):
+        # Rebuilds already running for this college must not store their result
+        self._epochs[str(college_id)] = self._epochs.get(str(college_id), 0) + 1
+        if self.local is None:
+            return
+        self.local.delete(self.version_key(college_id))
+        if sections is None:
+            self.local.delete_prefix(self.key(college_id, ""))
+        else:
+            for section in sections:
+                self.local.delete(self.key(college_id, section))
+
+    def start(self):
+        """Start listening for invalidations from other workers"""
+        if self.local is not None:
+            self._ensure_listener()
+
+    def _ensure_listener(self):
+        if (self._listener is None or self._listener.done()) and self.available:
+            self._listener = asyncio.ensure_future(self._listen())
+
+    async def _listen(self):
+        """Apply invalidations published by other workers to the local tier"""
+        pubsub = self.client.pubsub()
+        try:
+            await pubsub.subscribe(self.INVALIDATION_CHANNEL)
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                data = json.loads(message["data"])
+                self._drop_local(data["college_id"], data["sections"])
+        except (RedisError, OSError):
+            self._mark_unavailable()
+            # Invalidations may have been missed while disconnected
+            self.local.clear()
+        finally:
+            await pubsub.aclose()
+
+    async def stop(self):
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "local": self.local.stats() if self.local is not None else None,
+            "redis": {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            },
+        }
+
+section_cache = SectionCache(
+    redis,
+    ttl=settings.SECTION_CACHE_TTL,
+    stale_ttl=settings.SECTION_CACHE_STALE_TTL,
+    enabled=settings.SECTION_CACHE_ENABLED,
+    local=LocalCache(
+        max_bytes=settings.LOCAL_CACHE_MAX_BYTES,
+        ttl=settings.LOCAL_CACHE_TTL,
+    ) if settings.LOCAL_CACHE_ENABLED else None,
+)
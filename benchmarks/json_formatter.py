@@ -0,0 +1,81 @@
+"""
+Micro-benchmark of JsonFormatter on a request log record: the previous
+formatter (strftime of the current time, json.dumps, headers pre-serialized
+into the message) against the current one (cached second prefix, orjson,
+headers passed as a structured payload).
+
+    python -m benchmarks.json_formatter [--records 100000]
+"""
+import argparse
+import json
+import logging
+import timeit
+
+from logger.RequestContextManager import RequestContextManager
+from logger.logging import JsonFormatter
+from utility.utils import current_utc_time
+
+HEADERS = {
+    "host": "api.example.com",
+    "user-agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36",
+    "accept": "application/json",
+    "accept-encoding": "gzip, deflate, br",
+    "accept-language": "en-IN,en;q=0.9",
+    "authorization": "Bearer " + "x" * 900,
+    "x-hash-key": "abc123",
+}
+ENTRY = {
+    "request_id": "6f1c2f9e-4c1e-4a36-9a8e-0d2b6b1b9a01",
+    "method": "GET",
+    "url": "http://api.example.com/api/v1/colleges/?page=2",
+    "client_host": "10.0.0.12",
+    "headers": HEADERS,
+}
+
+
+class LegacyJsonFormatter(logging.Formatter):
+    def format(self, record):
+        log_record = {
+            "ts": current_utc_time().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3],
+            "lv": record.levelname,
+            "request_id": RequestContextManager.get_request_id(),
+            "hash_key": getattr(record, 'hash_key', 'no-hash-key'),
+            "sIp": getattr(record, 'sIp', 'unknown'),
+            "fl": record.filename,
+            "fn": record.funcName,
+            "ln": record.lineno,
+            "message_content": getattr(record, 'message_content', record.getMessage()),
+            "ctx": getattr(record, 'ctx', '')
+        }
+        return json.dumps(log_record)
+
+
+def make_record(msg: str, **extra) -> logging.LogRecord:
+    record = logging.LogRecord("request_response", logging.INFO, __file__, 1, msg, None, None, "log_request")
+    record.__dict__.update(extra)
+    return record
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=100000)
+    args = parser.parse_args()
+
+    legacy = LegacyJsonFormatter()
+    current = JsonFormatter()
+
+    # The legacy path also paid for serializing the entry into the message
+    legacy_time = timeit.timeit(
+        lambda: legacy.format(make_record(f"Incoming Request: {json.dumps(ENTRY)}")),
+        number=args.records
+    )
+    current_time = timeit.timeit(
+        lambda: current.format(make_record("Incoming Request", payload=ENTRY)),
+        number=args.records
+    )
+    for label, total in (("legacy", legacy_time), ("current", current_time)):
+        print(f"{label:>8}: {total / args.records * 1e6:.2f} us/record")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Per-request latency (p50/p99) through LoggingMiddleware with logging off,
+with synchronous file/console handlers on the event loop, and with the
+queued batching pipeline.
+
+    python -m benchmarks.logging_latency [--requests 3000] [--stall-ms 20 --stall-every 200]
+
+Log output goes to a temporary directory; console output is discarded.
+--stall-ms simulates a disk stall on every Nth flush of the log file.
+"""
+import argparse
+import asyncio
+import io
+import logging
+import os
+import statistics
+import tempfile
+import time
+
+import httpx
+from fastapi import FastAPI
+
+from logger.log_pipeline import BatchingQueueListener, BoundedQueueHandler
+from logger.logging import JsonFormatter, LoggingMiddleware, RequestResponseLogger, file_logger
+
+LOGGERS = (file_logger, logging.getLogger("request_response"))
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    app.add_middleware(LoggingMiddleware, request_response_logger=RequestResponseLogger())
+    return app
+
+
+class StallingFileHandler(logging.FileHandler):
+    def __init__(self, filename: str, stall_ms: float, stall_every: int):
+        super().__init__(filename)
+        self.stall_ms = stall_ms
+        self.stall_every = stall_every
+        self.flushes = 0
+
+    def flush(self):
+        super().flush()
+        self.flushes += 1
+        if self.stall_ms and self.flushes % self.stall_every == 0:
+            time.sleep(self.stall_ms / 1000)
+
+
+def make_handlers(log_dir: str, stall_ms: float, stall_every: int):
+    file_handler = StallingFileHandler(os.path.join(log_dir, "bench.json"), stall_ms, stall_every)
+    console_handler = logging.StreamHandler(io.StringIO())
+    for handler in (file_handler, console_handler):
+        handler.setFormatter(JsonFormatter())
+    return file_handler, console_handler
+
+
+def use_handlers(*handlers: logging.Handler):
+    for logger in LOGGERS:
+        logger.handlers = list(handlers)
+        logger.setLevel(logging.INFO if handlers else logging.CRITICAL)
+
+
+async def measure(requests: int) -> list:
+    transport = httpx.ASGITransport(app=build_app())
+    latencies = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(100):
+            await client.get("/ping")
+        for _ in range(requests):
+            start = time.perf_counter()
+            await client.get("/ping")
+            latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def report(label: str, latencies: list):
+    cuts = statistics.quantiles(latencies, n=100)
+    print(f"{label:>10}: p50 {cuts[49]:.3f} ms   p99 {cuts[98]:.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--stall-ms", type=float, default=0)
+    parser.add_argument("--stall-every", type=int, default=200)
+    args = parser.parse_args()
+
+    original = {logger: (logger.handlers, logger.level) for logger in LOGGERS}
+    with tempfile.TemporaryDirectory() as log_dir:
+        use_handlers()
+        report("off", asyncio.run(measure(args.requests)))
+
+        use_handlers(*make_handlers(log_dir, args.stall_ms, args.stall_every))
+        report("sync", asyncio.run(measure(args.requests)))
+
+        queue_handler = BoundedQueueHandler(maxsize=10000)
+        listener = BatchingQueueListener(queue_handler.queue, *make_handlers(log_dir, args.stall_ms, args.stall_every))
+        listener.start()
+        use_handlers(queue_handler)
+        report("queued", asyncio.run(measure(args.requests)))
+        listener.stop()
+
+    for logger, (handlers, level) in original.items():
+        logger.handlers = handlers
+        logger.setLevel(level)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+"""
+Requests/sec on /api/v1/colleges/ through the middleware stack, comparing the
+BaseHTTPMiddleware implementations of the baseline commit with the pure ASGI
+ones.
+
+    pip install -r requirements-dev.txt  # httpx
+    python -m benchmarks.middleware_stack [--requests 2000] [--concurrency 20] [--with-logging]
+
+The baseline modules cannot be imported as they were (they import from
+app.middleware.logger, which never existed in this tree). Their classes are
+therefore copied below with the dispatch bodies unchanged and only the
+imports pointed at logger.*. That includes the baseline RequestResponseLogger,
+whose log_response signature differs from the current one.
+
+File logging is silenced by default so the numbers reflect middleware overhead
+rather than disk I/O.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import time
+import uuid
+from typing import Callable, List
+
+import httpx
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import JSONResponse
+from pydantic import ValidationError
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp
+
+from app.api.v1.api import api_router
+from app.core.auth_dependency import validate_token
+from app.core.middleware import FirebaseAuthMiddleware
+from error_handler.error_handling_middleware import ErrorHandlingMiddleware
+from logger.RequestContextManager import RequestContextManager
+from logger.error_logger import ErrorLogger
+from logger.logging import LoggingMiddleware, RequestResponseLogger, file_logger
+from utility.utils import current_utc_time
+
+PUBLIC_PATHS = ["/api/v1/colleges"]
+
+
+# Baseline (19ea38d) app/core/middleware.py
+class BaselineFirebaseAuthMiddleware(BaseHTTPMiddleware):
+    def __init__(
+        self, 
+        app: ASGIApp, 
+        public_paths: List[str] = None
+    ):
+        super().__init__(app)
+        self.public_paths = public_paths or [
+            "/health",
+            "/docs",
+            "/redoc",
+        ]
+
+    async def dispatch(self, request: Request, call_next):
+        # Skip authentication for public paths
+        if any(request.url.path.startswith(path) for path in self.public_paths):
+            return await call_next(request)
+
+        # Get token from header
+        auth_header = request.headers.get('Authorization')
+        if not auth_header or not auth_header.startswith('Bearer '):
+            raise HTTPException(
+                status_code=401,
+                detail="Missing or invalid authentication token",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        token = auth_header.split(' ')[1]
+        
+        # Validate token and get user data
+        user = await validate_token(token)
+        
+        # Initialize state with user data
+        if not hasattr(request.state, '_state'):
+            request.state._state = {}
+        request.state._state['user'] = user
+
+        # Continue processing the request
+        response = await call_next(request)
+        return response
+
+
+# Baseline (19ea38d) error_handler/error_handling_middleware.py
+class BaselineErrorHandlingMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        try:
+            response = await call_next(request)
+            return response
+
+        except HTTPException as http_exc:
+            # Handle HTTP exceptions (4xx, 5xx status codes)
+            file_logger.error(f"HTTPException: {http_exc.detail}")
+            return JSONResponse(
+                status_code=http_exc.status_code,
+                content={"error": http_exc.detail}
+            )
+
+        except ValidationError as val_exc:
+            # Handle Pydantic validation errors
+            file_logger.error(f"ValidationError: {val_exc.errors()}")
+            return JSONResponse(
+                status_code=422,
+                content={"error": "Validation Error", "detail": val_exc.errors()}
+            )
+
+        except Exception as exc:
+            # Handle any other unexpected errors
+            file_logger.error(f"Internal Server Error: {str(exc)}")
+            return JSONResponse(
+                status_code=500,
+                content={
+                    "error": "Internal Server Error",
+                    "detail": str(exc)
+                }
+            )
+
+
+# Baseline (19ea38d) logger/logging.py
+class BaselineRequestResponseLogger:
+    def __init__(self):
+        self.logger = logging.getLogger('request_response')
+
+    def log_request(self, request: Request, request_id: str):
+        log_entry = {
+            'timestamp': current_utc_time().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3],
+            'request_id': request_id,
+            'method': request.method,
+            'url': str(request.url),
+            'client_host': request.client.host if request.client else None,
+            'headers': dict(request.headers)
+        }
+        self.logger.info(f"Incoming Request: {json.dumps(log_entry)}")
+
+    def log_response(self, request: Request, response: Response, duration: float, request_id: str):
+        log_entry = {
+            'timestamp': current_utc_time().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3],
+            'request_id': request_id,
+            'method': request.method,
+            'url': str(request.url),
+            'status_code': response.status_code,
+            'duration_ms': duration,
+            'response_headers': dict(response.headers)
+        }
+        self.logger.info(f"Outgoing Response: {json.dumps(log_entry)}")
+
+
+class BaselineLoggingMiddleware(BaseHTTPMiddleware):
+    def __init__(self, app, request_response_logger: BaselineRequestResponseLogger):
+        super().__init__(app)
+        self.request_response_logger = request_response_logger
+        self.error_logger = ErrorLogger()
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        # Generate request_id and get hash_key
+        request_id = str(uuid.uuid4())
+        hash_key = request.headers.get('X-Hash-Key', 'no-hash-key')
+
+        RequestContextManager.set_request_id(request_id)
+
+        sIp = request.client.host if request.client else "unknown"
+
+        try:
+            file_logger.info("Request started", extra={
+                "sIp": sIp,
+                "ctx": "REQUEST",
+                "message_content": f"{request.method} {request.url}",
+                "request_id": request_id,
+                "hash_key": hash_key
+            })
+
+            self.request_response_logger.log_request(request, request_id)
+
+            start_time = time.time()
+            response = await call_next(request)
+            duration = (time.time() - start_time) * 1000
+
+            file_logger.info("Request completed", extra={
+                "sIp": sIp,
+                "ctx": "RESPONSE",
+                "message_content": f"{request.method} {request.url} completed in {duration:.2f}ms with status {response.status_code}",
+                "request_id": request_id,
+                "hash_key": hash_key
+            })
+
+            self.request_response_logger.log_response(request, response, duration, request_id)
+            return response
+        except Exception as e:
+            file_logger.exception("Request failed", extra={
+                "sIp": sIp,
+                "ctx": "ERROR",
+                "message_content": str(e),
+                "request_id": request_id,
+                "hash_key": hash_key
+            })
+            self.error_logger.log_error(e, request_id)
+            raise
+
+
+def build_app(baseline: bool) -> FastAPI:
+    app = FastAPI()
+    app.include_router(api_router, prefix="/api/v1")
+    if baseline:
+        app.add_middleware(BaselineFirebaseAuthMiddleware, public_paths=PUBLIC_PATHS)
+        app.add_middleware(BaselineErrorHandlingMiddleware)
+        app.add_middleware(BaselineLoggingMiddleware, request_response_logger=BaselineRequestResponseLogger())
+    else:
+        app.add_middleware(FirebaseAuthMiddleware, public_paths=PUBLIC_PATHS)
+        app.add_middleware(ErrorHandlingMiddleware)
+        app.add_middleware(LoggingMiddleware, request_response_logger=RequestResponseLogger())
+    return app
+
+
+async def run(app: FastAPI, requests: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker(n: int):
+            for _ in range(n):
+                response = await client.get("/api/v1/colleges/", params={"limit": 10})
+                response.raise_for_status()
+
+        await worker(50)  # warm up
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(requests // concurrency) for _ in range(concurrency)))
+        return (requests // concurrency * concurrency) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--with-logging", action="store_true")
+    args = parser.parse_args()
+
+    if not args.with_logging:
+        file_logger.setLevel(logging.WARNING)
+
+    for label, baseline in (("baseline", True), ("pure ASGI", False)):
+        rps = asyncio.run(run(build_app(baseline), args.requests, args.concurrency))
+        print(f"{label:>20}: {rps:8.1f} req/s")
+
+
+if __name__ == "__main__":
+    main()
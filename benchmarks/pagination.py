@@ -0,0 +1,107 @@
+"""
+Listing latency for page 1 and a deep page, reached by page/limit (offset)
+and by next_cursor (keyset seek).
+
+    python -m benchmarks.pagination [--records 100000] [--page 500] [--limit 20] [--repeat 200] [--mongo]
+
+By default the in-memory CollegeIndex is filled with synthetic colleges.
+With --mongo the listing runs against the configured database instead
+(USE_MONGO_COLLEGES path); it needs at least page * limit listed colleges.
+That is where offsets hurt: skip walks every earlier index entry, while a
+cursor seeks straight to the page.
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from app.core.config import settings
+from app.services.college_index import CollegeIndex
+from app.services.college_service import CollegeService
+
+STATES = ["Delhi", "Karnataka", "Maharashtra", "Tamil Nadu", "Gujarat", "Uttar Pradesh"]
+CATEGORIES = ["Engineering", "Medical", "Management", "Law", "Arts & Science"]
+
+
+def synthetic_colleges(count: int) -> list:
+    rng = random.Random(42)
+    return [
+        {
+            "id": str(i),
+            "name": f"College {i}",
+            "shortName": f"C{i}",
+            "location": "City",
+            "state": rng.choice(STATES),
+            "rating": round(rng.uniform(3, 5), 1),
+            "reviews": rng.randint(0, 5000),
+            "type": rng.choice(["Public", "Private"]),
+            "category": rng.choice(CATEGORIES),
+            "established": rng.randint(1850, 2020),
+            "fees": rng.randint(20, 2500) * 1000,
+            "placement": rng.randint(300, 3500) * 1000,
+            "ranking": rng.randint(1, 500),
+            "featured": False,
+            "courses": 10,
+            "students": 1000,
+            "image": "",
+        }
+        for i in range(count)
+    ]
+
+
+async def time_call(repeat: int, **kwargs) -> float:
+    await CollegeService.get_colleges(**kwargs)  # warm up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await CollegeService.get_colleges(**kwargs)
+    return (time.perf_counter() - start) / repeat
+
+
+async def run(args):
+    sort_criteria = [("rating", -1)]
+    common = {"query": {}, "sort_criteria": sort_criteria, "page_size": args.limit}
+    # The cursor that follows page - 1 leads to the same rows as page
+    previous = await CollegeService.get_colleges(page=args.page - 1, **common)
+    deep_cursor = previous.next_cursor
+
+    cases = (
+        ("offset page 1", {"page": 1}),
+        (f"offset page {args.page}", {"page": args.page}),
+        ("cursor page 1", {"page": 1, "cursor": None}),
+        (f"cursor page {args.page}", {"page": 1, "cursor": deep_cursor}),
+    )
+    for label, kwargs in cases:
+        seconds = await time_call(args.repeat, **common, **kwargs)
+        print(f"{label:>18}: {seconds * 1000:8.3f} ms/page")
+
+
+async def run_mongo(args):
+    from app.db.mongo import close_mongo_connection, connect_to_mongo
+
+    await connect_to_mongo()
+    try:
+        await run(args)
+    finally:
+        await close_mongo_connection()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=100000)
+    parser.add_argument("--page", type=int, default=500)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--mongo", action="store_true")
+    args = parser.parse_args()
+
+    if args.mongo:
+        settings.USE_MONGO_COLLEGES = True
+        asyncio.run(run_mongo(args))
+    else:
+        settings.USE_MONGO_COLLEGES = False
+        CollegeService._college_index = CollegeIndex(synthetic_colleges(args.records))
+        asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,38 +1,63 @@
-from fastapi import Request, HTTPException
+from fastapi import HTTPException
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from pydantic import ValidationError
-from app.middleware.logger.logging import file_logger
+from logger.logging import file_logger
+
+class ErrorHandlingMiddleware:
+    """Pure ASGI middleware mapping uncaught exceptions to JSON error responses"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
 
-class ErrorHandlingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
         try:
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send_wrapper)
+            return
 
         except HTTPException as http_exc:
+            if response_started:
+                raise
             # Handle HTTP exceptions (4xx, 5xx status codes)
             file_logger.error(f"HTTPException: {http_exc.detail}")
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=http_exc.status_code,
                 content={"error": http_exc.detail}
             )
 
         except ValidationError as val_exc:
+            if response_started:
+                raise
             # Handle Pydantic validation errors
             file_logger.error(f"ValidationError: {val_exc.errors()}")
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=422,
                 content={"error": "Validation Error", "detail": val_exc.errors()}
             )
 
         except Exception as exc:
-            # Handle any other unexpected errors
-            file_logger.error(f"Internal Server Error: {str(exc)}")
-            return JSONResponse(
+            if response_started:
+                raise
+            # Handle any other unexpected errors; details stay in the server log
+            file_logger.error("Internal Server Error", exc_info=True, extra={
+                "ctx": "ERROR",
+                "message_content": f"{type(exc).__name__}: {exc}"
+            })
+            response = JSONResponse(
                 status_code=500,
-                content={
-                    "error": "Internal Server Error",
-                    "detail": str(exc)
-                }
-            )
\ No newline at end of file
+                content={"error": "Internal Server Error"}
+            )
+
+        await response(scope, receive, send)
@@ -1,9 +1,15 @@
 import contextvars
+import re
+from typing import Dict, List, Optional, Tuple
+
+_SERVER_TIMING_INVALID = re.compile(r"[^A-Za-z0-9!#$%&'*+\-.^_`|~]")
 
 class RequestContextManager:
     _request_id_var = contextvars.ContextVar('request_id', default='')
     _client_code_var = contextvars.ContextVar('client_code', default='')
     _user_id_var = contextvars.ContextVar('user_id', default='')
+    # List of (name, duration_ms) spans; shared by reference with tasks spawned by the request
+    _timings_var = contextvars.ContextVar('timings', default=None)
 
     @staticmethod
     def set_user_id(user_id: str):
@@ -29,8 +35,47 @@ class RequestContextManager:
     def get_request_id() -> str:
         return RequestContextManager._request_id_var.get()
 
+    @staticmethod
+    def start_timings():
+        RequestContextManager._timings_var.set([])
+
+    @staticmethod
+    def add_timing(name: str, duration_ms: float):
+        """Record a span for the current request; a no-op outside of one"""
+        timings = RequestContextManager._timings_var.get()
+        if timings is not None:
+            timings.append((name, duration_ms))
+
+    @staticmethod
+    def get_timings() -> List[Tuple[str, float]]:
+        return RequestContextManager._timings_var.get() or []
+
+    @staticmethod
+    def summarize_timings(timings: List[Tuple[str, float]]) -> Dict[str, Dict[str, float]]:
+        """Total duration and count per span name"""
+        summary: Dict[str, Dict[str, float]] = {}
+        for name, duration_ms in timings:
+            entry = summary.setdefault(name, {"dur": 0.0, "count": 0})
+            entry["dur"] = round(entry["dur"] + duration_ms, 3)
+            entry["count"] += 1
+        return summary
+
+    @staticmethod
+    def server_timing_header(summary: Dict[str, Dict[str, float]], total_ms: Optional[float] = None, limit: int = 32) -> str:
+        """Format a timing summary as a Server-Timing header value"""
+        parts = []
+        for name, entry in list(summary.items())[:limit]:
+            metric = f"{_SERVER_TIMING_INVALID.sub('_', name)};dur={entry['dur']:.1f}"
+            if entry["count"] > 1:
+                metric += f';desc="x{entry["count"]}"'
+            parts.append(metric)
+        if total_ms is not None:
+            parts.append(f"total;dur={total_ms:.1f}")
+        return ", ".join(parts)
+
     @staticmethod
     def clear_request_context():
         RequestContextManager._request_id_var.set('')
         RequestContextManager._client_code_var.set('')
         RequestContextManager._user_id_var.set('')
+        RequestContextManager._timings_var.set(None)
@@ -1,7 +1,10 @@
+import logging
 import uuid
 from functools import wraps
 from typing import Any, Callable, TypeVar, ParamSpec, Coroutine
-from app.middleware.logger.logging import file_logger
+from app.core.metrics import observe_db_operation
+from logger.logging import file_logger
+from logger.RequestContextManager import RequestContextManager
 
 from utility.utils import current_utc_time
 
@@ -21,11 +24,14 @@ def log_database_query(func: Callable[P, Coroutine[Any, Any, T]]) -> Callable[P,
         # Log query start
         start_time = current_utc_time()
         query_id = uuid.uuid4()
+        # Skip building the messages entirely when INFO is discarded
+        log_info = file_logger.isEnabledFor(logging.INFO)
         
-        file_logger.info(
-            f"DB Query Start | query_id: {query_id} | Collection: {collection_name} | "
-            f"Operation: {operation}"
-        )
+        if log_info:
+            file_logger.info(
+                f"DB Query Start | query_id: {query_id} | Collection: {collection_name} | "
+                f"Operation: {operation}"
+            )
 
         try:
             # Execute the database operation
@@ -33,12 +39,15 @@ def log_database_query(func: Callable[P, Coroutine[Any, Any, T]]) -> Callable[P,
             
             # Calculate execution time in milliseconds
             query_time = (current_utc_time() - start_time).total_seconds() * 1000 
+            RequestContextManager.add_timing(f"db.{operation}", query_time)
+            observe_db_operation(collection_name, operation, query_time)
             
             # Log successful query completion
-            file_logger.info(
-                f"DB Query Complete | query_id: {query_id} | Collection: {collection_name} | "
-                f"Operation: {operation} | query_time_ms: {query_time:.2f}"
-            )
+            if log_info:
+                file_logger.info(
+                    f"DB Query Complete | query_id: {query_id} | Collection: {collection_name} | "
+                    f"Operation: {operation} | query_time_ms: {query_time:.2f}"
+                )
             
             return result
             
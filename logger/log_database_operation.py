@@ -1,45 +1,67 @@
-from app.middleware.logger.logging import file_logger
-from utility.utils import current_utc_time
+from app.core.config import settings
+from app.core.metrics import observe_db_operation, observe_slow_query
+from logger.logging import file_logger
+from logger.query_fingerprint import fingerprint
+from logger.RequestContextManager import RequestContextManager
 
 
 import functools
-import json
+import logging
 import time
 
 
 def log_database_operation(operation: str):
+    """
+    Time a database call, record it in the request's timings and the DB
+    latency histogram, and log it. The log payload, including the query
+    fingerprint, is only built when the logger is enabled for the record's
+    level; calls slower than DB_SLOW_QUERY_MS are logged as WARNING.
+    """
     def decorator(func):
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.perf_counter()
             try:
                 result = await func(*args, **kwargs)
-                # Extract collection name from self if available
-                collection_name = args[0].collection.name if len(args) > 0 and hasattr(args[0], 'collection') else 'unknown'
+            except Exception as e:
+                file_logger.error(
+                    'Error in database operation',
+                    exc_info=True,
+                    extra={'operation': operation, 'message_content': str(e), 'ctx': 'ERROR'}
+                )
+                raise
+
+            duration = (time.perf_counter() - start_time) * 1000
+            # Extract collection name from self if available
+            collection_name = args[0].collection.name if len(args) > 0 and hasattr(args[0], 'collection') else 'unknown'
+            RequestContextManager.add_timing(f"db.{operation}", duration)
+            observe_db_operation(collection_name, operation, duration)
 
+            slow = duration >= settings.DB_SLOW_QUERY_MS
+            if slow:
+                observe_slow_query(collection_name, operation)
+            level = logging.WARNING if slow else logging.INFO
+            if file_logger.isEnabledFor(level):
                 # Retrieve the MongoDB query from the function arguments
                 query = next((arg for arg in args if isinstance(arg, dict)), {})
                 if not query:
                     query = next((value for value in kwargs.values() if isinstance(value, dict)), {})
-
-                duration = (time.time() - start_time) * 1000
+                shape, query_hash = fingerprint(query)
 
                 log_entry = {
                     'operation': operation,
                     'collection': collection_name,
-                    'duration_ms': duration,
-                    'timestamp': current_utc_time().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3],
-                    'query': json.dumps(query) if query else '{}',
+                    'duration_ms': round(duration, 3),
+                    'query_shape': shape,
+                    'query_hash': query_hash,
+                    'slow': slow,
                 }
-                file_logger.info(f'Database Operation: {json.dumps(log_entry)}', extra={'ctx': 'DB_OPERATION'})
-                return result
-            except Exception as e:
-                file_logger.error(
-                    'Error in database operation',
-                    exc_info=True,
-                    extra={'operation': operation, 'message_content': str(e), 'ctx': 'ERROR'}
+                file_logger.log(
+                    level,
+                    'Slow Database Operation' if slow else 'Database Operation',
+                    extra={'ctx': 'DB_OPERATION', 'payload': log_entry}
                 )
-                raise
+            return result
 
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
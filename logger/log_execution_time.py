@@ -1,4 +1,5 @@
-from app.middleware.logger.logging import file_logger
+from logger.logging import file_logger
+from logger.RequestContextManager import RequestContextManager
 
 import asyncio
 import functools
@@ -19,6 +20,7 @@ def log_execution_time(func: Callable) -> Callable:
             return result
         finally:
             execution_time = time.time() - start_time
+            RequestContextManager.add_timing(func.__name__, execution_time * 1000)
             file_logger.info(
                 f"{func.__module__}.{func.__name__} executed in {execution_time:.2f} seconds",
                 extra={
@@ -35,6 +37,7 @@ def log_execution_time(func: Callable) -> Callable:
             return result
         finally:
             execution_time = time.time() - start_time
+            RequestContextManager.add_timing(func.__name__, execution_time * 1000)
             file_logger.info(
                 f"{func.__module__}.{func.__name__} executed in {execution_time:.2f} seconds",
                 extra={
@@ -0,0 +1,157 @@
+import logging
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler
+from typing import List
+
+from logger.RequestContextManager import RequestContextManager
+
+OVERFLOW_DROP = "drop"
+OVERFLOW_SAMPLE = "sample"
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    Non-blocking QueueHandler with an overflow policy.
+
+    Records are enqueued unformatted; formatting and I/O happen on the
+    listener thread. ``drop`` discards records only once the queue is full.
+    ``sample`` additionally keeps just one in ``sample_every`` records below
+    WARNING once the queue passes ``high_watermark`` of its capacity.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        overflow: str = OVERFLOW_DROP,
+        sample_every: int = 10,
+        high_watermark: float = 0.8,
+    ):
+        super().__init__(queue.Queue(maxsize))
+        self.overflow = overflow
+        self.sample_every = sample_every
+        self.high_water_size = int(maxsize * high_watermark)
+        self.dropped = 0
+        self._overflow_seen = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Context variables are not visible from the listener thread
+        if not getattr(record, "request_id", None):
+            record.request_id = RequestContextManager.get_request_id()
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        if (
+            self.overflow == OVERFLOW_SAMPLE
+            and record.levelno < logging.WARNING
+            and self.queue.qsize() >= self.high_water_size
+        ):
+            self._overflow_seen += 1
+            if self._overflow_seen % self.sample_every:
+                self.dropped += 1
+                return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class BatchingQueueListener:
+    """
+    Background thread draining a log queue in batches.
+
+    Each batch is written to every handler under a single lock acquisition
+    and flushed once, instead of once per record. After the first record of
+    a batch arrives the thread waits ``flush_interval`` seconds to let more
+    accumulate, which keeps it from contending with the event loop thread
+    for the GIL on every record.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        log_queue: queue.Queue,
+        *handlers: logging.Handler,
+        batch_size: int = 256,
+        flush_interval: float = 0.05,
+    ):
+        self.queue = log_queue
+        self.handlers = handlers
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._monitor, name="log-listener", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Write everything still queued, then stop the thread"""
+        if self._thread is not None:
+            self.queue.put(self._STOP)
+            self._thread.join()
+            self._thread = None
+
+    def _drain(self, first) -> List[logging.LogRecord]:
+        batch = [first]
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, batch: List[logging.LogRecord]):
+        for handler in self.handlers:
+            records = [r for r in batch if r.levelno >= handler.level]
+            if not records:
+                continue
+            if not isinstance(handler, logging.StreamHandler):
+                for record in records:
+                    handler.handle(record)
+                continue
+            handler.acquire()
+            try:
+                lines = []
+                for record in records:
+                    try:
+                        lines.append(handler.format(record) + handler.terminator)
+                    except Exception:
+                        handler.handleError(record)
+                    # Hand the GIL back between records so a large batch never
+                    # holds up the event loop for a whole switch interval
+                    time.sleep(0)
+                rollover = getattr(handler, "rollover_if_needed", None)
+                if rollover is not None:
+                    rollover()
+                if handler.stream is None and isinstance(handler, logging.FileHandler):
+                    handler.stream = handler._open()
+                handler.stream.write("".join(lines))
+                handler.flush()
+            except Exception:
+                handler.handleError(records[0])
+            finally:
+                handler.release()
+
+    def _monitor(self):
+        while True:
+            first = self.queue.get()
+            if first is not self._STOP and self.queue.qsize() < self.batch_size:
+                time.sleep(self.flush_interval)
+            batch = self._drain(first)
+            stop = self._STOP in batch
+            if stop:
+                batch = [r for r in batch if r is not self._STOP]
+                # Pick up anything enqueued right before stop() was called
+                while True:
+                    try:
+                        batch.append(self.queue.get_nowait())
+                    except queue.Empty:
+                        break
+            if batch:
+                self._write(batch)
+            if stop:
+                return
@@ -0,0 +1,196 @@
+import contextlib
+import gzip
+import logging
+import os
+import re
+import shutil
+import threading
+import time
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows; rotation is then per-process only
+    fcntl = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+class DailySizeRotatingFileHandler(logging.FileHandler):
+    """
+    File handler that starts a new file every UTC day and whenever the
+    current file reaches ``max_bytes``.
+
+    Files are named ``<prefix>_<date>.json``; size rollovers rename the
+    active file to ``<prefix>_<date>.<n>.json``. Rotated files are compressed
+    in a background thread after ``compress_delay`` seconds, and the oldest
+    files are deleted beyond ``retention_days`` or ``max_total_bytes``.
+
+    Several worker processes may append to the same directory. Rollovers
+    take an flock on a shared lock file, and every handler notices within
+    ``check_interval`` seconds that its file was rotated by another worker
+    and reopens it.
+    """
+
+    LOCK_FILE = ".rotate.lock"
+
+    def __init__(
+        self,
+        log_dir: str,
+        prefix: str = "request_logs",
+        max_bytes: int = 100 * 1024 * 1024,
+        retention_days: int = 14,
+        max_total_bytes: int = 0,
+        compression: Optional[str] = "gzip",
+        compress_delay: float = 5.0,
+        check_interval: float = 1.0,
+    ):
+        self.log_dir = log_dir
+        self.prefix = prefix
+        self.max_bytes = max_bytes
+        self.retention_days = retention_days
+        self.max_total_bytes = max_total_bytes
+        self.compression = compression if compression != "zstd" or zstandard is not None else "gzip"
+        # Longer than check_interval, so other workers have reopened before a file is compressed
+        self.compress_delay = max(compress_delay, check_interval * 2)
+        self.check_interval = check_interval
+        self._next_check = 0.0
+        self.date = self._today()
+        self._name_pattern = re.compile(rf"^{re.escape(prefix)}_(\d{{4}}-\d{{2}}-\d{{2}})(?:\.(\d+))?\.json(?:\.gz|\.zst)?$")
+        os.makedirs(log_dir, exist_ok=True)
+        super().__init__(self._path_for(self.date), delay=True)
+
+    @staticmethod
+    def _today() -> str:
+        return time.strftime("%Y-%m-%d", time.gmtime())
+
+    def _path_for(self, date: str, segment: Optional[int] = None) -> str:
+        suffix = f".{segment}" if segment is not None else ""
+        return os.path.join(self.log_dir, f"{self.prefix}_{date}{suffix}.json")
+
+    @contextlib.contextmanager
+    def _rotation_lock(self):
+        if fcntl is None:
+            yield
+            return
+        with open(os.path.join(self.log_dir, self.LOCK_FILE), "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _reopen(self):
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None  # reopened lazily on the next write
+
+    def _next_segment(self, date: str) -> int:
+        segments = [0]
+        for name in os.listdir(self.log_dir):
+            match = self._name_pattern.match(name)
+            if match and match.group(1) == date and match.group(2):
+                segments.append(int(match.group(2)))
+        return max(segments) + 1
+
+    def rollover_if_needed(self):
+        """Switch files on a date change or when the active file is too large"""
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        self._next_check = now + self.check_interval
+
+        today = self._today()
+        if today != self.date:
+            previous = self.baseFilename
+            self.date = today
+            self.baseFilename = os.path.abspath(self._path_for(today))
+            self._reopen()
+            self._schedule_compression(previous)
+            return
+
+        try:
+            on_disk = os.stat(self.baseFilename)
+        except FileNotFoundError:
+            self._reopen()
+            return
+
+        if self.stream is not None and os.fstat(self.stream.fileno()).st_ino != on_disk.st_ino:
+            # Another worker rotated the file under us
+            self._reopen()
+            return
+
+        if on_disk.st_size < self.max_bytes:
+            return
+
+        with self._rotation_lock():
+            try:
+                on_disk = os.stat(self.baseFilename)
+            except FileNotFoundError:
+                on_disk = None
+            # Re-check under the lock: another worker may have just rotated it
+            if on_disk is not None and on_disk.st_size >= self.max_bytes:
+                rotated = self._path_for(self.date, self._next_segment(self.date))
+                os.rename(self.baseFilename, rotated)
+                self._schedule_compression(rotated)
+        self._reopen()
+
+    def emit(self, record):
+        self.rollover_if_needed()
+        super().emit(record)
+
+    def _schedule_compression(self, path: str):
+        timer = threading.Timer(self.compress_delay, self._compress_and_prune, (path,))
+        timer.daemon = True
+        timer.start()
+
+    def _compress_and_prune(self, path: str):
+        if self.compression:
+            self._compress(path)
+        self._prune()
+
+    def _compress(self, path: str):
+        # Claim the file with an atomic rename so only one worker compresses it
+        claimed = f"{path}.{os.getpid()}.compressing"
+        try:
+            os.rename(path, claimed)
+        except FileNotFoundError:
+            return
+        extension = ".zst" if self.compression == "zstd" else ".gz"
+        target = path + extension
+        with open(claimed, "rb") as src, open(target + ".tmp", "wb") as raw:
+            if self.compression == "zstd":
+                zstandard.ZstdCompressor().copy_stream(src, raw)
+            else:
+                with gzip.GzipFile(fileobj=raw, mode="wb") as dst:
+                    shutil.copyfileobj(src, dst)
+        os.replace(target + ".tmp", target)
+        os.unlink(claimed)
+
+    def _prune(self):
+        with self._rotation_lock():
+            files = []
+            for name in os.listdir(self.log_dir):
+                match = self._name_pattern.match(name)
+                if match:
+                    path = os.path.join(self.log_dir, name)
+                    files.append((match.group(1), int(match.group(2) or 0), path))
+            files.sort()
+
+            active = {os.path.abspath(self._path_for(self._today()))}
+            cutoff = time.strftime("%Y-%m-%d", time.gmtime(time.time() - self.retention_days * 86400))
+            total = sum(os.path.getsize(path) for _, _, path in files)
+            for date, _, path in files:
+                if os.path.abspath(path) in active:
+                    continue
+                too_old = self.retention_days and date < cutoff
+                too_big = self.max_total_bytes and total > self.max_total_bytes
+                if not (too_old or too_big):
+                    continue
+                size = os.path.getsize(path)
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(path)
+                total -= size
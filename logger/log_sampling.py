@@ -0,0 +1,67 @@
+import random
+from typing import Callable, Dict, FrozenSet, Optional
+
+
+def parse_header_allowlist(value: str) -> Optional[FrozenSet[str]]:
+    """Comma-separated header names; "*" keeps every header (returns None)"""
+    names = {name.strip().lower() for name in value.split(",") if name.strip()}
+    if "*" in names:
+        return None
+    return frozenset(names)
+
+
+def parse_route_rates(value: str) -> Dict[str, float]:
+    """Parse "path=rate,path=rate" into {route path: sample rate}"""
+    rates = {}
+    for entry in value.split(","):
+        if not entry.strip():
+            continue
+        path, _, rate = entry.rpartition("=")
+        if not path:
+            raise ValueError(f"Invalid route sample rate: {entry}")
+        rates[path.strip()] = float(rate)
+    return rates
+
+
+def filter_headers(headers, allowlist: Optional[FrozenSet[str]]) -> dict:
+    if allowlist is None:
+        return dict(headers)
+    return {name: value for name, value in headers.items() if name in allowlist}
+
+
+class RequestLogSampler:
+    """
+    Decides after the response status is known whether a request is logged.
+
+    Errors (status >= 400) and requests slower than ``slow_ms`` are always
+    logged. Everything else is kept with probability ``success_rate``, or
+    the rate configured for its route template in ``route_rates``.
+    """
+
+    def __init__(
+        self,
+        success_rate: float = 0.01,
+        slow_ms: float = 1000,
+        route_rates: Optional[Dict[str, float]] = None,
+        rand: Callable[[], float] = random.random,
+    ):
+        self.success_rate = success_rate
+        self.slow_ms = slow_ms
+        self.route_rates = route_rates or {}
+        self.rand = rand
+
+    @classmethod
+    def from_settings(cls, settings) -> "RequestLogSampler":
+        return cls(
+            success_rate=settings.LOG_SUCCESS_SAMPLE_RATE,
+            slow_ms=settings.LOG_SLOW_REQUEST_MS,
+            route_rates=parse_route_rates(settings.LOG_ROUTE_SAMPLE_RATES),
+        )
+
+    def should_log(self, route_path: str, status_code: int, duration_ms: float) -> bool:
+        if status_code >= 400 or duration_ms >= self.slow_ms:
+            return True
+        rate = self.route_rates.get(route_path, self.success_rate)
+        if rate >= 1:
+            return True
+        return rate > 0 and self.rand() < rate
@@ -1,30 +1,62 @@
-import os
+import atexit
 import time
 import uuid
 import logging
 import json
-from typing import Callable
-
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from app.middleware.logger.RequestContextManager import RequestContextManager
-from app.middleware.logger.error_logger import ErrorLogger
-
-from utility.utils import current_utc_time
-
-log_dir = "logs"
-if not os.path.exists(log_dir):
-    os.makedirs(log_dir)
+from typing import Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from fastapi import Request
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from logger.RequestContextManager import RequestContextManager
+from logger.error_logger import ErrorLogger
+from logger.log_pipeline import BoundedQueueHandler, BatchingQueueListener
+from logger.log_rotation import DailySizeRotatingFileHandler
+from logger.log_sampling import RequestLogSampler, filter_headers, parse_header_allowlist
+from logger.loop_watchdog import loop_watchdog
+from app.core.config import settings
+from utility.utils import route_template
+
+log_dir = settings.LOG_DIR
 
 file_logger = logging.getLogger("request_file_logger")
 file_logger.setLevel(logging.INFO)
 
+def dumps_json(obj) -> str:
+    """Encode with orjson when it is installed, falling back to the json module"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str).decode()
+    return json.dumps(obj, default=str)
+
 class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per record. Structured data passed as
+    extra={'payload': {...}} is embedded as a nested object.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._second_prefix = (None, '')  # (epoch second, formatted prefix)
+
+    def _timestamp(self, record) -> str:
+        # record.created, not the current time: records may be formatted later on the listener thread
+        second = int(record.created)
+        cached_second, prefix = self._second_prefix
+        if second != cached_second:
+            prefix = time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(second))
+            self._second_prefix = (second, prefix)
+        return f"{prefix}.{int(record.msecs):03d}"
+
     def format(self, record):
         log_record = {
-            "ts": current_utc_time().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3],
+            "ts": self._timestamp(record),
             "lv": record.levelname,
-            "request_id": RequestContextManager.get_request_id(),
+            "request_id": getattr(record, 'request_id', None) or RequestContextManager.get_request_id(),
             "hash_key": getattr(record, 'hash_key', 'no-hash-key'),
             "sIp": getattr(record, 'sIp', 'unknown'),
             "fl": record.filename,
@@ -33,90 +65,173 @@ class JsonFormatter(logging.Formatter):
             "message_content": getattr(record, 'message_content', record.getMessage()),
             "ctx": getattr(record, 'ctx', '')
         }
-        return json.dumps(log_record)
-
-def get_datewise_log_file():
-    current_date = current_utc_time().strftime('%Y-%m-%d')
-    return os.path.join(log_dir, f"request_logs_{current_date}.json")
+        payload = getattr(record, 'payload', None)
+        if payload is not None:
+            log_record["payload"] = payload
+        return dumps_json(log_record)
+
+# Records are queued without blocking the event loop and written in batches
+# by a background thread; see logger/log_pipeline.py
+log_queue_handler = BoundedQueueHandler(
+    maxsize=settings.LOG_QUEUE_SIZE,
+    overflow=settings.LOG_OVERFLOW_POLICY,
+    sample_every=settings.LOG_SAMPLE_EVERY,
+)
+log_listener = None
 
 if not file_logger.handlers:
-    datewise_file = get_datewise_log_file()
-    file_handler = logging.FileHandler(datewise_file)
+    # Switches to a new request_logs_<date>.json at UTC midnight and on size
+    file_handler = DailySizeRotatingFileHandler(
+        log_dir,
+        max_bytes=settings.LOG_MAX_BYTES,
+        retention_days=settings.LOG_RETENTION_DAYS,
+        max_total_bytes=settings.LOG_MAX_TOTAL_BYTES,
+        compression=None if settings.LOG_COMPRESSION == "none" else settings.LOG_COMPRESSION,
+    )
     file_handler.setFormatter(JsonFormatter())
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(JsonFormatter())
-    file_logger.addHandler(file_handler)
-    file_logger.addHandler(console_handler)
-    file_logger.propagate = False
+    log_listener = BatchingQueueListener(
+        log_queue_handler.queue,
+        file_handler,
+        console_handler,
+        batch_size=settings.LOG_BATCH_SIZE,
+    )
+    for queued_logger in (file_logger, logging.getLogger('request_response')):
+        queued_logger.setLevel(logging.INFO)
+        queued_logger.addHandler(log_queue_handler)
+        queued_logger.propagate = False
+    log_listener.start()
+    # Flush whatever is still queued when the worker exits
+    atexit.register(log_listener.stop)
 
 class RequestResponseLogger:
-    def __init__(self):
+    def __init__(self, header_allowlist: Optional[str] = None):
         self.logger = logging.getLogger('request_response')
+        # Comma-separated header names to log, "*" for all
+        self.header_allowlist = parse_header_allowlist(
+            settings.LOG_HEADER_ALLOWLIST if header_allowlist is None else header_allowlist
+        )
 
     def log_request(self, request: Request, request_id: str):
         log_entry = {
-            'timestamp': current_utc_time().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3],
             'request_id': request_id,
             'method': request.method,
             'url': str(request.url),
             'client_host': request.client.host if request.client else None,
-            'headers': dict(request.headers)
+            'headers': filter_headers(request.headers, self.header_allowlist)
         }
-        self.logger.info(f"Incoming Request: {json.dumps(log_entry)}")
-
-    def log_response(self, request: Request, response: Response, duration: float, request_id: str):
+        self.logger.info("Incoming Request", extra={'payload': log_entry, 'request_id': request_id})
+
+    def log_response(
+        self,
+        request: Request,
+        status_code: int,
+        headers: Headers,
+        duration: float,
+        request_id: str,
+        timings: Optional[dict] = None,
+    ):
         log_entry = {
-            'timestamp': current_utc_time().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3],
             'request_id': request_id,
             'method': request.method,
             'url': str(request.url),
-            'status_code': response.status_code,
+            'status_code': status_code,
             'duration_ms': duration,
-            'response_headers': dict(response.headers)
+            'response_headers': filter_headers(headers, self.header_allowlist)
         }
-        self.logger.info(f"Outgoing Response: {json.dumps(log_entry)}")
-
-class LoggingMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, request_response_logger: RequestResponseLogger):
-        super().__init__(app)
+        if timings:
+            log_entry['timings'] = timings
+        self.logger.info("Outgoing Response", extra={'payload': log_entry, 'request_id': request_id})
+
+class LoggingMiddleware:
+    """
+    Pure ASGI request/response logging middleware.
+
+    Nothing is logged until the response status is known, so the sampler can
+    keep every error and slow request but only a fraction of fast successes.
+    Spans recorded through RequestContextManager.add_timing during the
+    request are returned in a Server-Timing header and logged with the
+    response entry.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        request_response_logger: RequestResponseLogger,
+        sampler: Optional[RequestLogSampler] = None,
+    ):
+        self.app = app
         self.request_response_logger = request_response_logger
+        self.sampler = sampler or RequestLogSampler.from_settings(settings)
         self.error_logger = ErrorLogger()
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def _log_request(self, request: Request, request_id: str, hash_key: str, sIp: str):
+        file_logger.info("Request started", extra={
+            "sIp": sIp,
+            "ctx": "REQUEST",
+            "message_content": f"{request.method} {request.url}",
+            "request_id": request_id,
+            "hash_key": hash_key
+        })
+        self.request_response_logger.log_request(request, request_id)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+
         # Generate request_id and get hash_key
         request_id = str(uuid.uuid4())
         hash_key = request.headers.get('X-Hash-Key', 'no-hash-key')
 
         RequestContextManager.set_request_id(request_id)
+        RequestContextManager.start_timings()
+        if settings.LOOP_WATCHDOG_ENABLED:
+            loop_watchdog.start()
+            loop_watchdog.track_request(request_id)
 
         sIp = request.client.host if request.client else "unknown"
+        enabled = file_logger.isEnabledFor(logging.INFO)
+        logged = False
+
+        async def send_wrapper(message: Message):
+            nonlocal logged
+            if message["type"] == "http.response.start":
+                duration = (time.time() - start_time) * 1000
+                status_code = message["status"]
+                timings = RequestContextManager.summarize_timings(RequestContextManager.get_timings())
+                if settings.SERVER_TIMING_ENABLED:
+                    server_timing = RequestContextManager.server_timing_header(timings, duration)
+                    message["headers"] = [*message.get("headers", []), (b"server-timing", server_timing.encode("latin-1"))]
+
+                # Sample by route template, not the raw URL
+                route_path = route_template(scope, scope["path"])
+
+                if enabled and self.sampler.should_log(route_path, status_code, duration):
+                    logged = True
+                    self._log_request(request, request_id, hash_key, sIp)
+                    file_logger.info("Request completed", extra={
+                        "sIp": sIp,
+                        "ctx": "RESPONSE",
+                        "message_content": f"{request.method} {request.url} completed in {duration:.2f}ms with status {status_code}",
+                        "request_id": request_id,
+                        "hash_key": hash_key
+                    })
+
+                    self.request_response_logger.log_response(
+                        request, status_code, Headers(raw=message["headers"]), duration, request_id, timings
+                    )
+            await send(message)
 
         try:
-            file_logger.info("Request started", extra={
-                "sIp": sIp,
-                "ctx": "REQUEST",
-                "message_content": f"{request.method} {request.url}",
-                "request_id": request_id,
-                "hash_key": hash_key
-            })
-
-            self.request_response_logger.log_request(request, request_id)
-
             start_time = time.time()
-            response = await call_next(request)
-            duration = (time.time() - start_time) * 1000
-
-            file_logger.info("Request completed", extra={
-                "sIp": sIp,
-                "ctx": "RESPONSE",
-                "message_content": f"{request.method} {request.url} completed in {duration:.2f}ms with status {response.status_code}",
-                "request_id": request_id,
-                "hash_key": hash_key
-            })
-
-            self.request_response_logger.log_response(request, response, duration, request_id)
-            return response
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
+            if not logged:
+                self._log_request(request, request_id, hash_key, sIp)
             file_logger.exception("Request failed", extra={
                 "sIp": sIp,
                 "ctx": "ERROR",
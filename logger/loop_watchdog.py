@@ -0,0 +1,110 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+import weakref
+from typing import Optional
+
+from app.core.config import settings
+from logger.RequestContextManager import RequestContextManager
+
+
+class LoopBlockWatchdog:
+    """
+    Detects when the event loop stops running for longer than ``threshold_ms``.
+
+    A coroutine on the loop records a heartbeat every ``threshold_ms / 4``.
+    A separate thread checks the heartbeat; once it is older than the
+    threshold it captures the stack of the loop thread, i.e. the code that
+    is blocking, and logs it with the request id of the task that was
+    running. One report is written per blocking episode.
+
+    Meant for development and canary workers: capturing stacks is cheap,
+    but the extra thread and heartbeat are not free.
+    """
+
+    def __init__(self, threshold_ms: float, logger: logging.Logger):
+        self.threshold = threshold_ms / 1000
+        self.interval = self.threshold / 4
+        self.logger = logger
+        self.blocks = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._last_beat = 0.0
+        self._reported_beat = 0.0
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        # Request ids by task, for tasks the id contextvar cannot be read from another thread
+        self._task_requests = weakref.WeakKeyDictionary()
+
+    def start(self):
+        """Start watching the running loop; must be called from the loop thread"""
+        if self._thread is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stopped.clear()
+        self._heartbeat_task = asyncio.ensure_future(self._heartbeat())
+        self._thread = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._thread.start()
+
+    async def stop(self):
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._heartbeat_task.cancel()
+        try:
+            await self._heartbeat_task
+        except asyncio.CancelledError:
+            pass
+        self._thread.join()
+        self._thread = None
+
+    def track_request(self, request_id: str):
+        """Associate the current task with a request id for attribution"""
+        task = asyncio.current_task()
+        if task is not None:
+            self._task_requests[task] = request_id
+
+    async def _heartbeat(self):
+        while True:
+            self._last_beat = time.monotonic()
+            await asyncio.sleep(self.interval)
+
+    def _request_id(self, task) -> str:
+        if task is None:
+            return ''
+        request_id = self._task_requests.get(task)
+        if request_id is None and hasattr(task, "get_context"):
+            # Python 3.12+: tasks spawned by a request inherit its context
+            request_id = task.get_context().get(RequestContextManager._request_id_var)
+        return request_id or ''
+
+    def _watch(self):
+        while not self._stopped.wait(self.interval):
+            last_beat = self._last_beat
+            # The heartbeat is up to one interval old even when the loop is idle
+            blocked = time.monotonic() - last_beat - self.interval
+            if blocked < self.threshold or last_beat == self._reported_beat:
+                continue
+            self._reported_beat = last_beat
+            self.blocks += 1
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame is not None else ''
+            request_id = self._request_id(asyncio.current_task(self._loop))
+            self.logger.warning("Event loop blocked", extra={
+                "ctx": "LOOP_BLOCKED",
+                "message_content": f"Event loop blocked for at least {blocked * 1000:.0f}ms",
+                "request_id": request_id,
+                "payload": {"blocked_ms": round(blocked * 1000, 1), "stack": stack},
+            })
+
+
+loop_watchdog = LoopBlockWatchdog(
+    threshold_ms=settings.LOOP_WATCHDOG_THRESHOLD_MS,
+    logger=logging.getLogger("request_file_logger"),
+)
@@ -0,0 +1,46 @@
+import hashlib
+from typing import Any, Tuple
+
+# Operators whose operand is a list of values, not a list of sub-queries
+_VALUE_LIST_OPERATORS = {"$in", "$nin", "$all"}
+# Sort directions and projections describe the query, not its parameters
+_STRUCTURAL_KEYS = {"sort", "$sort", "projection"}
+MAX_SHAPE_LENGTH = 512
+
+
+def query_shape(query: Any) -> Any:
+    """
+    Replace every literal in a Mongo filter with "?", keeping field names,
+    operators, sort directions and projections. Queries that differ only
+    in their values share a shape.
+    """
+    if isinstance(query, dict):
+        return {
+            key: "?" if key in _VALUE_LIST_OPERATORS
+            else value if key in _STRUCTURAL_KEYS
+            else query_shape(value)
+            for key, value in sorted(query.items(), key=lambda item: str(item[0]))
+        }
+    if isinstance(query, (list, tuple)):
+        # $and / $or / $nor: keep each sub-query's shape
+        if query and all(isinstance(item, dict) for item in query):
+            return [query_shape(item) for item in query]
+        return "?"
+    return "?"
+
+
+def _render(shape: Any) -> str:
+    if isinstance(shape, dict):
+        return "{" + ",".join(f"{key}:{_render(value)}" for key, value in shape.items()) + "}"
+    if isinstance(shape, list):
+        return "[" + ",".join(_render(item) for item in shape) + "]"
+    return str(shape)
+
+
+def fingerprint(query: Any) -> Tuple[str, str]:
+    """Return (shape string truncated for logging, 16 hex char hash of the full shape)"""
+    rendered = _render(query_shape(query))
+    digest = hashlib.blake2b(rendered.encode(), digest_size=8).hexdigest()
+    if len(rendered) > MAX_SHAPE_LENGTH:
+        rendered = rendered[:MAX_SHAPE_LENGTH] + "..."
+    return rendered, digest
@@ -0,0 +1,60 @@
+import os
+import tempfile
+
+# Keep request logs of the app under test out of the working tree
+os.environ.setdefault("LOG_DIR", tempfile.mkdtemp(prefix="test-logs-"))
+
+import pytest
+from fakeredis import FakeAsyncRedis
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def fake_redis():
+    return FakeAsyncRedis(decode_responses=True)
+
+
+@pytest.fixture
+def client(fake_redis, monkeypatch):
+    """TestClient without the lifespan (no Mongo), with the section cache on fake Redis"""
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+    from app.services.section_cache import section_cache
+
+    monkeypatch.setattr(section_cache, "client", fake_redis)
+    monkeypatch.setattr(section_cache, "_unavailable_until", 0.0)
+    if section_cache.local is not None:
+        section_cache.local.clear()
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def beanie_models():
+    """
+    Beanie initialised for College and CollegeCard without a server, so
+    documents can be built in tests. Any real database call still fails.
+    """
+    import asyncio
+
+    from beanie import init_beanie
+    from pymongo import AsyncMongoClient
+    from pymongo.asynchronous.database import AsyncDatabase
+
+    from app.models.college import College, CollegeCard
+
+    async def build_info(self, *args, **kwargs):
+        return {"version": "7.0.0"}
+
+    async def collection_names(self, *args, **kwargs):
+        return ["colleges", "college_cards"]
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(AsyncDatabase, "command", build_info)
+        patch.setattr(AsyncDatabase, "list_collection_names", collection_names)
+        client = AsyncMongoClient("mongodb://localhost:1", connect=False)
+        asyncio.run(init_beanie(database=client["test"], document_models=[College, CollegeCard], skip_indexes=True))
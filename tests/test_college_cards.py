@@ -0,0 +1,86 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from app.models.college import Address, College, CollegeCard, CollegeRanking, Fees, Placement, Ratings
+from app.services.college_cards import CollegeCardService, card_from_college, is_listed
+
+pytestmark = pytest.mark.usefixtures("beanie_models")
+
+
+def make_college(**fields) -> College:
+    defaults = dict(
+        college_id=7,
+        name="National Institute of Technology",
+        short_name="NIT",
+        address=Address(city="Agartala", state="Tripura"),
+        ratings=Ratings(overall=4.2, total_reviews=310),
+        rankings=[
+            CollegeRanking(organisation="NIRF", rank=41, year=2024),
+            CollegeRanking(organisation="QS", rank=12, year=2024),
+        ],
+        fees=Fees(total="₹2.5 Lakhs"),
+        placement=Placement(average_package=1_200_000),
+        updated_at=datetime(2025, 10, 1, tzinfo=timezone.utc),
+    )
+    return College(**{**defaults, **fields})
+
+
+def test_card_flattens_the_listing_fields():
+    card = card_from_college(make_college())
+
+    assert card.college_id == 7
+    assert (card.city, card.state) == ("Agartala", "Tripura")
+    assert (card.rating, card.reviews) == (4.2, 310)
+    assert card.best_rank == 12
+    assert (card.fees, card.placement) == (250_000, 1_200_000)
+
+
+def test_card_of_a_sparse_college():
+    card = card_from_college(make_college(address=None, ratings=None, rankings=[], fees=None, placement=None))
+
+    assert card.city is None and card.rating is None
+    assert card.best_rank is None
+    assert card.fees is None and card.placement is None
+
+
+@pytest.mark.parametrize("fields, listed", [
+    ({}, True),
+    ({"is_active": False}, False),
+    ({"is_deleted": True}, False),
+])
+def test_is_listed(fields, listed):
+    assert is_listed(make_college(**fields)) is listed
+
+
+@pytest.fixture
+def card_writes(monkeypatch):
+    writes = []
+
+    async def save(card, *args, **kwargs):
+        writes.append(("save", card))
+
+    async def remove(college_id):
+        writes.append(("remove", college_id))
+
+    monkeypatch.setattr(CollegeCard, "save", save)
+    monkeypatch.setattr(CollegeCardService, "remove", staticmethod(remove))
+    return writes
+
+
+@pytest.mark.anyio
+async def test_sync_upserts_the_card_of_a_listed_college(card_writes):
+    college = make_college()
+    await CollegeCardService.sync(college)
+
+    [(action, card)] = card_writes
+    assert action == "save"
+    assert card.id == college.id and card.name == college.name
+
+
+@pytest.mark.anyio
+async def test_sync_removes_the_card_once_unlisted(card_writes):
+    college = make_college(is_deleted=True)
+    await CollegeCardService.sync(college)
+
+    assert card_writes == [("remove", college.id)]
@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+from app.core.config import settings
+from app.models.college import College
+from app.services.college_service import CollegeService, college_projection_model
+
+
+@pytest.mark.anyio
+async def test_find_college_looks_up_the_public_id(monkeypatch):
+    calls = []
+
+    async def find_one(query, projection_model=None):
+        calls.append((query, projection_model))
+
+    monkeypatch.setattr(College, "find_one", find_one)
+    await CollegeService.find_college(42, ["college_placements"])
+
+    assert calls == [({"college_id": 42}, college_projection_model(("college_placements",)))]
+
+
+def test_mongo_sections_are_built_from_the_projected_document(client, monkeypatch):
+    sections = ("college_placements", "college_departments")
+    projection = college_projection_model(sections)
+
+    async def find_college(college_id, requested):
+        assert college_id == 9002
+        assert tuple(requested) == sections
+        return projection(
+            placement={"average_package": 1200000, "top_recruiters": ["Acme"]},
+            academics={"departments": ["Physics", "Chemistry"]},
+        )
+
+    monkeypatch.setattr(settings, "USE_MONGO_COLLEGES", True)
+    monkeypatch.setattr(CollegeService, "find_college", staticmethod(find_college))
+    response = client.get("/api/v1/colleges/9002", params={"sections": "placements,departments"})
+
+    assert response.status_code == 200
+    assert response.json()["data"] == {
+        "college_placements": {"placement": {"average_package": 1200000, "top_recruiters": ["Acme"]}},
+        "college_departments": {"departments": ["Physics", "Chemistry"]},
+    }
+
+
+def test_unknown_public_id_is_404(client, monkeypatch):
+    async def find_college(college_id, requested):
+        return None
+
+    monkeypatch.setattr(settings, "USE_MONGO_COLLEGES", True)
+    monkeypatch.setattr(CollegeService, "find_college", staticmethod(find_college))
+    assert client.get("/api/v1/colleges/9003").status_code == 404
+
+
+def test_cached_sections_are_served_without_reading_the_document(client, monkeypatch):
+    projection = college_projection_model(("college_placements", "college_departments"))
+    calls = []
+
+    async def find_college(college_id, requested):
+        calls.append(college_id)
+        return projection(placement={"average_package": 900000}, academics={"departments": ["Physics"]})
+
+    monkeypatch.setattr(settings, "USE_MONGO_COLLEGES", True)
+    monkeypatch.setattr(CollegeService, "find_college", staticmethod(find_college))
+    params = {"sections": "placements,departments"}
+
+    first = client.get("/api/v1/colleges/9009", params=params)
+    # Both missing sections share one read of the document
+    assert calls == [9009]
+
+    second = client.get("/api/v1/colleges/9009", params=params)
+    assert calls == [9009]
+    assert second.json()["data"] == first.json()["data"]
+
+
+def test_unknown_public_id_caches_nothing(client, monkeypatch, fake_redis):
+    async def find_college(college_id, requested):
+        return None
+
+    monkeypatch.setattr(settings, "USE_MONGO_COLLEGES", True)
+    monkeypatch.setattr(CollegeService, "find_college", staticmethod(find_college))
+    assert client.get("/api/v1/colleges/9010").status_code == 404
+    assert client.get("/api/v1/colleges/9010").status_code == 404
+
+    assert asyncio.run(fake_redis.keys("college:9010:section:*")) == []
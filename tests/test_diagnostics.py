@@ -0,0 +1,30 @@
+from app.core.config import settings
+
+
+def test_cache_stats_hidden_unless_diagnostics_enabled(client, monkeypatch):
+    monkeypatch.setattr(settings, "DIAGNOSTICS_ENABLED", False)
+    assert client.get("/cache/stats").status_code == 404
+
+    monkeypatch.setattr(settings, "DIAGNOSTICS_ENABLED", True)
+    response = client.get("/cache/stats")
+    assert response.status_code == 200
+    assert set(response.json()) == {"local", "redis", "responses"}
+
+
+def test_query_stats_hidden_unless_diagnostics_enabled(client, monkeypatch):
+    monkeypatch.setattr(settings, "DIAGNOSTICS_ENABLED", False)
+    assert client.get("/db/query-stats").status_code == 404
+
+    monkeypatch.setattr(settings, "DIAGNOSTICS_ENABLED", True)
+    response = client.get("/db/query-stats", params={"limit": 5})
+    assert response.status_code == 200
+    assert set(response.json()) == {"untracked", "shapes"}
+
+
+def test_server_timing_is_off_by_default(client):
+    assert "server-timing" not in client.get("/health").headers
+
+
+def test_server_timing_when_enabled(client, monkeypatch):
+    monkeypatch.setattr(settings, "SERVER_TIMING_ENABLED", True)
+    assert "total;dur=" in client.get("/health").headers["server-timing"]
@@ -0,0 +1,24 @@
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.college_service import CollegeService
+from logger import logging as request_logging
+
+
+def test_unhandled_error_returns_a_generic_body_and_is_logged(client, monkeypatch):
+    def fail(college_id):
+        raise RuntimeError("connect to mongodb://user:pw@db.internal failed")
+
+    logged = []
+    monkeypatch.setattr(CollegeService, "get_college_ratings", staticmethod(fail))
+    monkeypatch.setattr(
+        request_logging.ErrorLogger, "log_error", lambda self, error, request_id, *args: logged.append(error)
+    )
+
+    response = TestClient(app, raise_server_exceptions=False).get("/api/v1/colleges/9012/ratings")
+
+    assert response.status_code == 500
+    assert response.json() == {"detail": "Internal server error"}
+    assert "mongodb://" not in response.text
+    # The exception itself reaches the request logger
+    assert [type(error) for error in logged] == [RuntimeError]
@@ -0,0 +1,157 @@
+import time
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from fastapi import HTTPException
+
+from app.core import auth_dependency
+from app.core.auth_dependency import REDIS_REJECTED_PREFIX, REDIS_USER_PREFIX, token_fingerprint, validate_token
+from app.core.firebase_auth import AuthFailedException, AuthUnavailableException, GoogleAuthBackend
+
+PROJECT_ID = "demo-project"
+PRIVATE_KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+class StaticKeyCache:
+    """Stands in for PublicKeyCache with a single local signing key"""
+
+    def __init__(self, keys):
+        self.keys = keys
+
+    async def get_key(self, kid):
+        return self.keys.get(kid)
+
+
+def make_backend(key_cache=None) -> GoogleAuthBackend:
+    backend = GoogleAuthBackend.__new__(GoogleAuthBackend)
+    backend.project_id = PROJECT_ID
+    backend.key_cache = key_cache or StaticKeyCache({"kid-1": PRIVATE_KEY.public_key()})
+    return backend
+
+
+def make_token(kid="kid-1", **claims) -> str:
+    now = int(time.time())
+    payload = {
+        "iss": f"https://securetoken.google.com/{PROJECT_ID}",
+        "aud": PROJECT_ID,
+        "sub": "uid-1",
+        "iat": now,
+        "exp": now + 3600,
+        "auth_time": now,
+        "email": "user@example.com",
+        "email_verified": True,
+        **claims,
+    }
+    return jwt.encode(payload, PRIVATE_KEY, algorithm="RS256", headers={"kid": kid})
+
+
+@pytest.mark.anyio
+async def test_verifies_a_valid_token():
+    user = await make_backend().verify_token_async(make_token())
+    assert user["uid"] == "uid-1"
+    assert user["email"] == "user@example.com"
+
+
+@pytest.mark.anyio
+async def test_rejects_unverified_email():
+    with pytest.raises(AuthFailedException):
+        await make_backend().verify_token_async(make_token(email_verified=False))
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("claims", [{"aud": "other-project"}, {"exp": int(time.time()) - 10}])
+async def test_rejects_wrong_audience_and_expired_tokens(claims):
+    with pytest.raises(AuthFailedException):
+        await make_backend().verify_token_async(make_token(**claims))
+
+
+class CountingBackend:
+    """Wraps a backend to count verifications that got past the caches"""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.calls = 0
+
+    async def verify_token_async(self, token):
+        self.calls += 1
+        return await self.backend.verify_token_async(token)
+
+
+class FailingKeyCache:
+    async def get_key(self, kid):
+        raise OSError("certificate fetch timed out")
+
+
+@pytest.fixture
+def auth_redis(fake_redis, monkeypatch):
+    monkeypatch.setattr(auth_dependency, "redis", fake_redis)
+    return fake_redis
+
+
+def use_backend(monkeypatch, backend) -> CountingBackend:
+    counting = CountingBackend(backend)
+    monkeypatch.setattr(GoogleAuthBackend, "get_instance", classmethod(lambda cls: counting))
+    return counting
+
+
+@pytest.mark.anyio
+async def test_verified_user_is_cached(auth_redis, monkeypatch):
+    backend = use_backend(monkeypatch, make_backend())
+    token = make_token()
+
+    first = await validate_token(token)
+    second = await validate_token(token)
+
+    assert first == second
+    assert backend.calls == 1
+    assert 0 < await auth_redis.ttl(f"{REDIS_USER_PREFIX}{token_fingerprint(token)}") <= 3600
+
+
+@pytest.mark.anyio
+async def test_rejected_token_is_cached(auth_redis, monkeypatch):
+    backend = use_backend(monkeypatch, make_backend())
+    token = make_token(aud="other-project")
+
+    for _ in range(2):
+        with pytest.raises(HTTPException) as exc:
+            await validate_token(token)
+        assert exc.value.status_code == 401
+
+    assert backend.calls == 1
+    assert await auth_redis.exists(f"{REDIS_REJECTED_PREFIX}{token_fingerprint(token)}")
+
+
+@pytest.mark.anyio
+async def test_key_fetch_failure_is_not_cached(auth_redis, monkeypatch):
+    backend = use_backend(monkeypatch, make_backend(FailingKeyCache()))
+    token = make_token()
+
+    with pytest.raises(HTTPException) as exc:
+        await validate_token(token)
+
+    assert exc.value.status_code == 503
+    assert not await auth_redis.exists(f"{REDIS_REJECTED_PREFIX}{token_fingerprint(token)}")
+
+    # Once keys are reachable again the same token verifies
+    backend.backend = make_backend()
+    assert (await validate_token(token))["uid"] == "uid-1"
+
+
+@pytest.mark.anyio
+async def test_unknown_kid_is_rejected_but_not_cached(auth_redis, monkeypatch):
+    use_backend(monkeypatch, make_backend())
+    token = make_token(kid="rotated-in")
+
+    with pytest.raises(HTTPException) as exc:
+        await validate_token(token)
+
+    assert exc.value.status_code == 401
+    assert not await auth_redis.exists(f"{REDIS_REJECTED_PREFIX}{token_fingerprint(token)}")
+
+
+@pytest.mark.anyio
+async def test_key_fetch_failure_is_reported_as_unavailable():
+    with pytest.raises(AuthUnavailableException):
+        await make_backend(FailingKeyCache()).verify_token_async(make_token())
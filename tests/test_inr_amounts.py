@@ -0,0 +1,94 @@
+import pytest
+from pydantic import ValidationError
+
+from app.models.college import Fees
+from app.schemas.college import FeesCreate, PlacementCreate
+from utility.utils import parse_inr, parse_inr_strict
+
+LISTING = "/api/v1/colleges/"
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("₹2.5 Lakhs", 250_000),
+    ("25 LPA", 2_500_000),
+    ("1.2 Cr", 12_000_000),
+    ("2,50,000", 250_000),
+    ("12-15 LPA", 1_200_000),
+    ("80 thousand", 80_000),
+    (150000, 150_000),
+    (2.5e5, 250_000),
+    (None, None),
+    ("not disclosed", None),
+    (True, None),
+])
+def test_parse_inr(value, expected):
+    assert parse_inr(value) == expected
+
+
+@pytest.mark.parametrize("value", ["abc", "not disclosed", True])
+def test_parse_inr_strict_rejects_text_without_an_amount(value):
+    with pytest.raises(ValueError):
+        parse_inr_strict(value)
+
+
+@pytest.mark.parametrize("value", ["3.5 million", "2.5 mn", "50 per month"])
+def test_parse_inr_strict_rejects_unknown_units(value):
+    with pytest.raises(ValueError):
+        parse_inr_strict(value)
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("₹2.5 Lakhs", 250_000),
+    ("12-15 LPA", 1_200_000),
+    ("1.2 Cr", 12_000_000),
+    ("2,50,000 INR", 250_000),
+    ("", None),
+    ("  ", None),
+    (None, None),
+])
+def test_parse_inr_strict_accepts_amounts_and_empty_values(value, expected):
+    assert parse_inr_strict(value) == expected
+
+
+def test_create_schemas_reject_unparseable_amounts():
+    with pytest.raises(ValidationError):
+        FeesCreate(total="abc")
+    with pytest.raises(ValidationError):
+        PlacementCreate(average_package="ask the office")
+    with pytest.raises(ValidationError):
+        FeesCreate(total="3.5 million")
+    assert FeesCreate(total="₹2.5 Lakhs").total == 250_000
+
+
+def test_stored_documents_load_leniently():
+    # Documents written before amounts became numeric may hold any text
+    assert Fees(total="abc").total is None
+
+
+def listed_fees(client, **params):
+    colleges = client.get(LISTING, params={"limit": 100, **params}).json()["data"]["colleges"]
+    return [parse_inr(college["fees"]) for college in colleges]
+
+
+def test_fees_range_filter(client):
+    all_fees = sorted(fee for fee in listed_fees(client) if fee is not None)
+    low, high = all_fees[len(all_fees) // 4], all_fees[3 * len(all_fees) // 4]
+
+    in_range = listed_fees(client, minFees=low, maxFees=high)
+    # Displayed amounts are rounded to a tenth of a lakh
+    assert in_range and all(low - 5_000 <= fee <= high + 5_000 for fee in in_range)
+    assert len(in_range) < len(listed_fees(client))
+
+
+def test_placement_lower_bound_only(client):
+    colleges = client.get(LISTING, params={"limit": 100, "minPlacement": 1_000_000}).json()["data"]["colleges"]
+    assert all(parse_inr(college["placement"]) >= 950_000 for college in colleges)
+
+
+@pytest.mark.parametrize("params", [{"minFees": 500_000, "maxFees": 100_000}, {"minPlacement": 9, "maxPlacement": 1}])
+def test_inverted_range_is_a_bad_request(client, params):
+    assert client.get(LISTING, params=params).status_code == 400
+
+
+def test_negative_bound_is_rejected(client):
+    assert client.get(LISTING, params={"minFees": -1}).status_code == 422
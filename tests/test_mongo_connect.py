@@ -0,0 +1,38 @@
+import pytest
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.database import AsyncDatabase
+
+from app.core.config import settings
+from app.db import mongo
+from app.db.mongo import close_mongo_connection, connect_to_mongo, mongodb
+from app.models.college import College
+
+
+@pytest.mark.anyio
+async def test_connect_initialises_beanie_on_the_real_client(monkeypatch):
+    """Runs connect_to_mongo end to end; only the server's replies are faked"""
+    commands = []
+
+    async def command(self, cmd, *args, **kwargs):
+        commands.append(cmd)
+        return {"ok": 1, "version": "7.0.0"}
+
+    async def collection_names(self, *args, **kwargs):
+        return []
+
+    monkeypatch.setattr(AsyncDatabase, "command", command)
+    monkeypatch.setattr(AsyncDatabase, "list_collection_names", collection_names)
+    monkeypatch.setattr(settings, "MONGODB_URL", "mongodb://localhost:1")
+    monkeypatch.setattr(settings, "MONGO_MIN_POOL_SIZE", 0)
+    monkeypatch.setattr(settings, "INDEX_SYNC_MODE", "off")
+
+    await connect_to_mongo()
+    try:
+        assert isinstance(mongodb.client, AsyncMongoClient)
+        assert "ping" in commands
+        # Beanie is bound to the configured database through the client
+        assert College.get_pymongo_collection().database.name == settings.DATABASE_NAME
+        assert mongo.mongodb.index_sync_task is None
+    finally:
+        await close_mongo_connection()
+    assert mongodb.client is None
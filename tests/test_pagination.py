@@ -0,0 +1,84 @@
+import pytest
+from beanie import PydanticObjectId
+
+from app.core.pagination import decode_cursor, encode_cursor
+from app.services.college_service import keyset_filter
+
+LISTING = "/api/v1/colleges/"
+
+
+def test_cursor_round_trip():
+    token = encode_cursor("rating:-1", 4.5, 17)
+    assert decode_cursor(token, "rating:-1") == (4.5, "17")
+    assert decode_cursor(encode_cursor("default:-1", None, "3"), "default:-1") == (None, "3")
+    assert decode_cursor(encode_cursor("date:-1", "2025-10-10", "n2"), "date:-1", str) == ("2025-10-10", "n2")
+
+
+@pytest.mark.parametrize("token", ["not-a-cursor", "", encode_cursor("fees:-1", 1, "1")])
+def test_malformed_or_mismatched_cursor_is_rejected(token):
+    with pytest.raises(ValueError):
+        decode_cursor(token, "rating:-1")
+
+
+@pytest.mark.parametrize("value", ["4.5", True, [1], {"$gt": 0}])
+def test_cursor_value_of_the_wrong_type_is_rejected(value):
+    with pytest.raises(ValueError):
+        decode_cursor(encode_cursor("rating:-1", value, "1"), "rating:-1")
+
+
+def test_news_cursor_needs_a_string_date():
+    with pytest.raises(ValueError):
+        decode_cursor(encode_cursor("date:-1", 20251010, "n2"), "date:-1", str)
+
+
+def test_keyset_filter_descending():
+    last_id = str(PydanticObjectId())
+    assert keyset_filter("rating", -1, 4.5, last_id) == {"$or": [
+        {"rating": {"$lt": 4.5}},
+        {"rating": 4.5, "_id": {"$gt": PydanticObjectId(last_id)}},
+        {"rating": None},
+    ]}
+
+
+def test_keyset_filter_ascending_and_missing_values():
+    assert keyset_filter("fees", 1, 100, "7") == {"$or": [{"fees": {"$gt": 100}}, {"fees": 100, "_id": {"$gt": "7"}}]}
+    # Past the nulls of an ascending sort every non-null value is still ahead
+    assert keyset_filter("fees", 1, None, "7") == {"$or": [{"fees": {"$ne": None}}, {"fees": None, "_id": {"$gt": "7"}}]}
+    # Nulls sort last when descending, so only later nulls remain
+    assert keyset_filter("fees", -1, None, "7") == {"fees": None, "_id": {"$gt": "7"}}
+
+
+def read_all(client, params, limit=4):
+    ids, cursor = [], None
+    while True:
+        data = client.get(LISTING, params={**params, "limit": limit, **({"cursor": cursor} if cursor else {})}).json()["data"]
+        ids += [college["id"] for college in data["colleges"]]
+        cursor = data["next_cursor"]
+        if cursor is None:
+            return ids, data["total"]
+
+
+@pytest.mark.parametrize("params", [{}, {"sortBy": "rating"}, {"sortBy": "fees"}])
+def test_cursor_pages_match_offset_pages(client, params):
+    ids, total = read_all(client, params)
+    offset_ids = [college["id"] for college in client.get(LISTING, params={**params, "limit": 100}).json()["data"]["colleges"]]
+    assert ids == offset_ids
+    assert len(ids) == total
+
+
+def test_stale_cursor_in_default_order_is_rejected(client):
+    response = client.get(LISTING, params={"cursor": encode_cursor("default:-1", None, "no-such-college")})
+    assert response.status_code == 400
+
+
+def test_stale_cursor_in_a_sorted_order_reseeks_by_value(client):
+    page = client.get(LISTING, params={"sortBy": "rating", "limit": 100}).json()["data"]["colleges"]
+    rating = page[2]["rating"]
+    response = client.get(LISTING, params={"sortBy": "rating", "cursor": encode_cursor("rating:-1", rating, "gone")})
+    assert response.status_code == 200
+    assert all(college["rating"] < rating for college in response.json()["data"]["colleges"])
+
+
+def test_crafted_news_cursor_is_a_bad_request(client):
+    response = client.get("/api/v1/colleges/9008/news", params={"cursor": encode_cursor("date:-1", 20251010, "n2")})
+    assert response.status_code == 400
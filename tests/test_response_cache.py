@@ -0,0 +1,81 @@
+from starlette.requests import Request
+
+from app.core.response_cache import ResponseCache
+from app.schemas.base import BaseResponseSchema
+from app.services import college_service
+from app.services.local_cache import LocalCache
+
+
+def make_request(headers: dict) -> Request:
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+    })
+
+
+def payload() -> BaseResponseSchema:
+    return BaseResponseSchema(success=True, message="ok", data={"a": 1})
+
+
+def test_cached_response_revalidates_to_304():
+    cache = ResponseCache(LocalCache(max_bytes=1024 * 1024, ttl=60))
+    response = cache.put("college:1:ratings", "1700000000000", payload())
+    etag = response.headers["ETag"]
+
+    hit = cache.get("college:1:ratings", "1700000000000")
+    assert hit.body == response.body
+    assert cache.get("college:1:ratings", "1700000000000", make_request({"If-None-Match": etag})).status_code == 304
+    assert cache.get("college:1:ratings", "1700000000001", make_request({"If-None-Match": etag})) is None
+
+
+def test_uncacheable_response_has_no_validators():
+    cache = ResponseCache(LocalCache(max_bytes=1024 * 1024, ttl=60))
+    response = cache.put("college:1:detail:", "1700000000000", payload(), cache=False)
+
+    assert "ETag" not in response.headers
+    assert "Last-Modified" not in response.headers
+    assert response.headers["Cache-Control"] == "no-store"
+    assert cache.get("college:1:detail:", "1700000000000") is None
+
+
+def test_partial_detail_response_is_not_revalidated(client, monkeypatch):
+    def broken(college_id):
+        raise RuntimeError("down")
+
+    monkeypatch.setitem(college_service.COLLEGE_SECTIONS, "college_events", broken)
+    response = client.get("/api/v1/colleges/9005", params={"sections": "events"})
+
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
+    assert response.headers["Cache-Control"] == "no-store"
+
+
+def test_wildcard_matches_only_a_resolved_resource():
+    cache = ResponseCache(LocalCache(max_bytes=1024 * 1024, ttl=60))
+    wildcard = make_request({"If-None-Match": "*"})
+
+    # Nothing cached yet: the resource may not exist, so no early 304
+    assert cache.get("college:2:ratings", "1700000000000", wildcard) is None
+    assert cache.put("college:2:ratings", "1700000000000", payload(), request=wildcard).status_code == 304
+    # Now the cached body shows a current representation exists
+    assert cache.get("college:2:ratings", "1700000000000", wildcard).status_code == 304
+
+
+def test_wildcard_on_an_unknown_college_is_404(client, monkeypatch):
+    from app.core.config import settings
+
+    async def find_college(college_id, requested):
+        return None
+
+    monkeypatch.setattr(settings, "USE_MONGO_COLLEGES", True)
+    monkeypatch.setattr(college_service.CollegeService, "find_college", staticmethod(find_college))
+    response = client.get("/api/v1/colleges/123456789", headers={"If-None-Match": "*"})
+    assert response.status_code == 404
+
+
+def test_wildcard_on_an_existing_college_is_304(client):
+    response = client.get("/api/v1/colleges/9011/ratings", headers={"If-None-Match": "*"})
+    assert response.status_code == 304
+    assert "ETag" in response.headers
@@ -0,0 +1,47 @@
+from fastapi.routing import APIRoute
+
+from utility.utils import route_template
+
+
+def make_scope(route_path, request_path):
+    return {"route": APIRoute(route_path, lambda: None), "path": request_path}
+
+
+def test_prefixes_the_declared_route_path():
+    assert route_template(make_scope("/{id}/ratings", "/api/v1/colleges/42/ratings")) == "/api/v1/colleges/{id}/ratings"
+    assert route_template(make_scope("/", "/api/v1/colleges/")) == "/api/v1/colleges/"
+
+
+def test_routes_declared_on_the_app_keep_their_path():
+    assert route_template(make_scope("/health", "/health")) == "/health"
+    assert route_template(make_scope("/api/v1/colleges/{id}", "/api/v1/colleges/42")) == "/api/v1/colleges/{id}"
+
+
+def test_unrouted_requests_get_the_default():
+    assert route_template({"path": "/nope"}, "unmatched") == "unmatched"
+
+
+def test_metrics_label_requests_by_template(client):
+    client.get("/api/v1/colleges/9007/ratings")
+    body = client.get("/metrics").text
+    assert 'route="/api/v1/colleges/{id}/ratings"' in body
+
+
+
+def test_included_routes_get_the_full_template():
+    """Whichever form the installed FastAPI gives scope["route"].path, the template is the full one"""
+    from fastapi import APIRouter, FastAPI, Request
+    from fastapi.testclient import TestClient
+
+    router = APIRouter()
+
+    @router.get("/{id}/ratings")
+    async def ratings(id: int, request: Request):
+        return {"route": request.scope["route"].path, "template": route_template(request.scope)}
+
+    app = FastAPI()
+    app.include_router(router, prefix="/api/v1/colleges")
+    body = TestClient(app).get("/api/v1/colleges/7/ratings").json()
+
+    assert body["route"] in ("/{id}/ratings", "/api/v1/colleges/{id}/ratings")
+    assert body["template"] == "/api/v1/colleges/{id}/ratings"
@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+
+from app.services import college_service
+from app.services import section_aggregator
+from app.services.section_aggregator import SectionAggregator, SectionNotFound
+
+
+@pytest.mark.anyio
+async def test_failed_sections_are_named_without_exception_details():
+    async def slow():
+        await asyncio.sleep(1)
+
+    def broken():
+        raise RuntimeError("connection refused by db-internal-3:27017")
+
+    result = await SectionAggregator(timeout=0.05).gather({
+        "ok": lambda: {"value": 1},
+        "broken": broken,
+        "slow": slow,
+    })
+
+    assert list(result.data) == ["ok", "broken", "slow"]
+    assert result.data == {"ok": {"value": 1}, "broken": None, "slow": None}
+    assert result.errors == {"broken": "error", "slow": "timeout"}
+
+
+def test_detail_reports_failed_sections_in_header_only(client, monkeypatch):
+    def broken(college_id):
+        raise RuntimeError("connection refused by db-internal-3:27017")
+
+    monkeypatch.setitem(college_service.COLLEGE_SECTIONS, "college_clubs", broken)
+    response = client.get("/api/v1/colleges/9001", params={"sections": "details,clubs"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert set(body["data"]) == {"college_details", "college_clubs"}
+    assert body["data"]["college_clubs"] is None
+    assert "db-internal" not in response.text
+    assert response.headers["X-Failed-Sections"] == "college_clubs"
+
+
+@pytest.mark.anyio
+async def test_missing_entity_is_recorded_without_logging(monkeypatch):
+    logged = []
+    monkeypatch.setattr(section_aggregator.file_logger, "error", lambda *args, **kwargs: logged.append(args))
+
+    def missing():
+        raise SectionNotFound("College not found")
+
+    result = await SectionAggregator().gather({"missing": missing})
+    assert result.errors == {"missing": "not_found"}
+    assert logged == []
@@ -0,0 +1,154 @@
+import asyncio
+
+import pytest
+
+from app.models.college import College
+from app.services.local_cache import LocalCache
+from app.services.section_cache import SectionCache
+
+
+@pytest.fixture
+def cache(fake_redis):
+    return SectionCache(fake_redis, ttl=60, stale_ttl=60, local=LocalCache(max_bytes=1024 * 1024, ttl=60))
+
+
+@pytest.mark.anyio
+async def test_miss_builds_once_and_stores(cache, fake_redis):
+    calls = []
+
+    async def build():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"clubs": ["Robotics"]}
+
+    await cache.confirm_version(1)
+    results = await asyncio.gather(*(cache.get_or_build(1, "college_clubs", build) for _ in range(5)))
+
+    assert results == [{"clubs": ["Robotics"]}] * 5
+    assert calls == [1]
+    assert await fake_redis.exists(cache.key(1, "college_clubs"))
+    assert not await fake_redis.exists(f"lock:{cache.key(1, 'college_clubs')}")
+
+
+@pytest.mark.anyio
+async def test_release_keeps_a_lock_taken_over_by_a_peer(cache, fake_redis):
+    key = cache.key(1, "college_clubs")
+    token = await cache._acquire_lock(key)
+    assert token is not None
+    assert await cache._acquire_lock(key) is None
+
+    # Our lock expired and a peer took it
+    await fake_redis.set(f"lock:{key}", "peer-token")
+    await cache._release_lock(key, token)
+    assert await fake_redis.get(f"lock:{key}") == "peer-token"
+
+    await cache._release_lock(key, "peer-token")
+    assert not await fake_redis.exists(f"lock:{key}")
+
+
+@pytest.mark.anyio
+async def test_rebuild_overlapping_an_invalidation_is_not_stored(cache, fake_redis):
+    await cache.confirm_version(1)
+
+    async def build():
+        # The college is written while its section is being built
+        await cache.invalidate(1)
+        return {"clubs": ["stale"]}
+
+    assert await cache.get_or_build(1, "college_clubs", build) == {"clubs": ["stale"]}
+    assert not await fake_redis.exists(cache.key(1, "college_clubs"))
+    assert cache.local.get(cache.key(1, "college_clubs")) is None
+
+
+@pytest.mark.anyio
+async def test_peer_invalidation_during_rebuild_is_detected_through_the_version(cache, fake_redis):
+    peer = SectionCache(fake_redis, ttl=60, stale_ttl=60)
+    await cache.confirm_version(1)
+
+    async def build():
+        await peer.invalidate(1)
+        return {"clubs": ["stale"]}
+
+    await cache.get_or_build(1, "college_clubs", build)
+    assert not await fake_redis.exists(cache.key(1, "college_clubs"))
+
+
+def test_saving_a_college_clears_the_sections_its_endpoint_serves(client, fake_redis):
+    from app.services.section_cache import section_cache
+
+    assert client.get("/api/v1/colleges/9004", params={"sections": "clubs"}).status_code == 200
+    key = section_cache.key(9004, "college_clubs")
+    assert asyncio.run(fake_redis.exists(key))
+
+    college = College.model_construct(college_id=9004, updated_at=None)
+    asyncio.run(college.invalidate_cached_sections())
+
+    assert not asyncio.run(fake_redis.exists(key))
+    assert section_cache.local.get(key) is None
+
+
+@pytest.mark.anyio
+async def test_every_invalidation_moves_the_version_forward(cache):
+    before = await cache.confirm_version(1)
+    # A write that does not touch updated_at, or sets it to the same instant
+    await cache.invalidate(1)
+    first = await cache.get_version(1)
+    await cache.invalidate(1, updated_at=None)
+    second = await cache.get_version(1)
+
+    assert int(before) < int(first) < int(second)
+
+
+@pytest.mark.anyio
+async def test_fallback_version_moves_forward_without_redis(cache, monkeypatch):
+    monkeypatch.setattr(cache, "_unavailable_until", float("inf"))
+    before = await cache.get_version(1)
+    await cache.invalidate(1)
+    assert int(await cache.get_version(1)) > int(before)
+
+
+def test_write_changes_the_etag(client):
+    from email.utils import parsedate_to_datetime
+
+    first = client.get("/api/v1/colleges/9006/ratings")
+    etag = first.headers["ETag"]
+    version_time = parsedate_to_datetime(first.headers["Last-Modified"])
+
+    # The write keeps an old updated_at, as writes in this codebase do
+    college = College.model_construct(college_id=9006, updated_at=version_time)
+    asyncio.run(college.invalidate_cached_sections())
+
+    second = client.get("/api/v1/colleges/9006/ratings", headers={"If-None-Match": etag})
+    assert second.status_code == 200
+    assert second.headers["ETag"] != etag
+
+
+@pytest.mark.anyio
+async def test_version_is_only_created_once_confirmed(cache, fake_redis):
+    assert await cache.get_version(5) is None
+    assert not await fake_redis.exists(cache.version_key(5))
+
+    version = await cache.confirm_version(5)
+    assert await cache.get_version(5) == version
+    assert 0 < await fake_redis.ttl(cache.version_key(5)) <= cache.version_ttl
+
+
+@pytest.mark.anyio
+async def test_bumped_version_expires(cache, fake_redis):
+    await cache.invalidate(6)
+    assert 0 < await fake_redis.ttl(cache.version_key(6)) <= cache.version_ttl
+
+
+def test_unknown_ids_leave_no_version_keys(client, fake_redis, monkeypatch):
+    from app.core.config import settings
+    from app.services.college_service import CollegeService
+
+    async def find_college(college_id, requested):
+        return None
+
+    monkeypatch.setattr(settings, "USE_MONGO_COLLEGES", True)
+    monkeypatch.setattr(CollegeService, "find_college", staticmethod(find_college))
+    for college_id in (123456789, 1000000000, 1000000001):
+        assert client.get(f"/api/v1/colleges/{college_id}").status_code == 404
+
+    assert asyncio.run(fake_redis.keys("college:*:version")) == []
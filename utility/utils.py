@@ -0,0 +1,87 @@
+import re
+from datetime import datetime, timezone
+from typing import Optional
+
+# Indian amount units as written in fee and package strings
+_INR_UNITS = {
+    "k": 1_000,
+    "thousand": 1_000,
+    "l": 100_000,
+    "lac": 100_000,
+    "lacs": 100_000,
+    "lakh": 100_000,
+    "lakhs": 100_000,
+    "lpa": 100_000,
+    "cr": 10_000_000,
+    "crore": 10_000_000,
+    "crores": 10_000_000,
+    "cpa": 10_000_000,
+    "inr": 1,
+    "rs": 1,
+    "rupees": 1,
+}
+_NUMBER = r"\d[\d,]*(?:\.\d+)?"
+# An amount, an optional range end ("12-15", "12 to 15") and the unit after it
+_INR_AMOUNT = re.compile(rf"({_NUMBER})(?:\s*(?:-|–|to)\s*{_NUMBER})?\s*([a-z]+)?")
+
+
+def current_utc_time() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def route_template(scope, default=None):
+    """
+    Full path template of the route that matched the request, e.g.
+    /api/v1/colleges/{id}. Only available once routing has happened.
+    """
+    route = scope.get("route")
+    template = getattr(route, "path", None)
+    if template is None:
+        return default
+    # FastAPI releases that copy included routes store the full prefixed path
+    # on scope["route"]; newer ones (0.14x) keep the route as declared on its
+    # router, without the include prefix. The prefix is the literal part of the
+    # request path before the segments the route matched, so it is empty in the
+    # first case. Router prefixes here carry no params.
+    if ":path}" in template:
+        return template
+    segments = scope["path"].split("/")
+    prefix = "/".join(segments[:len(segments) - template.count("/")])
+    return prefix + template
+
+
+def parse_inr(value) -> Optional[int]:
+    """
+    Whole rupees from an amount such as "₹2.5 Lakhs", "25 LPA", "1.2 Cr"
+    or "2,50,000". Ranges use their first amount; None when there is none.
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return round(value)
+    match = _INR_AMOUNT.search(str(value).lower())
+    if match is None:
+        return None
+    amount = float(match.group(1).replace(",", ""))
+    return round(amount * _INR_UNITS.get(match.group(2), 1))
+
+
+def parse_inr_strict(value) -> Optional[int]:
+    """
+    parse_inr for amounts submitted through the API: raises ValueError for
+    text with no amount in it, or with a unit parse_inr does not know ("3.5
+    million", "50 per month"), instead of storing a wrong amount or None.
+    Empty means no amount.
+    """
+    if isinstance(value, bool):
+        raise ValueError("Amount must be a number or a string such as '2.5 Lakhs'")
+    if isinstance(value, str):
+        if not value.strip():
+            return None
+        match = _INR_AMOUNT.search(value.lower())
+        if match is not None and match.group(2) is not None and match.group(2) not in _INR_UNITS:
+            raise ValueError(f"Unknown unit {match.group(2)!r} in {value!r}; use k, lakh, LPA or crore")
+    amount = parse_inr(value)
+    if amount is None and value is not None:
+        raise ValueError(f"Could not read an amount from {value!r}")
+    return amount